@@ -0,0 +1 @@
+"""Performance benchmarks for the ushadow backend (not part of the pytest suite)."""
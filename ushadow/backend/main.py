@@ -29,6 +29,8 @@ from src.services.deployment_manager import init_deployment_manager
 from src.services.kubernetes_manager import init_kubernetes_manager
 from src.services.feature_flags import create_feature_flag_service, set_feature_flag_service
 from src.services.mcp_server import setup_mcp_server
+from src.services.docker_executor import get_docker_executor
+from src.services.docker_manager import get_docker_manager
 from src.config.omegaconf_settings import get_settings_store
 
 # Configure logging
@@ -80,6 +82,10 @@ async def lifespan(app: FastAPI):
     logger.info(f"Environment: {env_name}")
     logger.info(f"MongoDB: {mongodb_uri}/{mongodb_database}")
 
+    # Parse the compose catalog off the event loop while the rest starts up
+    from src.services.compose_registry import get_compose_registry
+    compose_warm_up = asyncio.create_task(get_compose_registry().warm_up())
+
     # Initialize feature flags
     feature_flag_service = create_feature_flag_service(
         backend="yaml",
@@ -120,10 +126,25 @@ async def lifespan(app: FastAPI):
     # Start background task for stale u-node checking
     stale_check_task = asyncio.create_task(check_stale_unodes_task())
 
+    # Start container resource telemetry
+    from src.services.container_metrics import get_metrics_collector
+    metrics_collector = get_metrics_collector()
+    metrics_collector.start()
+
+    await compose_warm_up
+    from src.services.compose_watcher import get_compose_watcher
+    compose_watcher = get_compose_watcher()
+    compose_watcher.start()
+    logger.info("✓ Compose catalog loaded")
+
     yield
 
     # Cleanup
     stale_check_task.cancel()
+    await metrics_collector.stop()
+    await compose_watcher.stop()
+    get_docker_manager().shutdown()
+    get_docker_executor().shutdown(wait=False)
     await feature_flag_service.shutdown()
     client.close()
     logger.info("ushadow shutting down...")
@@ -0,0 +1,165 @@
+"""
+Compiled config cache - parsed configuration persisted between restarts.
+
+Parsing the YAML sources (OmegaConf settings, provider catalog, compose
+files) dominates cold start. CompiledCache stores the parsed result of each
+as JSON under config/.cache/, keyed by the content hashes of its source
+files and of the code that produced it. A restart with unchanged sources
+loads each section in one read; any change falls back to a full parse,
+which then refreshes the cache.
+
+config/ is a host mount, so the cache only ever holds plain data: callers
+convert their objects to JSON-compatible values and rebuild them on load,
+and nothing read back from disk is executed. secrets.yaml is never cached,
+but the overrides and compose files can hold literal credentials (e.g. env
+values in service_env_config), so the cache directory is private to the
+backend user: 0700, with 0600 files.
+"""
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Bump when the layout of cached payloads changes
+CACHE_FORMAT_VERSION = 1
+
+CACHE_DIR_NAME = ".cache"
+
+# Set to "0"/"false" to always parse from source
+CACHE_ENABLED = os.environ.get("USHADOW_CONFIG_CACHE", "true").lower() not in ("0", "false", "no")
+
+
+def hash_sources(paths: Iterable[Path]) -> Tuple[str, Tuple[Tuple[str, Optional[bytes]], ...]]:
+    """
+    Read source files and compute a content key over all of them.
+
+    Args:
+        paths: Source files, in a stable order (missing files are allowed)
+
+    Returns:
+        (key, ((path, content or None), ...)) - the contents are returned so
+        callers parse exactly the bytes that were hashed
+    """
+    digest = hashlib.sha256()
+    contents = []
+    for path in paths:
+        try:
+            data = path.read_bytes()
+        except OSError:
+            data = None
+        digest.update(str(path).encode())
+        digest.update(b"\0")
+        digest.update(hashlib.sha256(data).digest() if data is not None else b"-")
+        contents.append((str(path), data))
+    return digest.hexdigest(), tuple(contents)
+
+
+@functools.lru_cache(maxsize=None)
+def _code_fingerprint(modules: Tuple[str, ...]) -> str:
+    """Hash the source of the modules that build a payload, so upgrades miss."""
+    digest = hashlib.sha256(f"{CACHE_FORMAT_VERSION}:{sys.version_info[:2]}".encode())
+    for name in modules:
+        module = sys.modules.get(name)
+        path = getattr(module, "__file__", None)
+        try:
+            digest.update(Path(path).read_bytes() if path else name.encode())
+        except OSError:
+            digest.update(name.encode())
+    return digest.hexdigest()
+
+
+class CompiledCache:
+    """
+    Per-section JSON cache of parsed config.
+
+    Payloads must be built from dicts, lists, strings, numbers, booleans
+    and None. A payload that doesn't survive a JSON round trip unchanged
+    (tuples, non-string keys, dates...) is not stored.
+
+    Usage:
+        cache = CompiledCache(config_dir / ".cache")
+        key, contents = hash_sources(paths)
+        payload = cache.load("providers", key, modules=[__name__])
+        if payload is None:
+            providers = parse(contents)
+            cache.store("providers", key, to_json(providers), modules=[__name__])
+        else:
+            providers = from_json(payload)
+    """
+
+    def __init__(self, cache_dir: Path, enabled: bool = CACHE_ENABLED):
+        self.cache_dir = Path(cache_dir)
+        self.enabled = enabled
+
+    def _path(self, section: str) -> Path:
+        return self.cache_dir / f"{section}.json"
+
+    def load(self, section: str, key: str, modules: Iterable[str] = ()) -> Optional[Any]:
+        """
+        Load a section's payload if it was compiled from the same sources and code.
+
+        Returns:
+            The cached payload, or None on a miss or unreadable cache
+        """
+        if not self.enabled:
+            return None
+
+        path = self._path(section)
+        try:
+            with open(path, "rb") as f:
+                stored = json.load(f)
+            stored_key, payload = stored["key"], stored["payload"]
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable config cache {path}: {e}")
+            return None
+
+        if stored_key != [key, _code_fingerprint(tuple(modules))]:
+            return None
+        logger.debug(f"Config cache hit: {section}")
+        return payload
+
+    def store(self, section: str, key: str, payload: Any, modules: Iterable[str] = ()) -> None:
+        """Write a section's payload atomically. Failures are logged, never raised."""
+        if not self.enabled:
+            return
+
+        path = self._path(section)
+        try:
+            self.cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            data = json.dumps(
+                {"key": [key, _code_fingerprint(tuple(modules))], "payload": payload},
+                separators=(",", ":"),
+            )
+            if json.loads(data)["payload"] != payload:
+                logger.debug(f"Not caching {section}: payload is not plain JSON data")
+                return
+            # mkstemp creates the file 0600
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=f".{section}.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            logger.debug(f"Could not write config cache {path}: {e}")
+
+    def clear(self, section: Optional[str] = None) -> None:
+        """Remove one section's cache file, or all of them."""
+        paths = [self._path(section)] if section else self.cache_dir.glob("*.json")
+        for path in paths:
+            try:
+                path.unlink()
+            except OSError:
+                pass
@@ -9,15 +9,27 @@ Manages application settings using OmegaConf for:
 - Environment variable mapping and suggestions
 """
 
+import asyncio
+import errno
+import inspect
 import logging
 import os
+import stat
+import tempfile
+import threading
 import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Optional, List, Tuple, Dict
+from types import MappingProxyType
+from typing import (
+    Any, AsyncIterator, Awaitable, Callable, Iterable, Mapping, Optional, List, Set, Tuple, Dict,
+)
 
-from omegaconf import OmegaConf, DictConfig
+from omegaconf import OmegaConf, DictConfig, ListConfig
 
+from src.config.compiled_cache import CACHE_DIR_NAME, CompiledCache, hash_sources
 from src.config.secrets import SENSITIVE_PATTERNS, is_secret_key, mask_value
 from src.services.provider_registry import get_provider_registry
 
@@ -38,6 +50,7 @@ def _env_resolver(env_var_name: str, _root_: DictConfig) -> Optional[str]:
 
     Usage in YAML: ${env:MEMORY_SERVER_URL}
     Usage in code: settings.get_by_env_var("MEMORY_SERVER_URL")
+                   (answered from EnvVarIndex, which applies the same rules)
     """
     key = env_var_name.lower()
 
@@ -79,6 +92,176 @@ if not OmegaConf.has_resolver("merge_csv"):
     )
 
 
+# =============================================================================
+# Env Var Index
+# =============================================================================
+
+def _normalize_env_path(name: str) -> str:
+    """OPENAI_API_KEY / api_keys.openai_api_key -> dot-separated lowercase."""
+    return name.lower().replace('_', '.')
+
+
+class EnvVarIndex:
+    """
+    Env var name -> setting path lookups, precomputed from one merged config.
+
+    Built once per (settings generation, provider registry generation) so
+    every env var lookup is a dict probe instead of a scan of the config:
+
+    - resolver: same answers as _env_resolver (section.key split, then
+      exact key in any top-level section)
+    - provider: env var -> settings path from provider env_maps
+    - fuzzy: normalized path suffix -> matches per section (same rules as
+      env_var_matches_setting)
+    """
+
+    def __init__(self, config: DictConfig, provider_mapping: Mapping[str, str], key: Tuple):
+        self.key = key
+        self._resolver: Dict[str, str] = {}
+        self._provider: Dict[str, Tuple[str, Any]] = {}
+        self._fuzzy: Dict[str, Dict[str, List[Tuple[str, Any]]]] = {}
+
+        split_matches: Dict[str, str] = {}
+        for section_name in config:
+            try:
+                section = config.get(section_name)
+            except Exception as e:
+                logger.debug(f"EnvVarIndex: cannot resolve section {section_name}: {e}")
+                continue
+            if not isinstance(section, DictConfig):
+                continue
+
+            for key_name in section:
+                try:
+                    value = section.get(key_name)
+                except Exception as e:
+                    logger.debug(f"EnvVarIndex: cannot resolve {section_name}.{key_name}: {e}")
+                    continue
+                if value is None or isinstance(value, DictConfig):
+                    continue
+                key_name = str(key_name)
+                path = f"{section_name}.{key_name}"
+
+                # Resolver strategy 1: first underscore splits section from key
+                if '_' not in str(section_name):
+                    split_matches.setdefault(f"{section_name}_{key_name}".lower(), str(value))
+                # Resolver strategy 2: exact key, first section wins
+                self._resolver.setdefault(key_name.lower(), str(value))
+
+                # Fuzzy: every dot-suffix of the normalized path
+                parts = _normalize_env_path(path).split('.')
+                for i in range(len(parts)):
+                    by_section = self._fuzzy.setdefault('.'.join(parts[i:]), {})
+                    matches = by_section.setdefault(str(section_name), [])
+                    if not matches or matches[-1][0] != path:
+                        matches.append((path, value))
+
+        # Strategy 1 takes precedence over strategy 2
+        self._resolver.update(split_matches)
+
+        for env_var, settings_path in provider_mapping.items():
+            try:
+                value = OmegaConf.select(config, settings_path, default=None)
+            except Exception:
+                value = None
+            self._provider[env_var] = (settings_path, value)
+
+    def resolve(self, env_var_name: str) -> Optional[str]:
+        """Value for an env var by config tree search (see _env_resolver)."""
+        return self._resolver.get(env_var_name.lower())
+
+    def provider_setting(self, env_var_name: str) -> Optional[Tuple[str, Any]]:
+        """(settings_path, value) from provider env_maps, if mapped."""
+        return self._provider.get(env_var_name)
+
+    def fuzzy_matches(self, env_var_name: str, sections: List[str]) -> List[Tuple[str, Any]]:
+        """(path, value) of settings matching an env var, in section order."""
+        by_section = self._fuzzy.get(_normalize_env_path(env_var_name), {})
+        return [match for section in sections for match in by_section.get(section, [])]
+
+
+# =============================================================================
+# Settings Snapshot
+# =============================================================================
+
+_MISSING = object()
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively make a plain container read-only (dict -> mapping proxy, list -> tuple)."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+class SettingsSnapshot:
+    """
+    Immutable, fully resolved view of the merged settings for one generation.
+
+    Interpolations are resolved once when the snapshot is built, so reads
+    are plain dict walks. Use it when reading several settings that should
+    be consistent with each other.
+
+    Usage:
+        snapshot = await settings.snapshot()
+        provider = snapshot.get("selected_providers.llm", "openai")
+    """
+
+    def __init__(self, config: DictConfig, generation: int):
+        self.generation = generation
+        self._config = config
+        try:
+            self._data: Optional[Mapping] = _freeze(OmegaConf.to_container(config, resolve=True))
+        except Exception as e:
+            # A broken interpolation shouldn't break unrelated reads - resolve per path instead
+            logger.warning(f"Settings snapshot could not resolve all values: {e}")
+            self._data = None
+
+    def get(self, key_path: str, default: Any = None) -> Any:
+        """
+        Get a value by dot-notation path (same semantics as SettingsStore.get).
+
+        Sections are returned as read-only mappings, lists as tuples.
+        """
+        if self._data is None:
+            return _freeze(_to_plain(OmegaConf.select(self._config, key_path, default=default)))
+
+        node: Any = self._data
+        for part in key_path.split('.'):
+            if isinstance(node, Mapping):
+                node = node.get(part, _MISSING)
+            elif isinstance(node, tuple) and part.isdigit() and int(part) < len(node):
+                node = node[int(part)]
+            else:
+                node = _MISSING
+            if node is _MISSING:
+                return default
+        return node
+
+    def get_many(self, key_paths: Iterable[str], default: Any = None) -> Dict[str, Any]:
+        """Get several values by path."""
+        return {path: self.get(path, default) for path in key_paths}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Mutable deep copy of the whole resolved config."""
+        if self._data is None:
+            return OmegaConf.to_container(self._config, resolve=False)
+        return _to_plain(self._data)
+
+
+def _to_plain(value: Any) -> Any:
+    """Convert DictConfig/ListConfig/frozen containers to plain dicts and lists."""
+    if isinstance(value, (DictConfig, ListConfig)):
+        return OmegaConf.to_container(value, resolve=True)
+    if isinstance(value, Mapping):
+        return {k: _to_plain(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_to_plain(v) for v in value]
+    return value
+
+
 # =============================================================================
 # Setting Suggestion Model
 # =============================================================================
@@ -116,6 +299,38 @@ SECRET_PATTERNS = SENSITIVE_PATTERNS
 # Patterns that indicate a URL value
 URL_PATTERNS = ['url', 'endpoint', 'host', 'uri']
 
+# Files modified this close to a load may change again without a visible
+# mtime change (coarse filesystem timestamps), so the cache isn't trusted yet
+RACY_WINDOW_NS = 2_000_000_000
+
+# Updates arriving within this many seconds are written together
+WRITE_COALESCE_WINDOW = 0.01
+
+# Settings change listener: called with the changed key paths
+SettingsListener = Callable[[Set[str]], Optional[Awaitable[None]]]
+_Subscription = Tuple[str, SettingsListener, Optional[asyncio.AbstractEventLoop]]
+
+
+def _flatten_paths(data: Any, prefix: str = "") -> Dict[str, Any]:
+    """Flatten nested dicts to {dot.path: leaf value} (lists are leaves)."""
+    if not isinstance(data, dict):
+        return {prefix: data} if prefix else {}
+    flat: Dict[str, Any] = {}
+    for key, value in data.items():
+        path = f"{prefix}.{key}" if prefix else str(key)
+        if isinstance(value, dict) and value:
+            flat.update(_flatten_paths(value, path))
+        else:
+            flat[path] = value
+    return flat
+
+
+def _path_matches(path: str, prefix: str) -> bool:
+    """True if path is at, under, or above prefix."""
+    if not prefix or path == prefix:
+        return True
+    return path.startswith(prefix + ".") or prefix.startswith(path + ".")
+
 # Sections to search for different setting types
 SETTING_SECTIONS = {
     'secret': ['api_keys', 'security', 'admin'],
@@ -183,6 +398,133 @@ def env_var_matches_setting(env_name: str, setting_path: str) -> bool:
     return path_normalized == env_normalized or path_normalized.endswith('.' + env_normalized)
 
 
+# =============================================================================
+# Suggestion Engine
+# =============================================================================
+
+class SuggestionEngine:
+    """
+    Memoized env var -> setting suggestions for one settings/provider generation.
+
+    Section candidates (per setting type) and provider env_map candidates
+    (per capability) are computed once and shared across env vars and
+    services. Returned SettingSuggestion objects are shared - don't mutate.
+    """
+
+    def __init__(self, settings: "SettingsSnapshot", provider_registry, key: Tuple):
+        self.key = key
+        self._settings = settings
+        self._provider_registry = provider_registry
+        self._by_type: Dict[str, List[SettingSuggestion]] = {}
+        self._by_capability: Dict[str, Dict[str, List[SettingSuggestion]]] = {}
+
+    def section_candidates(self, setting_type: str) -> List[SettingSuggestion]:
+        """Settings in the sections searched for a setting type (deduplicated, in order)."""
+        if setting_type in self._by_type:
+            return self._by_type[setting_type]
+
+        candidates = []
+        seen_paths = set()
+        for section in SETTING_SECTIONS.get(setting_type, ['api_keys', 'security']):
+            section_data = self._settings.get(section, {})
+            if not isinstance(section_data, Mapping):
+                continue
+
+            for key, value in section_data.items():
+                if value is None or isinstance(value, Mapping):
+                    continue
+
+                path = f"{section}.{key}"
+                if path in seen_paths:
+                    continue
+                seen_paths.add(path)
+
+                str_value = str(value)
+                has_value = bool(str_value.strip())
+                candidates.append(SettingSuggestion(
+                    path=path,
+                    label=key.replace("_", " ").title(),
+                    has_value=has_value,
+                    value=mask_secret_value(str_value, path) if has_value else None,
+                ))
+
+        self._by_type[setting_type] = candidates
+        return candidates
+
+    def provider_candidates(self, capability: str) -> Dict[str, List[SettingSuggestion]]:
+        """env_map key -> suggestions from the provider selected for a capability."""
+        if capability in self._by_capability:
+            return self._by_capability[capability]
+
+        by_key: Dict[str, List[SettingSuggestion]] = {}
+        selected_id = self._settings.get(f"selected_providers.{capability}")
+        if not selected_id:
+            selected_id = self._provider_registry.get_default_provider_id(capability, 'cloud')
+
+        provider = self._provider_registry.get_provider(selected_id) if selected_id else None
+        if provider:
+            for env_map in provider.env_maps:
+                if not env_map.settings_path:
+                    continue
+                value = self._settings.get(env_map.settings_path)
+                str_value = str(value) if value is not None else ""
+                has_value = bool(str_value.strip())
+
+                by_key.setdefault(env_map.key, []).append(SettingSuggestion(
+                    path=env_map.settings_path,
+                    label=f"{provider.name}: {env_map.label or env_map.key}",
+                    has_value=has_value,
+                    value=mask_secret_value(str_value, env_map.settings_path) if has_value else None,
+                    capability=capability,
+                    provider_name=provider.name,
+                ))
+
+        self._by_capability[capability] = by_key
+        return by_key
+
+    def suggestions_for(
+        self,
+        env_var_name: str,
+        capabilities: Optional[List[str]] = None,
+    ) -> List[SettingSuggestion]:
+        """Suggestions for an env var: section settings first, then provider mappings."""
+        suggestions = list(self.section_candidates(infer_setting_type(env_var_name)))
+
+        if capabilities:
+            seen_paths = {s.path for s in suggestions}
+            for capability in capabilities:
+                for suggestion in self.provider_candidates(capability).get(env_var_name, []):
+                    if suggestion.path in seen_paths:
+                        continue
+                    seen_paths.add(suggestion.path)
+                    suggestions.append(suggestion)
+
+        return suggestions
+
+
+@dataclass(frozen=True)
+class _LoadedSettings:
+    """
+    One complete load of the merged settings.
+
+    Never modified once built (the config is read-only). The store replaces
+    it wholesale, so a reader holding a reference always sees one consistent
+    tree, even while a write or reload is in progress.
+    """
+
+    config: DictConfig
+    signature: Tuple  # Source stat signature at load time
+    racy: bool  # A source was modified within RACY_WINDOW_NS of the load
+
+
+@dataclass
+class _WriteBatch:
+    """Writes queued by one task's batch() until it exits."""
+
+    pending: Dict[Path, List[dict]] = field(default_factory=dict)
+    open: bool = True  # Cleared on exit; tasks spawned inside then write directly
+
+
 class SettingsStore:
     """
     Manages settings with OmegaConf for automatic merging and interpolation.
@@ -214,18 +556,198 @@ class SettingsStore:
         self.secrets_path = self.config_dir / "secrets.yaml"
         self.overrides_path = self.config_dir / "config.overrides.yaml"
 
-        self._cache: Optional[DictConfig] = None
-        self._cache_timestamp: float = 0
-        # Disable cache in dev mode for faster iteration
+        # Merged tree persisted across restarts, keyed by source file hashes
+        self._compiled = CompiledCache(self.config_dir / CACHE_DIR_NAME)
+
+        # Current merged config, reused until a source file changes on disk or
+        # the store writes to one. Staleness is detected from file stats, so
+        # steady-state reads never re-parse YAML. Reloads and writes build the
+        # next state off to the side and swap this single reference.
+        self._state: Optional[_LoadedSettings] = None
+        self._last_stat_check: float = 0
+        # Single-flight reloads: one caller rebuilds, the others reuse its result
+        self._reload_lock = threading.Lock()
+        # Check file stats on every read in dev mode, at most once a second otherwise
         dev_mode = os.environ.get("DEV_MODE", "").lower() in ("true", "1", "yes")
-        self.cache_ttl: int = 0 if dev_mode else 5  # seconds
+        self.stat_interval: float = 0 if dev_mode else 1.0  # seconds
+
+        # Bumped whenever the merged settings may have changed (writes, or
+        # source files changing on disk). Consumers key derived caches on it.
+        self._generation: int = 0
+        self._env_index: Optional[EnvVarIndex] = None
+        self._snapshot: Optional[SettingsSnapshot] = None
+        self._suggestion_engine: Optional[SuggestionEngine] = None
+
+        # Write pipeline: updates queued per file, flushed together
+        self.write_coalesce_window: float = WRITE_COALESCE_WINDOW
+        self._write_lock = asyncio.Lock()
+        self._pending_writes: Dict[Path, List[dict]] = {}
+        self._pending_flush: Optional[asyncio.Future] = None
+        # The open batch() of the current task, if any - other tasks keep flushing
+        self._batch: ContextVar[Optional[_WriteBatch]] = ContextVar(
+            f"settings_batch_{id(self)}", default=None
+        )
+
+        # Change notifications: (prefix, callback, subscriber's loop) and the
+        # last published leaf values with the generation they came from
+        self._subscribers: List[_Subscription] = []
+        self._published: Optional[Dict[str, Any]] = None
+        self._published_generation = 0
+        self._publish_lock = threading.RLock()
+        self._listener_tasks: Set[asyncio.Task] = set()
+
+    @property
+    def generation(self) -> int:
+        """Settings generation counter (see __init__)."""
+        return self._generation
 
     def clear_cache(self) -> None:
-        """Clear the configuration cache, forcing reload on next access."""
-        self._cache = None
-        self._cache_timestamp = 0
+        """Reload the configuration from disk now."""
+        self._reload(force=True)
         logger.info("OmegaConfSettings cache cleared")
 
+    def _get_source_signature(self) -> Tuple:
+        """Stat signature (inode, mtime_ns, size) of each source file, None if missing."""
+        signature = []
+        for path in [self.defaults_path, self.secrets_path, self.overrides_path]:
+            try:
+                file_stat = path.stat()
+                signature.append((file_stat.st_ino, file_stat.st_mtime_ns, file_stat.st_size))
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+
+    def _is_fresh(self, state: Optional[_LoadedSettings]) -> bool:
+        """True if a loaded state still matches the files on disk."""
+        if state is None:
+            return False
+
+        now = time.monotonic()
+        if now - self._last_stat_check < self.stat_interval:
+            return True
+        self._last_stat_check = now
+
+        # A file modified in the same timestamp tick as the load may have changed
+        # again without changing its stat - don't trust the state until it ages
+        return not state.racy and self._get_source_signature() == state.signature
+
+    def _current(self, use_cache: bool = True) -> _LoadedSettings:
+        """The current state, reloading first if the source files changed."""
+        state = self._state
+        if use_cache and self._is_fresh(state):
+            return state
+        logger.debug("Loading configuration from all sources...")
+        return self._reload(stale=state, force=not use_cache)
+
+    def _merge_sources(self) -> DictConfig:
+        """
+        Load and merge all source files.
+
+        Reuses the parsed defaults and overrides from a previous run when
+        their contents are unchanged, instead of re-parsing the YAML.
+        secrets.yaml is always read from source and never cached.
+        """
+        key, contents = hash_sources([self.defaults_path, self.overrides_path])
+        cached = self._compiled.load("settings", key, modules=[__name__])
+        if cached is not None:
+            defaults, overrides = (None if c is None else OmegaConf.create(c) for c in cached)
+        else:
+            defaults, overrides = (self._parse_source(path, data) for path, data in contents)
+            # Don't persist a parse that skipped a broken file - keep logging the error
+            if all(data is None or cfg is not None for (_, data), cfg in zip(contents, (defaults, overrides))):
+                self._compiled.store(
+                    "settings",
+                    key,
+                    [None if cfg is None else OmegaConf.to_container(cfg) for cfg in (defaults, overrides)],
+                    modules=[__name__],
+                )
+        secrets = self._load_yaml_if_exists(self.secrets_path)
+
+        # Merge in order (later overrides earlier)
+        configs = [cfg for cfg in (defaults, secrets, overrides) if cfg]
+        return OmegaConf.merge(*configs) if configs else OmegaConf.create({})
+
+    @staticmethod
+    def _parse_source(path: str, data: Optional[bytes]) -> Optional[DictConfig]:
+        """Parse one source file's contents, None if missing or invalid."""
+        if data is None:
+            return None
+        try:
+            cfg = OmegaConf.create(data.decode("utf-8"))
+        except Exception as e:
+            logger.error(f"Error loading {path}: {e}")
+            return None
+        logger.debug(f"Loaded {path}")
+        return cfg
+
+    def _reload(self, stale: Optional[_LoadedSettings] = None, force: bool = False) -> _LoadedSettings:
+        """
+        Load and merge all sources into a new state and swap it in.
+
+        Single-flight: callers that found the same stale state queue on the
+        lock, and all but the first reuse the state it built. On the event
+        loop the rebuild has no await points, so concurrent tasks can't
+        interleave with it; the lock covers threaded callers (sync endpoints,
+        executor threads using get_sync).
+
+        Args:
+            stale: The state the caller found out of date
+            force: Rebuild even if another caller already replaced stale
+                   (after our own writes, or an explicit reload)
+
+        Returns:
+            The new current state
+        """
+        with self._reload_lock:
+            current = self._state
+            if not force and current is not None and current is not stale:
+                return current
+
+            loaded_at_ns = time.time_ns()
+            signature = self._get_source_signature()
+            merged = self._merge_sources()
+
+            # Same stats can hide different content for a racy or forced reload
+            changed = current is None or signature != current.signature
+            if not changed and (current.racy or force):
+                try:
+                    changed = merged != current.config
+                except Exception:
+                    changed = True
+
+            if changed:
+                OmegaConf.set_readonly(merged, True)
+                self._generation += 1
+            else:
+                # Keep the existing tree so caches keyed on it stay valid
+                merged = current.config
+
+            state = _LoadedSettings(
+                config=merged,
+                signature=signature,
+                racy=any(
+                    entry is not None and entry[1] >= loaded_at_ns - RACY_WINDOW_NS
+                    for entry in signature
+                ),
+            )
+            self._state = state
+            self._last_stat_check = time.monotonic()
+            generation = self._generation
+
+        if changed:
+            self._publish(merged, generation)
+        return state
+
+    def _get_env_index(self, config: DictConfig) -> EnvVarIndex:
+        """Env var index for the current settings and provider generations."""
+        provider_registry = get_provider_registry()
+        key = (self._generation, provider_registry.generation)
+        if self._env_index is None or self._env_index.key != key:
+            self._env_index = EnvVarIndex(
+                config, provider_registry.get_env_to_settings_mapping(), key
+            )
+        return self._env_index
+
     def _load_yaml_if_exists(self, path: Path) -> Optional[DictConfig]:
         """Load a YAML file if it exists, return None otherwise."""
         if path.exists():
@@ -245,38 +767,9 @@ class SettingsStore:
         3. config.overrides.yaml - User modifications (gitignored)
 
         Returns:
-            OmegaConf DictConfig with all values merged
+            Read-only OmegaConf DictConfig with all values merged
         """
-        # Check cache
-        if use_cache and self._cache is not None:
-            if time.time() - self._cache_timestamp < self.cache_ttl:
-                return self._cache
-
-        logger.debug("Loading configuration from all sources...")
-
-        # Load and merge in order (later overrides earlier)
-        configs = []
-
-        if cfg := self._load_yaml_if_exists(self.defaults_path):
-            configs.append(cfg)
-            logger.debug(f"Loaded defaults from {self.defaults_path}")
-
-        if cfg := self._load_yaml_if_exists(self.secrets_path):
-            configs.append(cfg)
-            logger.debug(f"Loaded secrets from {self.secrets_path}")
-
-        if cfg := self._load_yaml_if_exists(self.overrides_path):
-            configs.append(cfg)
-            logger.debug(f"Loaded overrides from {self.overrides_path}")
-
-        # Merge all configs
-        merged = OmegaConf.merge(*configs) if configs else OmegaConf.create({})
-
-        # Update cache
-        self._cache = merged
-        self._cache_timestamp = time.time()
-
-        return merged
+        return self._current(use_cache).config
 
     async def get(self, key_path: str, default: Any = None) -> Any:
         """
@@ -293,6 +786,33 @@ class SettingsStore:
         value = OmegaConf.select(config, key_path, default=default)
         return value
 
+    async def snapshot(self) -> SettingsSnapshot:
+        """
+        Get an immutable, fully resolved view of the current settings.
+
+        Built once per generation; use it (or get_many) instead of several
+        get() calls when reading a group of related settings.
+        """
+        config = self._current().config
+        snapshot = self._snapshot
+        if snapshot is None or snapshot._config is not config:
+            snapshot = SettingsSnapshot(config, self._generation)
+            self._snapshot = snapshot
+        return snapshot
+
+    async def get_many(self, key_paths: Iterable[str], default: Any = None) -> Dict[str, Any]:
+        """
+        Get several values by dot-notation path from one consistent snapshot.
+
+        Args:
+            key_paths: Paths to read
+            default: Default for paths that are not set
+
+        Returns:
+            Dict of path -> value
+        """
+        return (await self.snapshot()).get_many(key_paths, default)
+
     def get_sync(self, key_path: str, default: Any = None) -> Any:
         """
         Sync version of get() for module-level initialization.
@@ -300,15 +820,7 @@ class SettingsStore:
         Use this when you need config values at import time (e.g., SECRET_KEY).
         For async contexts, prefer the async get() method.
         """
-        if self._cache is None:
-            # Force sync load - _load_yaml_if_exists is already sync
-            configs = []
-            for path in [self.defaults_path, self.secrets_path, self.overrides_path]:
-                if cfg := self._load_yaml_if_exists(path):
-                    configs.append(cfg)
-            self._cache = OmegaConf.merge(*configs) if configs else OmegaConf.create({})
-            self._cache_timestamp = time.time()
-        return OmegaConf.select(self._cache, key_path, default=default)
+        return OmegaConf.select(self._current().config, key_path, default=default)
 
     async def get_by_env_var(self, env_var_name: str, default: Any = None) -> Any:
         """
@@ -332,33 +844,281 @@ class SettingsStore:
             Resolved value or default
         """
         config = await self.load_config()
-        value = _env_resolver(env_var_name, config)
+        value = self._get_env_index(config).resolve(env_var_name)
         return value if value is not None else default
 
     def get_by_env_var_sync(self, env_var_name: str, default: Any = None) -> Any:
         """Sync version of get_by_env_var for module-level initialization."""
-        if self._cache is None:
-            configs = []
-            for path in [self.defaults_path, self.secrets_path, self.overrides_path]:
-                if cfg := self._load_yaml_if_exists(path):
-                    configs.append(cfg)
-            self._cache = OmegaConf.merge(*configs) if configs else OmegaConf.create({})
-            self._cache_timestamp = time.time()
-        value = _env_resolver(env_var_name, self._cache)
+        value = self._get_env_index(self._current().config).resolve(env_var_name)
         return value if value is not None else default
 
-    def _save_to_file(self, file_path: Path, updates: dict) -> None:
-        """Internal helper to save updates to a specific file."""
+    def _save_to_file(self, file_path: Path, *updates: dict) -> None:
+        """Apply one or more update dicts to a file in a single read-modify-write."""
         current = self._load_yaml_if_exists(file_path) or OmegaConf.create({})
 
-        for key, value in updates.items():
-            if '.' in key and not isinstance(value, dict):
-                OmegaConf.update(current, key, value)
-            else:
-                OmegaConf.update(current, key, value, merge=True)
+        keys = []
+        for batch in updates:
+            for key, value in batch.items():
+                if '.' in key and not isinstance(value, dict):
+                    OmegaConf.update(current, key, value)
+                else:
+                    OmegaConf.update(current, key, value, merge=True)
+                keys.append(key)
+
+        self._write_atomic(file_path, OmegaConf.to_yaml(current))
+        logger.info(f"Saved to {file_path}: {keys}")
+
+    def _write_atomic(self, file_path: Path, content: str) -> None:
+        """
+        Replace a file's content atomically (temp file + fsync + rename).
 
-        OmegaConf.save(current, file_path)
-        logger.info(f"Saved to {file_path}: {list(updates.keys())}")
+        Readers see either the old or the new file, never a partial write.
+        """
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            mode = stat.S_IMODE(file_path.stat().st_mode)
+        except OSError:
+            mode = 0o600 if file_path == self.secrets_path else 0o644
+
+        fd, tmp_name = tempfile.mkstemp(dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            os.chmod(tmp_name, mode)
+            try:
+                os.replace(tmp_name, file_path)
+            except OSError as e:
+                if e.errno not in (errno.EBUSY, errno.EXDEV):
+                    raise
+                # The file itself is a bind mount - it can't be replaced, only rewritten
+                logger.debug(f"Cannot rename over {file_path} ({e}), writing in place")
+                file_path.write_text(content)
+                os.unlink(tmp_name)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+
+        # Persist the rename itself
+        try:
+            dir_fd = os.open(file_path.parent, os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+        except OSError:
+            pass
+
+    # =========================================================================
+    # Write Coalescing
+    # =========================================================================
+
+    def _current_batch(self) -> Optional["_WriteBatch"]:
+        batch = self._batch.get()
+        return batch if batch is not None and batch.open else None
+
+    def _enqueue_write(self, file_path: Path, updates: dict) -> None:
+        """Queue updates for a file; applied by the next flush (or batch exit)."""
+        batch = self._current_batch()
+        pending = batch.pending if batch is not None else self._pending_writes
+        pending.setdefault(file_path, []).append(updates)
+
+    async def _flush_writes(self, files: Iterable[Path]) -> None:
+        """
+        Wait until queued updates are on disk.
+
+        Updates queued within write_coalesce_window of each other share one
+        read-modify-write per file and one generation bump. Inside the
+        calling task's batch() this returns immediately; the batch flushes
+        on exit.
+
+        Args:
+            files: The files the caller queued updates for
+
+        Raises:
+            The error from saving one of those files; failures of other
+            files in the same flush are left to their own callers
+        """
+        if self._current_batch() is not None:
+            return
+        flush = self._pending_flush
+        if flush is None:
+            flush = self._pending_flush = asyncio.ensure_future(self._flush_after_window())
+        # Shield: one cancelled caller must not cancel the write for everyone
+        errors = await asyncio.shield(flush)
+        for file_path in files:
+            if file_path in errors:
+                raise errors[file_path]
+
+    async def _flush_after_window(self) -> Dict[Path, Exception]:
+        """Write every queued file, each on its own; returns the errors by file."""
+        await asyncio.sleep(self.write_coalesce_window)
+        async with self._write_lock:
+            # Later writes start a new batch, which waits for this one
+            self._pending_flush = None
+            pending, self._pending_writes = self._pending_writes, {}
+            errors: Dict[Path, Exception] = {}
+            if not pending:
+                return errors
+            try:
+                for file_path, updates in pending.items():
+                    try:
+                        self._save_to_file(file_path, *updates)
+                    except Exception as e:
+                        logger.error(f"Failed to save {file_path}: {e}")
+                        errors[file_path] = e
+            finally:
+                # Readers keep the previous state until the new one is swapped in
+                self._reload(force=True)
+            return errors
+
+    # =========================================================================
+    # Change Notifications
+    # =========================================================================
+
+    def subscribe(self, prefix: str, callback: SettingsListener) -> Callable[[], None]:
+        """
+        Get notified when settings under a key path change.
+
+        Fires after a successful write through the store, or when a change
+        to the config files is detected on the next read. The callback gets
+        the set of changed leaf paths under prefix; it may be sync or async.
+        Changes are often noticed on a worker thread, so when subscribe() is
+        called from a running loop the callback is always run on that loop.
+
+        Args:
+            prefix: Dot-notation path prefix ("" for everything),
+                    e.g. "security.cors_origins" or "selected_providers"
+            callback: Called with the changed key paths
+
+        Returns:
+            Function that removes the subscription
+        """
+        try:
+            loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        subscription = (prefix, callback, loop)
+        with self._publish_lock:
+            self._subscribers.append(subscription)
+            state = self._state
+            if self._published is None and state is not None:
+                self._published = self._flatten(state.config)
+                self._published_generation = self._generation
+
+        def unsubscribe() -> None:
+            with self._publish_lock:
+                if subscription in self._subscribers:
+                    self._subscribers.remove(subscription)
+
+        return unsubscribe
+
+    @staticmethod
+    def _flatten(config: DictConfig) -> Optional[Dict[str, Any]]:
+        try:
+            return _flatten_paths(OmegaConf.to_container(config, resolve=False))
+        except Exception as e:
+            logger.warning(f"Could not compute settings changes: {e}")
+            return None
+
+    def _publish(self, merged: DictConfig, generation: int) -> None:
+        """Diff the new config against the last published one and notify subscribers."""
+        with self._publish_lock:
+            if not self._subscribers:
+                # Nobody to diff for - subscribe() takes a fresh baseline
+                self._published = None
+                return
+            if generation <= self._published_generation:
+                # A newer reload on another thread already published
+                return
+            view = self._flatten(merged)
+            if view is None:
+                return
+
+            previous = self._published
+            if previous is not None:
+                changed = {
+                    path for path in previous.keys() | view.keys()
+                    if previous.get(path, _MISSING) != view.get(path, _MISSING)
+                }
+                if changed:
+                    logger.debug(f"Settings changed: {sorted(changed)}")
+                    self._notify(changed)
+            # Only once delivery is scheduled, so a failure can't lose the change
+            self._published = view
+            self._published_generation = generation
+
+    def _notify(self, changed: Set[str]) -> None:
+        """Hand each matching subscriber its changed paths on its own loop."""
+        try:
+            running: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        for subscription in list(self._subscribers):
+            prefix, _, loop = subscription
+            matched = {path for path in changed if _path_matches(path, prefix)}
+            if not matched:
+                continue
+            if loop is None or loop is running:
+                self._deliver(subscription, matched)
+                continue
+            try:
+                loop.call_soon_threadsafe(self._deliver, subscription, matched)
+            except RuntimeError:
+                # The subscriber's loop is closed
+                logger.debug(f"Event loop for settings listener on '{prefix}' is closed")
+
+    def _deliver(self, subscription: _Subscription, changed: Set[str]) -> None:
+        prefix, callback, _ = subscription
+        if subscription not in self._subscribers:
+            # Unsubscribed while the notification was queued
+            return
+        try:
+            result = callback(changed)
+            if inspect.isawaitable(result):
+                try:
+                    task = asyncio.get_running_loop().create_task(result)
+                except RuntimeError:
+                    logger.debug(f"No running loop for settings listener on '{prefix}'")
+                    result.close()
+                    return
+                self._listener_tasks.add(task)
+                task.add_done_callback(self._listener_tasks.discard)
+        except Exception as e:
+            logger.error(f"Settings listener for '{prefix}' failed: {e}")
+
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator[None]:
+        """
+        Group several writes into one read-modify-write per file.
+
+        Writes made by this task inside the block are queued and written when
+        the outermost batch exits, including when the block raises. Other
+        tasks' writes are not deferred. Reads inside the block don't see
+        queued writes yet.
+
+        Usage:
+            async with settings.batch():
+                await settings.update({"a": 1})
+                await settings.update({"api_keys.b": "x"})
+        """
+        if self._current_batch() is not None:
+            yield
+            return
+
+        batch = _WriteBatch()
+        token = self._batch.set(batch)
+        try:
+            yield
+        finally:
+            batch.open = False
+            self._batch.reset(token)
+            if batch.pending:
+                for file_path, updates in batch.pending.items():
+                    self._pending_writes.setdefault(file_path, []).extend(updates)
+                await self._flush_writes(batch.pending)
 
     async def save_to_secrets(self, updates: dict) -> None:
         """
@@ -366,8 +1126,8 @@ class SettingsStore:
 
         Use for: api_keys, passwords, tokens, credentials.
         """
-        self._save_to_file(self.secrets_path, updates)
-        self._cache = None
+        self._enqueue_write(self.secrets_path, updates)
+        await self._flush_writes([self.secrets_path])
 
     async def save_to_overrides(self, updates: dict) -> None:
         """
@@ -375,8 +1135,8 @@ class SettingsStore:
 
         Use for: preferences, selected_providers, feature flags.
         """
-        self._save_to_file(self.overrides_path, updates)
-        self._cache = None
+        self._enqueue_write(self.overrides_path, updates)
+        await self._flush_writes([self.overrides_path])
 
     def _is_secret_key(self, key: str) -> bool:
         """
@@ -434,12 +1194,16 @@ class SettingsStore:
                 else:
                     overrides_updates[key] = value
 
+        files = []
         if secrets_updates:
-            await self.save_to_secrets(secrets_updates)
+            self._enqueue_write(self.secrets_path, secrets_updates)
+            files.append(self.secrets_path)
         if overrides_updates:
-            await self.save_to_overrides(overrides_updates)
+            self._enqueue_write(self.overrides_path, overrides_updates)
+            files.append(self.overrides_path)
 
-        self._cache = None
+        # One flush (and generation bump) for both files
+        await self._flush_writes(files)
 
     def _filter_masked_values(self, updates: dict) -> dict:
         """
@@ -482,7 +1246,7 @@ class SettingsStore:
             logger.info(f"Reset: deleted {self.secrets_path}")
             deleted += 1
         
-        self._cache = None
+        self._reload(force=True)
         return deleted
 
     # =========================================================================
@@ -491,8 +1255,7 @@ class SettingsStore:
 
     async def get_config_as_dict(self) -> Dict[str, Any]:
         """Get merged config as plain Python dict."""
-        config = await self.load_config()
-        return OmegaConf.to_container(config, resolve=True)
+        return (await self.snapshot()).to_dict()
 
     async def find_setting_for_env_var(self, env_var_name: str) -> Optional[Tuple[str, Any]]:
         """
@@ -517,45 +1280,23 @@ class SettingsStore:
         Returns:
             Tuple of (setting_path, value) if found, None otherwise
         """
+        index = self._get_env_index(await self.load_config())
+
         # First, try direct path mapping (derived from provider YAML configs)
-        env_mapping = get_provider_registry().get_env_to_settings_mapping()
-        if env_var_name in env_mapping:
-            settings_path = env_mapping[env_var_name]
-            value = await self.get(settings_path)
-            return (settings_path, value)
+        provider_setting = index.provider_setting(env_var_name)
+        if provider_setting is not None:
+            return provider_setting
 
         # Fall back to fuzzy matching for unmapped env vars
-        config = await self.get_config_as_dict()
         setting_type = infer_setting_type(env_var_name)
         sections = SETTING_SECTIONS.get(setting_type, ['api_keys', 'security'])
 
-        # Collect all matches, prefer ones with values
-        matches_with_value = []
-        matches_empty = []
-
-        for section in sections:
-            section_data = config.get(section, {})
-            if not isinstance(section_data, dict):
-                continue
-
-            for key, value in section_data.items():
-                if value is None or isinstance(value, dict):
-                    continue
-
-                path = f"{section}.{key}"
-                if env_var_matches_setting(env_var_name, path):
-                    str_value = str(value) if value is not None else ""
-                    if str_value.strip():
-                        matches_with_value.append((path, value))
-                    else:
-                        matches_empty.append((path, value))
-
-        # Return first match with value, or first empty match
-        if matches_with_value:
-            return matches_with_value[0]
-        if matches_empty:
-            return matches_empty[0]
-        return None
+        # Prefer matches with values
+        matches = index.fuzzy_matches(env_var_name, sections)
+        for path, value in matches:
+            if str(value).strip():
+                return (path, value)
+        return matches[0] if matches else None
 
     async def has_value_for_env_var(self, env_var_name: str) -> bool:
         """
@@ -581,10 +1322,9 @@ class SettingsStore:
             return True
 
         # Try provider-derived mapping
-        env_mapping = get_provider_registry().get_env_to_settings_mapping()
-        if env_var_name in env_mapping:
-            settings_path = env_mapping[env_var_name]
-            value = await self.get(settings_path)
+        provider_setting = self._get_env_index(await self.load_config()).provider_setting(env_var_name)
+        if provider_setting is not None:
+            _, value = provider_setting
             if value and str(value).strip():
                 return True
 
@@ -600,6 +1340,7 @@ class SettingsStore:
         env_var_name: str,
         provider_registry=None,
         capabilities: Optional[List[str]] = None,
+        settings: Optional[SettingsSnapshot] = None,
     ) -> List[SettingSuggestion]:
         """
         Get setting suggestions that could fill an environment variable.
@@ -611,79 +1352,27 @@ class SettingsStore:
             env_var_name: Environment variable name
             provider_registry: Optional provider registry for capability-based suggestions
             capabilities: Optional list of required capabilities to filter providers
+            settings: Snapshot to read from (default: current snapshot)
 
         Returns:
             List of SettingSuggestion objects
         """
-        suggestions = []
-        seen_paths = set()
-        config = await self.get_config_as_dict()
-
-        # Determine which sections to search based on env var type
-        setting_type = infer_setting_type(env_var_name)
-        sections = SETTING_SECTIONS.get(setting_type, ['api_keys', 'security'])
-
-        # Search config sections
-        for section in sections:
-            section_data = config.get(section, {})
-            if not isinstance(section_data, dict):
-                continue
-
-            for key, value in section_data.items():
-                if value is None or isinstance(value, dict):
-                    continue
-
-                path = f"{section}.{key}"
-                if path in seen_paths:
-                    continue
-                seen_paths.add(path)
-
-                str_value = str(value) if value is not None else ""
-                has_value = bool(str_value.strip())
-
-                suggestions.append(SettingSuggestion(
-                    path=path,
-                    label=key.replace("_", " ").title(),
-                    has_value=has_value,
-                    value=mask_secret_value(str_value, path) if has_value else None,
-                ))
-
-        # Add provider-specific mappings if registry provided
-        if provider_registry and capabilities:
-            for capability in capabilities:
-                selected_id = await self.get(f"selected_providers.{capability}")
-
-                if not selected_id:
-                    selected_id = provider_registry.get_default_provider_id(capability, 'cloud')
-
-                if not selected_id:
-                    continue
+        engine = await self._get_suggestion_engine(provider_registry, settings)
+        return engine.suggestions_for(env_var_name, capabilities if provider_registry else None)
 
-                provider = provider_registry.get_provider(selected_id)
-                if not provider:
-                    continue
-
-                # Check provider's env_maps for matching env var
-                for env_map in provider.env_maps:
-                    if env_map.key == env_var_name and env_map.settings_path:
-                        if env_map.settings_path in seen_paths:
-                            continue
-                        seen_paths.add(env_map.settings_path)
-
-                        value = await self.get(env_map.settings_path)
-                        str_value = str(value) if value is not None else ""
-                        has_value = bool(str_value.strip())
-
-                        suggestions.append(SettingSuggestion(
-                            path=env_map.settings_path,
-                            label=f"{provider.name}: {env_map.label or env_map.key}",
-                            has_value=has_value,
-                            value=mask_secret_value(str_value, env_map.settings_path) if has_value else None,
-                            capability=capability,
-                            provider_name=provider.name,
-                        ))
-
-        return suggestions
+    async def _get_suggestion_engine(
+        self,
+        provider_registry=None,
+        settings: Optional[SettingsSnapshot] = None,
+    ) -> SuggestionEngine:
+        """Suggestion engine for the current settings and provider generations."""
+        settings = settings or await self.snapshot()
+        registry = provider_registry or get_provider_registry()
+        key = (settings.generation, id(registry), registry.generation)
+        engine = self._suggestion_engine
+        if engine is None or engine.key != key:
+            engine = self._suggestion_engine = SuggestionEngine(settings, registry, key)
+        return engine
 
     def find_matching_suggestion(
         self,
@@ -724,14 +1413,56 @@ class SettingsStore:
         Returns:
             Resolved value or None
         """
+        config = await self.load_config()
+        return self._resolve_env_value_from(
+            config, source, setting_path, literal_value, default_value, env_name
+        )
+
+    async def resolve_env_values(self, env_specs: List[Dict[str, Any]]) -> Dict[str, Optional[str]]:
+        """
+        Resolve many env vars against a single settings snapshot.
+
+        Batched form of resolve_env_value(): the merged config is loaded once
+        and every env var is resolved from it.
+
+        Args:
+            env_specs: Dicts with keys name, source, setting_path,
+                       literal_value, default_value
+
+        Returns:
+            Dict of env var name -> resolved value (or None)
+        """
+        config = await self.load_config()
+        return {
+            spec["name"]: self._resolve_env_value_from(
+                config,
+                source=spec.get("source", "default"),
+                setting_path=spec.get("setting_path"),
+                literal_value=spec.get("literal_value"),
+                default_value=spec.get("default_value"),
+                env_name=spec["name"],
+            )
+            for spec in env_specs
+        }
+
+    def _resolve_env_value_from(
+        self,
+        config: DictConfig,
+        source: str,
+        setting_path: Optional[str],
+        literal_value: Optional[str],
+        default_value: Optional[str],
+        env_name: str = ""
+    ) -> Optional[str]:
+        """Resolve one env var value from an already-loaded config."""
         if source == "setting" and setting_path:
-            return await self.get(setting_path)
+            return OmegaConf.select(config, setting_path, default=None)
         elif source == "literal" and literal_value:
             return literal_value
         elif source == "default":
             if env_name:
                 # First try to resolve from settings
-                resolved = await self.get_by_env_var(env_name)
+                resolved = self._get_env_index(config).resolve(env_name)
                 if resolved:
                     logger.info(f"resolve_env_value: {env_name} -> {resolved} (from settings)")
                     return resolved
@@ -769,15 +1500,15 @@ class SettingsStore:
             List of env var config dicts with suggestions and resolved values
         """
         result = []
+        engine = await self._get_suggestion_engine(provider_registry)
+        capabilities = requires if provider_registry else None
 
         for ev in env_vars:
             saved = saved_config.get(ev.name, {})
             if hasattr(saved, 'items'):
                 saved = dict(saved)
 
-            suggestions = await self.get_suggestions_for_env_var(
-                ev.name, provider_registry, requires
-            )
+            suggestions = engine.suggestions_for(ev.name, capabilities)
 
             source = saved.get("source", "default")
             setting_path = saved.get("setting_path")
@@ -9,6 +9,7 @@ import logging
 import os
 import re
 import time
+import weakref
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -16,6 +17,8 @@ from fastapi.responses import JSONResponse, StreamingResponse
 from pymongo.errors import ConnectionFailure, PyMongoError
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from src.services.docker_executor import DockerTimeoutError
+
 logger = logging.getLogger(__name__)
 request_logger = logging.getLogger("api.requests")
 
@@ -71,8 +74,8 @@ def _get_tailscale_origin_regex() -> str | None:
     return None
 
 
-def setup_cors_middleware(app: FastAPI) -> None:
-    """Configure CORS middleware for the FastAPI application."""
+def _get_allowed_origins() -> list[str]:
+    """CORS origins from settings plus the Tailscale hostname, if configured."""
     # Get CORS origins from OmegaConf (with env var fallback)
     allowed_origins = _get_cors_origins_from_config()
 
@@ -84,6 +87,51 @@ def setup_cors_middleware(app: FastAPI) -> None:
             allowed_origins.append(tailscale_origin)
             logger.info(f"Added Tailscale origin to CORS: {tailscale_origin}")
 
+    return allowed_origins
+
+
+class DynamicCORSMiddleware(CORSMiddleware):
+    """
+    CORSMiddleware whose allowed origins follow security.cors_origins.
+
+    Subscribes to settings changes, so origins added at runtime (e.g. via
+    the Tailscale setup flow) apply without a restart. The subscription only
+    holds a weak reference, so instances dropped when Starlette rebuilds its
+    middleware stack unsubscribe themselves instead of leaking.
+    """
+
+    def __init__(self, app, **options):
+        super().__init__(app, **options)
+        self._options = options
+        from src.config.omegaconf_settings import get_settings_store
+
+        middleware_ref = weakref.ref(self)
+
+        def on_origins_changed(changed_paths: set[str]) -> None:
+            middleware = middleware_ref()
+            if middleware is None:
+                unsubscribe()
+                return
+            middleware._on_origins_changed(changed_paths)
+
+        unsubscribe = get_settings_store().subscribe("security.cors_origins", on_origins_changed)
+        self._unsubscribe = unsubscribe
+
+    def close(self) -> None:
+        """Stop following security.cors_origins."""
+        self._unsubscribe()
+
+    def _on_origins_changed(self, changed_paths: set[str]) -> None:
+        allowed_origins = _get_allowed_origins()
+        # Re-run CORSMiddleware setup so all derived headers stay consistent
+        CORSMiddleware.__init__(self, self.app, **{**self._options, "allow_origins": allowed_origins})
+        logger.info(f"CORS origins updated: {allowed_origins}")
+
+
+def setup_cors_middleware(app: FastAPI) -> None:
+    """Configure CORS middleware for the FastAPI application."""
+    allowed_origins = _get_allowed_origins()
+
     # Build Tailscale origin regex for any tailnet
     tailscale_regex = _get_tailscale_origin_regex()
     if tailscale_regex:
@@ -92,7 +140,7 @@ def setup_cors_middleware(app: FastAPI) -> None:
     logger.info(f"CORS configured with origins: {allowed_origins}")
 
     app.add_middleware(
-        CORSMiddleware,
+        DynamicCORSMiddleware,
         allow_origins=allowed_origins,
         allow_origin_regex=tailscale_regex,
         allow_credentials=True,
@@ -181,8 +229,8 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         content_type = response.headers.get("content-type", "")
         should_log_body = self.should_log_response_body(content_type)
 
-        # Skip body logging for streaming responses
-        if isinstance(response, StreamingResponse):
+        # Skip body logging for streaming responses (reading the body would buffer SSE)
+        if isinstance(response, StreamingResponse) or content_type.startswith("text/event-stream"):
             request_logger.info(
                 f"← {request.method} {path} - {response.status_code} "
                 f"(streaming response) - {duration_ms:.2f}ms"
@@ -268,6 +316,19 @@ def setup_exception_handlers(app: FastAPI) -> None:
             }
         )
 
+    @app.exception_handler(DockerTimeoutError)
+    async def docker_timeout_exception_handler(request: Request, exc: DockerTimeoutError):
+        """Handle Docker executor timeouts (slow or hung daemon) as a gateway timeout."""
+        logger.error(f"Operation timed out: {request.method} {request.url.path}")
+        return JSONResponse(
+            status_code=504,
+            content={
+                "detail": "The Docker daemon did not respond in time. Please try again.",
+                "error_type": "timeout",
+                "error_category": "docker"
+            }
+        )
+
     @app.exception_handler(HTTPException)
     async def http_exception_handler(request: Request, exc: HTTPException):
         """Handle HTTP exceptions with structured error response."""
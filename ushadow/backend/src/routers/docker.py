@@ -2,7 +2,8 @@
 Docker API - Minimal Docker daemon status endpoint.
 
 Service-related operations are now in /api/services.
-This router only provides Docker daemon availability check.
+This router only provides Docker daemon availability check and
+Docker access layer metrics.
 """
 
 import logging
@@ -10,6 +11,7 @@ import logging
 from fastapi import APIRouter, Depends
 
 from src.services.docker_manager import get_docker_manager
+from src.services.docker_executor import get_docker_executor
 from src.services.auth import get_current_user
 from src.models.user import User
 
@@ -31,7 +33,21 @@ async def get_docker_status(
     - POST /api/services/{name}/start - start service
     """
     docker_manager = get_docker_manager()
+    available = await docker_manager.aio.is_available()
     return {
-        "available": docker_manager.is_available(),
-        "message": "Docker is available" if docker_manager.is_available() else "Docker is not available"
+        "available": available,
+        "message": "Docker is available" if available else "Docker is not available"
     }
+
+
+@router.get("/metrics")
+async def get_docker_metrics(
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Docker access layer metrics.
+
+    Returns executor queue depth, in-flight calls and per-operation
+    call counts, errors, timeouts and latency.
+    """
+    return get_docker_executor().get_metrics()
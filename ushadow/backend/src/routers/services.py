@@ -11,21 +11,24 @@ All operations go through the ServiceOrchestrator facade.
 
 Endpoint Groups:
 - Discovery:    GET /, /catalog, /by-capability/{cap}
-- Status:       GET /docker-status, /status (BEFORE /{name} to avoid shadowing)
-- Single:       GET /{name}, /{name}/status, /{name}/docker
-- Lifecycle:    POST /{name}/start, /stop, /restart; GET /{name}/logs
+- Status:       GET /docker-status, /status, /metrics (BEFORE /{name} to avoid shadowing)
+- Single:       GET /{name}, /{name}/status, /{name}/docker, /{name}/metrics
+- Lifecycle:    POST /bring-up, /bulk; POST /{name}/start (?stream=true for SSE progress), /stop, /restart; GET /{name}/logs
 - Config:       GET/PUT /{name}/enabled, /{name}/config, /{name}/env, /{name}/resolve
 - Installation: POST /{name}/install, /uninstall, /register
 """
 
+import json
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Literal, Optional
 
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel, Field
+from sse_starlette.sse import EventSourceResponse
 
 from src.services.service_orchestrator import get_service_orchestrator, ServiceOrchestrator
 from src.services.auth import get_current_user
+from src.services.docker_executor import DEFAULT_MAX_WORKERS
 from src.models.user import User
 from src.services.docker_manager import ServiceType, IntegrationType
 
@@ -103,6 +106,23 @@ class PreflightCheckResponse(BaseModel):
     message: Optional[str] = None
 
 
+class BringUpRequest(BaseModel):
+    """Request to start a set of services in dependency order."""
+    services: Optional[List[str]] = Field(None, description="Services to start (default: default_services)")
+    compose_file: Optional[str] = Field(None, description="Start every service in this compose file instead")
+    concurrency: int = Field(4, ge=1, le=32, description="Max services starting at once per level")
+    dry_run: bool = Field(False, description="Only return the startup plan")
+
+
+class BulkActionRequest(BaseModel):
+    """Request to start, stop or restart several services at once."""
+    services: List[str] = Field(..., min_length=1, description="Services to act on")
+    action: Literal["start", "stop", "restart"]
+    concurrency: int = Field(
+        4, ge=1, le=DEFAULT_MAX_WORKERS, description="Max services acted on at once"
+    )
+
+
 class PortOverrideRequest(BaseModel):
     """Request to override a service's port."""
     env_var: str = Field(..., description="Environment variable name (e.g., CHRONICLE_PORT)")
@@ -172,7 +192,7 @@ async def get_docker_status(
     current_user: User = Depends(get_current_user)
 ) -> Dict[str, Any]:
     """Check if Docker daemon is available."""
-    return orchestrator.get_docker_status()
+    return await orchestrator.get_docker_status()
 
 
 @router.get("/status")
@@ -188,10 +208,65 @@ async def get_all_statuses(
     return await orchestrator.get_all_statuses()
 
 
+@router.get("/metrics")
+async def get_all_metrics(
+    orchestrator: ServiceOrchestrator = Depends(get_orchestrator),
+    current_user: User = Depends(get_current_user)
+) -> Dict[str, Any]:
+    """
+    Get resource usage for all running services.
+
+    Returns the latest CPU/memory/network/block I/O sample and a last-hour
+    summary (avg/max) per service.
+    """
+    return orchestrator.get_metrics_summary()
+
+
 # =============================================================================
 # Single Service Endpoints
 # =============================================================================
 
+@router.post("/bring-up")
+async def bring_up_services(
+    request: BringUpRequest,
+    orchestrator: ServiceOrchestrator = Depends(get_orchestrator),
+    current_user: User = Depends(get_current_user)
+) -> Dict[str, Any]:
+    """
+    Start a set of services in dependency order.
+
+    Builds a DAG from infra services, compose depends_on and capability
+    providers, then starts each level concurrently, waiting for health
+    before starting dependents.
+    """
+    try:
+        return await orchestrator.bring_up(
+            services=request.services,
+            compose_file=request.compose_file,
+            concurrency=request.concurrency,
+            dry_run=request.dry_run,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.post("/bulk")
+async def bulk_action(
+    request: BulkActionRequest,
+    orchestrator: ServiceOrchestrator = Depends(get_orchestrator),
+    current_user: User = Depends(get_current_user)
+) -> Dict[str, Any]:
+    """
+    Start, stop or restart several services concurrently.
+
+    Returns per-service results. Tailscale Serve routes are regenerated
+    once for the whole batch.
+    """
+    return await orchestrator.bulk_action(
+        request.services, request.action, concurrency=request.concurrency
+    )
+
+
 @router.get("/{name}")
 async def get_service(
     name: str,
@@ -241,6 +316,28 @@ async def get_docker_details(
     return details.to_dict()
 
 
+@router.get("/{name}/metrics")
+async def get_service_metrics(
+    name: str,
+    resolution: Literal["fine", "coarse"] = "fine",
+    since: Optional[float] = None,
+    orchestrator: ServiceOrchestrator = Depends(get_orchestrator),
+    current_user: User = Depends(get_current_user)
+) -> Dict[str, Any]:
+    """
+    Get resource usage samples for a service's container.
+
+    Args:
+        resolution: 'fine' (collector interval, last hour) or
+                    'coarse' (1 minute avg/max, last 24 hours)
+        since: Only samples at or after this unix timestamp
+    """
+    metrics = orchestrator.get_service_metrics(name, resolution=resolution, since=since)
+    if metrics is None:
+        raise HTTPException(status_code=404, detail=f"Service '{name}' not found")
+    return metrics
+
+
 # =============================================================================
 # Lifecycle Endpoints
 # =============================================================================
@@ -266,7 +363,7 @@ async def preflight_check(
         raise HTTPException(status_code=404, detail=f"Service '{name}' not found")
 
     # Check for port conflicts
-    conflicts = docker_mgr.check_port_conflicts(name)
+    conflicts = await docker_mgr.aio.check_port_conflicts(name)
 
     if conflicts:
         return PreflightCheckResponse(
@@ -299,7 +396,7 @@ async def set_port_override(
     This saves the port to service_preferences and sets the environment variable
     so that subsequent service starts will use the new port.
     """
-    from src.services.docker_manager import get_docker_manager, check_port_in_use
+    from src.services.docker_manager import get_docker_manager
     from src.config.omegaconf_settings import get_settings_store
 
     docker_mgr = get_docker_manager()
@@ -309,12 +406,14 @@ async def set_port_override(
         raise HTTPException(status_code=404, detail=f"Service '{name}' not found")
 
     # Check that the new port is available
-    conflict = check_port_in_use(request.port)
+    conflict = await docker_mgr.aio.check_port(request.port)
     if conflict:
         raise HTTPException(
             status_code=409,
             detail=f"Port {request.port} is already in use by {conflict}"
         )
+    # Claim it so concurrent preflights don't suggest the same port
+    docker_mgr.port_allocator.reserve(request.port)
 
     # Save the port override simply as services.{name}.ports.{ENV_VAR}
     settings = get_settings_store()
@@ -358,7 +457,7 @@ async def get_service_connection_info(
         raise HTTPException(status_code=404, detail=f"Service '{name}' not found")
 
     # Get resolved ports
-    ports = docker_mgr.get_service_ports(name)
+    ports = await docker_mgr.aio.get_service_ports(name)
 
     if not ports:
         return {
@@ -407,9 +506,10 @@ async def debug_docker_ports(
     """
     Debug endpoint to show all Docker container port bindings.
     """
+    from src.services.docker_executor import get_docker_executor
     from src.services.docker_manager import debug_list_docker_ports
 
-    ports = debug_list_docker_ports()
+    ports = await get_docker_executor().run(debug_list_docker_ports, op="debug_list_docker_ports")
     return {
         "containers": ports,
         "total_containers": len(ports)
@@ -419,11 +519,30 @@ async def debug_docker_ports(
 @router.post("/{name}/start", response_model=ActionResponse)
 async def start_service(
     name: str,
+    stream: bool = False,
     orchestrator: ServiceOrchestrator = Depends(get_orchestrator),
     current_user: User = Depends(get_current_user)
-) -> ActionResponse:
-    """Start a service container."""
-    logger.info(f"POST /services/{name}/start - starting service")
+):
+    """
+    Start a service container.
+
+    With ?stream=true, returns a Server-Sent Events stream instead:
+    - event "progress": one docker compose output line (pull/create/start)
+    - event "result": final {"success": bool, "message": str}
+    """
+    logger.info(f"POST /services/{name}/start - starting service (stream={stream})")
+
+    if stream:
+        async def event_generator():
+            async for event in orchestrator.start_service_stream(name):
+                data = event["data"]
+                yield {
+                    "event": event["event"],
+                    "data": data if isinstance(data, str) else json.dumps(data),
+                }
+
+        return EventSourceResponse(event_generator())
+
     result = await orchestrator.start_service(name)
 
     if not result.success and result.message in ["Service not found", "Operation not permitted"]:
@@ -439,7 +558,7 @@ async def stop_service(
     current_user: User = Depends(get_current_user)
 ) -> ActionResponse:
     """Stop a service container."""
-    result = orchestrator.stop_service(name)
+    result = await orchestrator.stop_service(name)
 
     if not result.success and result.message in ["Service not found", "Operation not permitted"]:
         raise HTTPException(status_code=403, detail=result.message)
@@ -454,7 +573,7 @@ async def restart_service(
     current_user: User = Depends(get_current_user)
 ) -> ActionResponse:
     """Restart a service container."""
-    result = orchestrator.restart_service(name)
+    result = await orchestrator.restart_service(name)
 
     if not result.success and result.message in ["Service not found", "Operation not permitted"]:
         raise HTTPException(status_code=403, detail=result.message)
@@ -476,7 +595,7 @@ async def get_service_logs(
         name: Service name
         tail: Number of lines to retrieve (default 100)
     """
-    result = orchestrator.get_service_logs(name, tail=tail)
+    result = await orchestrator.get_service_logs(name, tail=tail)
 
     if not result.success:
         raise HTTPException(status_code=404, detail="Service not found or logs unavailable")
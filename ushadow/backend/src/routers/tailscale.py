@@ -21,7 +21,11 @@ from pydantic import BaseModel, Field
 from src.services.auth import get_current_user, generate_jwt_for_service
 from src.models.user import User
 from src.config.omegaconf_settings import get_settings_store
-from src.services.tailscale_serve import get_tailscale_status
+from src.services.docker_executor import DockerTimeoutError, get_docker_executor
+from src.services.tailscale_serve import (
+    get_docker_client,
+    get_tailscale_status_async,
+)
 
 # UNodeCapabilities moved to /api/unodes/leader/info endpoint
 import logging
@@ -29,8 +33,23 @@ import logging
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/tailscale", tags=["tailscale"])
 
-# Docker client for container management
-docker_client = docker.from_env()
+
+async def _run_docker(func, *args, op: str, **kwargs):
+    """Run a blocking Docker SDK call on the Docker executor.
+
+    Raises:
+        HTTPException: 504 if the daemon doesn't answer within the operation timeout
+    """
+    try:
+        return await get_docker_executor().run(func, *args, op=op, **kwargs)
+    except DockerTimeoutError:
+        raise HTTPException(status_code=504, detail=f"Docker did not respond in time ({op})")
+
+
+def _get_container(container_name: str):
+    """Get a container (blocking). Raises docker.errors.NotFound if missing."""
+    return get_docker_client().containers.get(container_name)
+
 
 def get_environment_name() -> str:
     """Get the current environment name from COMPOSE_PROJECT_NAME or default to 'ushadow'"""
@@ -574,10 +593,12 @@ async def test_connection(
 
 async def exec_in_container(command: str) -> tuple[int, str, str]:
     """Execute command in Tailscale container"""
+    def _exec():
+        container = _get_container(get_tailscale_container_name())
+        return container.exec_run(command, demux=True)
+
     try:
-        container_name = get_tailscale_container_name()
-        container = docker_client.containers.get(container_name)
-        result = container.exec_run(command, demux=True)
+        result = await _run_docker(_exec, op="exec_tailscale_command")
 
         # Handle both tuple and non-tuple results
         if isinstance(result, tuple):
@@ -598,6 +619,8 @@ async def exec_in_container(command: str) -> tuple[int, str, str]:
         return exit_code, stdout, stderr
     except docker.errors.NotFound:
         raise HTTPException(status_code=404, detail="Tailscale container not found")
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error executing in container: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to execute command: {str(e)}")
@@ -611,15 +634,15 @@ async def get_container_status(
     try:
         container_name = get_tailscale_container_name()
         try:
-            container = docker_client.containers.get(container_name)
-            container.reload()  # Refresh status
+            # get() inspects the container, so the status is current
+            container = await _run_docker(_get_container, container_name, op="get_container")
             is_running = container.status == 'running'
 
             if not is_running:
                 return ContainerStatus(exists=True, running=False)
 
             # Use shared utility for status (single source of truth)
-            ts_status = get_tailscale_status()
+            ts_status = await get_tailscale_status_async()
             return ContainerStatus(
                 exists=True,
                 running=True,
@@ -631,6 +654,8 @@ async def get_container_status(
         except docker.errors.NotFound:
             return ContainerStatus(exists=False, running=False)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error checking container status: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to check container status: {str(e)}")
@@ -654,7 +679,7 @@ async def get_mobile_connection_qr(
         container_name = get_tailscale_container_name()
 
         try:
-            container = docker_client.containers.get(container_name)
+            container = await _run_docker(_get_container, container_name, op="get_container")
             if container.status != 'running':
                 raise HTTPException(
                     status_code=400,
@@ -766,113 +791,122 @@ async def get_mobile_connection_qr(
         )
 
 
-@router.post("/container/start")
-async def start_tailscale_container(
-    current_user: User = Depends(get_current_user)
+def _start_or_create_tailscale_container(
+    container_name: str, volume_name: str, env_name: str, ts_hostname: str
 ) -> Dict[str, str]:
-    """Start or create Tailscale container using Docker SDK.
+    """Start the Tailscale container, creating it first if needed (blocking)."""
+    client = get_docker_client()
 
-    Creates a per-environment Tailscale container using COMPOSE_PROJECT_NAME.
-    The container will be named {env}-tailscale and use {env} as its hostname.
-    """
+    # Check if container exists
     try:
-        container_name = get_tailscale_container_name()
-        volume_name = get_tailscale_volume_name()
-        env_name = get_environment_name()
-        ts_hostname = get_tailscale_hostname()
+        container = client.containers.get(container_name)
 
-        # Check if container exists
-        try:
-            container = docker_client.containers.get(container_name)
+        if container.status == 'running':
+            return {"status": "already_running", "message": "Tailscale container is already running"}
+        container.start()
+        return {"status": "started", "message": "Tailscale container started"}
 
-            # Reload to get fresh status
-            container.reload()
+    except docker.errors.NotFound:
+        pass
 
-            if container.status == 'running':
-                return {"status": "already_running", "message": "Tailscale container is already running"}
-            else:
-                container.start()
-                # Give it a moment to start
-                await asyncio.sleep(2)
-                return {"status": "started", "message": "Tailscale container started"}
+    # Container doesn't exist - create it using Docker SDK
+    logger.info(f"Creating Tailscale container '{container_name}' for environment '{env_name}'...")
 
-        except docker.errors.NotFound:
-            # Container doesn't exist - create it using Docker SDK
-            logger.info(f"Creating Tailscale container '{container_name}' for environment '{env_name}'...")
+    # Ensure infra network exists
+    try:
+        client.networks.get("infra-network")
+    except docker.errors.NotFound:
+        raise HTTPException(
+            status_code=400,
+            detail="infra-network not found. Please start infrastructure first."
+        )
 
-            # Ensure infra network exists
-            try:
-                infra_network = docker_client.networks.get("infra-network")
-            except docker.errors.NotFound:
-                raise HTTPException(
-                    status_code=400,
-                    detail="infra-network not found. Please start infrastructure first."
-                )
+    # Get environment's compose network if it exists
+    env_network_name = f"{env_name}_default"
+    env_network = None
+    try:
+        env_network = client.networks.get(env_network_name)
+    except docker.errors.NotFound:
+        logger.warning(f"Environment network '{env_network_name}' not found - will only use infra-network")
 
-            # Get environment's compose network if it exists
-            env_network_name = f"{env_name}_default"
-            env_network = None
-            try:
-                env_network = docker_client.networks.get(env_network_name)
-            except docker.errors.NotFound:
-                logger.warning(f"Environment network '{env_network_name}' not found - will only use infra-network")
-
-            # Create volume if it doesn't exist (per-environment)
-            try:
-                docker_client.volumes.get(volume_name)
-            except docker.errors.NotFound:
-                docker_client.volumes.create(volume_name)
-                logger.info(f"Created Tailscale volume: {volume_name}")
-
-            # Ensure certs directory exists
-            CERTS_DIR.mkdir(parents=True, exist_ok=True)
-
-            # Create container with environment-specific name and hostname
-            # The hostname becomes the Tailscale machine name (e.g., wiz.your-tailnet.ts.net)
-            # Add Docker Compose labels so the container is part of the compose project
-            container = docker_client.containers.run(
-                image="tailscale/tailscale:latest",
-                name=container_name,
-                hostname=ts_hostname,  # This sets the Tailscale hostname (e.g., "wiz")
-                detach=True,
-                environment={
-                    "TS_STATE_DIR": "/var/lib/tailscale",
-                    "TS_USERSPACE": "true",
-                    "TS_ACCEPT_DNS": "true",
-                    "TS_EXTRA_ARGS": "--advertise-tags=tag:container",
-                    "TS_HOSTNAME": ts_hostname,  # Explicitly set Tailscale hostname
-                    "TS_SERVE_CONFIG": "/config/tailscale-serve.json",
-                },
-                labels={
-                    "com.docker.compose.project": env_name,
-                    "com.docker.compose.service": "tailscale",
-                    "com.docker.compose.oneoff": "False",
-                },
-                volumes={
-                    volume_name: {"bind": "/var/lib/tailscale", "mode": "rw"},
-                    f"{PROJECT_ROOT}/config/certs": {"bind": "/certs", "mode": "rw"},
-                    f"{PROJECT_ROOT}/config": {"bind": "/config", "mode": "ro"},
-                },
-                cap_add=["NET_ADMIN", "NET_RAW"],
-                network="infra-network",
-                restart_policy={"Name": "unless-stopped"},
-                command="sh -c 'tailscaled --tun=userspace-networking --statedir=/var/lib/tailscale & sleep infinity'"
-            )
+    # Create volume if it doesn't exist (per-environment)
+    try:
+        client.volumes.get(volume_name)
+    except docker.errors.NotFound:
+        client.volumes.create(volume_name)
+        logger.info(f"Created Tailscale volume: {volume_name}")
+
+    # Ensure certs directory exists
+    CERTS_DIR.mkdir(parents=True, exist_ok=True)
+
+    # Create container with environment-specific name and hostname
+    # The hostname becomes the Tailscale machine name (e.g., wiz.your-tailnet.ts.net)
+    # Add Docker Compose labels so the container is part of the compose project
+    container = client.containers.run(
+        image="tailscale/tailscale:latest",
+        name=container_name,
+        hostname=ts_hostname,  # This sets the Tailscale hostname (e.g., "wiz")
+        detach=True,
+        environment={
+            "TS_STATE_DIR": "/var/lib/tailscale",
+            "TS_USERSPACE": "true",
+            "TS_ACCEPT_DNS": "true",
+            "TS_EXTRA_ARGS": "--advertise-tags=tag:container",
+            "TS_HOSTNAME": ts_hostname,  # Explicitly set Tailscale hostname
+            "TS_SERVE_CONFIG": "/config/tailscale-serve.json",
+        },
+        labels={
+            "com.docker.compose.project": env_name,
+            "com.docker.compose.service": "tailscale",
+            "com.docker.compose.oneoff": "False",
+        },
+        volumes={
+            volume_name: {"bind": "/var/lib/tailscale", "mode": "rw"},
+            f"{PROJECT_ROOT}/config/certs": {"bind": "/certs", "mode": "rw"},
+            f"{PROJECT_ROOT}/config": {"bind": "/config", "mode": "ro"},
+        },
+        cap_add=["NET_ADMIN", "NET_RAW"],
+        network="infra-network",
+        restart_policy={"Name": "unless-stopped"},
+        command="sh -c 'tailscaled --tun=userspace-networking --statedir=/var/lib/tailscale & sleep infinity'"
+    )
 
-            # Connect to environment's compose network for routing to backend/frontend
-            if env_network:
-                try:
-                    env_network.connect(container)
-                    logger.info(f"Connected Tailscale container to environment network '{env_network_name}'")
-                except Exception as e:
-                    logger.warning(f"Failed to connect to environment network: {e}")
+    # Connect to environment's compose network for routing to backend/frontend
+    if env_network:
+        try:
+            env_network.connect(container)
+            logger.info(f"Connected Tailscale container to environment network '{env_network_name}'")
+        except Exception as e:
+            logger.warning(f"Failed to connect to environment network: {e}")
 
-            logger.info(f"Tailscale container '{container_name}' created with hostname '{ts_hostname}': {container.id}")
+    logger.info(f"Tailscale container '{container_name}' created with hostname '{ts_hostname}': {container.id}")
+    return {
+        "status": "created",
+        "message": f"Tailscale container '{container_name}' created and started with hostname '{ts_hostname}'"
+    }
+
+
+@router.post("/container/start")
+async def start_tailscale_container(
+    current_user: User = Depends(get_current_user)
+) -> Dict[str, str]:
+    """Start or create Tailscale container using Docker SDK.
+
+    Creates a per-environment Tailscale container using COMPOSE_PROJECT_NAME.
+    The container will be named {env}-tailscale and use {env} as its hostname.
+    """
+    try:
+        result = await _run_docker(
+            _start_or_create_tailscale_container,
+            get_tailscale_container_name(),
+            get_tailscale_volume_name(),
+            get_environment_name(),
+            get_tailscale_hostname(),
+            op="create_container",
+        )
+        if result["status"] != "already_running":
             await asyncio.sleep(2)  # Give it time to start
-            return {
-                "status": "created",
-                "message": f"Tailscale container '{container_name}' created and started with hostname '{ts_hostname}'"
-            }
+        return result
 
     except HTTPException:
         raise
@@ -932,72 +966,80 @@ async def start_tailscale_with_caddy(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/container/start-caddy")
-async def start_caddy_container() -> Dict[str, str]:
-    """Start or create Caddy reverse proxy container.
+def _start_or_create_caddy_container(container_name: str) -> Dict[str, str]:
+    """Start the Caddy container, creating it first if needed (blocking)."""
+    client = get_docker_client()
 
-    Creates the Caddy container for path-based routing to services.
-    Must be called before configuring Tailscale Serve routes.
-    """
     try:
-        container_name = "ushadow-caddy"
+        container = client.containers.get(container_name)
 
-        try:
-            container = docker_client.containers.get(container_name)
-            container.reload()
+        if container.status == "running":
+            return {"status": "running", "message": "Caddy is already running"}
+        container.start()
+        return {"status": "started", "message": "Caddy container started"}
+
+    except docker.errors.NotFound:
+        pass
 
-            if container.status == "running":
-                return {"status": "running", "message": "Caddy is already running"}
-            else:
-                container.start()
-                await asyncio.sleep(2)
-                return {"status": "started", "message": "Caddy container started"}
+    # Create Caddy container
+    logger.info("Creating Caddy container...")
 
+    # Ensure infra network exists
+    try:
+        client.networks.get("infra-network")
+    except docker.errors.NotFound:
+        raise HTTPException(
+            status_code=400,
+            detail="infra-network not found. Please start infrastructure first."
+        )
+
+    # Create volumes
+    for vol_name in ["ushadow-caddy-data", "ushadow-caddy-config"]:
+        try:
+            client.volumes.get(vol_name)
         except docker.errors.NotFound:
-            # Create Caddy container
-            logger.info("Creating Caddy container...")
+            client.volumes.create(vol_name)
 
-            # Ensure infra network exists
-            try:
-                infra_network = docker_client.networks.get("infra-network")
-            except docker.errors.NotFound:
-                raise HTTPException(
-                    status_code=400,
-                    detail="infra-network not found. Please start infrastructure first."
-                )
+    # Caddyfile path
+    caddyfile_path = PROJECT_ROOT / "config" / "Caddyfile"
+    if not caddyfile_path.exists():
+        raise HTTPException(
+            status_code=400,
+            detail="Caddyfile not found at config/Caddyfile"
+        )
 
-            # Create volumes
-            for vol_name in ["ushadow-caddy-data", "ushadow-caddy-config"]:
-                try:
-                    docker_client.volumes.get(vol_name)
-                except docker.errors.NotFound:
-                    docker_client.volumes.create(vol_name)
+    container = client.containers.run(
+        image="caddy:2-alpine",
+        name=container_name,
+        detach=True,
+        ports={"80/tcp": 8880},
+        volumes={
+            str(caddyfile_path.absolute()): {"bind": "/etc/caddy/Caddyfile", "mode": "ro"},
+            "ushadow-caddy-data": {"bind": "/data", "mode": "rw"},
+            "ushadow-caddy-config": {"bind": "/config", "mode": "rw"},
+        },
+        network="infra-network",
+        restart_policy={"Name": "unless-stopped"},
+    )
 
-            # Caddyfile path
-            caddyfile_path = PROJECT_ROOT / "config" / "Caddyfile"
-            if not caddyfile_path.exists():
-                raise HTTPException(
-                    status_code=400,
-                    detail="Caddyfile not found at config/Caddyfile"
-                )
+    logger.info(f"Caddy container created: {container.id}")
+    return {"status": "created", "message": "Caddy container created and started"}
 
-            container = docker_client.containers.run(
-                image="caddy:2-alpine",
-                name=container_name,
-                detach=True,
-                ports={"80/tcp": 8880},
-                volumes={
-                    str(caddyfile_path.absolute()): {"bind": "/etc/caddy/Caddyfile", "mode": "ro"},
-                    "ushadow-caddy-data": {"bind": "/data", "mode": "rw"},
-                    "ushadow-caddy-config": {"bind": "/config", "mode": "rw"},
-                },
-                network="infra-network",
-                restart_policy={"Name": "unless-stopped"},
-            )
 
-            logger.info(f"Caddy container created: {container.id}")
+@router.post("/container/start-caddy")
+async def start_caddy_container() -> Dict[str, str]:
+    """Start or create Caddy reverse proxy container.
+
+    Creates the Caddy container for path-based routing to services.
+    Must be called before configuring Tailscale Serve routes.
+    """
+    try:
+        result = await _run_docker(
+            _start_or_create_caddy_container, "ushadow-caddy", op="create_container"
+        )
+        if result["status"] != "running":
             await asyncio.sleep(2)
-            return {"status": "created", "message": "Caddy container created and started"}
+        return result
 
     except HTTPException:
         raise
@@ -1012,8 +1054,7 @@ async def get_caddy_status(
 ) -> Dict[str, Any]:
     """Get Caddy container status."""
     try:
-        container = docker_client.containers.get("ushadow-caddy")
-        container.reload()
+        container = await _run_docker(_get_container, "ushadow-caddy", op="get_container")
 
         return {
             "exists": True,
@@ -1023,6 +1064,8 @@ async def get_caddy_status(
         }
     except docker.errors.NotFound:
         return {"exists": False, "running": False}
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error checking Caddy status: {e}")
         return {"exists": False, "running": False, "error": str(e)}
@@ -1040,13 +1083,13 @@ async def configure_caddy_routing(
     try:
         from src.services.tailscale_serve import configure_caddy_proxy_route, is_caddy_running
 
-        if not is_caddy_running():
+        if not await _run_docker(is_caddy_running, op="get_container"):
             return {
                 "status": "error",
                 "message": "Caddy is not running. Start it first with /container/start-caddy"
             }
 
-        success = configure_caddy_proxy_route()
+        success = await _run_docker(configure_caddy_proxy_route, op="configure_tailscale_serve")
 
         if success:
             return {
@@ -1059,6 +1102,8 @@ async def configure_caddy_routing(
                 "message": "Failed to configure Tailscale Serve routing"
             }
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error configuring Caddy routing: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -1174,22 +1219,25 @@ async def provision_cert_in_container(
         if exit_code == 0:
             # Copy files from Tailscale container's /certs to backend's /config/certs
             container_name = get_tailscale_container_name()
-            container = docker_client.containers.get(container_name)
 
             import tarfile
             import io
 
+            def _read_file(path: str, member: str) -> bytes:
+                data, _ = _get_container(container_name).get_archive(path)
+                tar_stream = io.BytesIO(b''.join(data))
+                with tarfile.open(fileobj=tar_stream) as tar:
+                    return tar.extractfile(member).read()
+
             # Copy cert file from /certs in Tailscale container
-            cert_data, _ = container.get_archive(f"/certs/{hostname}.crt")
-            tar_stream = io.BytesIO(b''.join(cert_data))
-            with tarfile.open(fileobj=tar_stream) as tar:
-                cert_content = tar.extractfile(f"{hostname}.crt").read()
+            cert_content = await _run_docker(
+                _read_file, f"/certs/{hostname}.crt", f"{hostname}.crt", op="get_container_archive"
+            )
 
             # Copy key file
-            key_data, _ = container.get_archive(f"/certs/{hostname}.key")
-            tar_stream = io.BytesIO(b''.join(key_data))
-            with tarfile.open(fileobj=tar_stream) as tar:
-                key_content = tar.extractfile(f"{hostname}.key").read()
+            key_content = await _run_docker(
+                _read_file, f"/certs/{hostname}.key", f"{hostname}.key", op="get_container_archive"
+            )
 
             # Write to backend's config/certs
             with open(cert_file, 'wb') as f:
@@ -1240,10 +1288,10 @@ async def configure_tailscale_serve(
         logger.info(f"Tailscale configuration saved to {TAILSCALE_CONFIG_FILE}")
 
         # Configure base routes for this environment
-        success = configure_base_routes()
+        success = await _run_docker(configure_base_routes, op="configure_tailscale_serve")
 
         # Get the current serve status to return actual routes
-        status = get_serve_status() or ""
+        status = await _run_docker(get_serve_status, op="exec_tailscale_command") or ""
 
         if success:
             return {
@@ -1259,6 +1307,8 @@ async def configure_tailscale_serve(
                 "routes": status
             }
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error configuring tailscale serve: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to configure serve: {str(e)}")
@@ -1358,7 +1408,7 @@ async def update_cors_origins(
         return {
             "status": "success",
             "origin": origin,
-            "message": f"Added {origin} to CORS allowed origins. Restart may be required for changes to take effect."
+            "message": f"Added {origin} to CORS allowed origins"
         }
 
     except Exception as e:
@@ -1403,13 +1453,13 @@ async def regenerate_serve_routes(
         )
 
         # Generate config from current state
-        config = generate_serve_config()
+        config = await _run_docker(generate_serve_config, op="regenerate_tailscale_routes")
 
         # Write to file
         config_path = write_serve_config(config)
 
         # Apply via set-raw
-        success = apply_serve_config(config)
+        success = await _run_docker(apply_serve_config, config, op="regenerate_tailscale_routes")
 
         if success:
             return RegenerateRoutesResponse(
@@ -1429,6 +1479,8 @@ async def regenerate_serve_routes(
     except ValueError as e:
         # Missing hostname or other config issue
         raise HTTPException(status_code=400, detail=str(e))
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error regenerating routes: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to regenerate routes: {str(e)}")
@@ -1483,7 +1535,7 @@ async def get_serve_routes_status(
 
         # Check if Tailscale Serve is configured (has routes)
         from src.services.tailscale_serve import get_serve_status
-        serve_status = get_serve_status()
+        serve_status = await _run_docker(get_serve_status, op="exec_tailscale_command")
         tailscale_configured = bool(serve_status and serve_status.strip())
 
         return ServeRoutesStatus(
@@ -1493,6 +1545,8 @@ async def get_serve_routes_status(
             tailscale_configured=tailscale_configured,
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting routes status: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to get routes status: {str(e)}")
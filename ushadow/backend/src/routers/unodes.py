@@ -22,7 +22,7 @@ from src.models.unode import (
 )
 from src.services.unode_manager import get_unode_manager
 from src.services.auth import get_current_user
-from src.services.tailscale_serve import get_tailscale_status
+from src.services.tailscale_serve import get_tailscale_status_async
 from src.models.user import User
 
 logger = logging.getLogger(__name__)
@@ -419,7 +419,7 @@ async def get_leader_info():
     unodes = await unode_manager.list_unodes()
 
     # Get Tailscale status (single source of truth)
-    ts_status = get_tailscale_status()
+    ts_status = await get_tailscale_status_async()
     tailscale_hostname = ts_status.hostname  # e.g., "blue.spangled-kettle.ts.net"
     api_port = 8000
 
@@ -7,19 +7,108 @@ the resolver:
 2. Gets the provider's credentials
 3. Resolves credential values from settings
 4. Maps canonical env vars to service-expected env vars
+
+Steps 1, 2 and 4 depend only on the catalogs and the provider selection, so
+they are compiled once per service into a ResolutionPlan; resolving a
+service then only reads the planned settings paths from a snapshot.
 """
 
 import logging
-from typing import Dict, List, Optional, Any
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Tuple
 
 from src.services.provider_registry import get_provider_registry
 from src.services.compose_registry import get_compose_registry
 from src.models.provider import Provider, EnvMap
-from src.config.omegaconf_settings import get_settings_store
+from src.config.omegaconf_settings import SettingsSnapshot, get_settings_store
 
 logger = logging.getLogger(__name__)
 
 
+# =============================================================================
+# Resolution Plans
+# =============================================================================
+
+@dataclass(frozen=True)
+class PlannedEnvVar:
+    """One env var of a capability: read a settings path, else use a literal."""
+
+    env_var: str                      # Name the service expects
+    settings_path: Optional[str]      # User override, read from settings
+    default: Optional[str]            # Provider literal, used if the setting is empty
+    missing_error: Optional[str]      # Set for required values - fails the capability
+
+
+@dataclass(frozen=True)
+class PlannedCapability:
+    """A capability a service uses, bound to the provider selected for it."""
+
+    capability: str
+    required: bool
+    provider_id: Optional[str]
+    env_vars: Tuple[PlannedEnvVar, ...]
+    error: Optional[str] = None       # Set when no provider is selected
+
+
+@dataclass(frozen=True)
+class ResolutionPlan:
+    """
+    Compiled env var resolution for one service.
+
+    Depends only on the compose and provider catalogs and the provider
+    selection (`selection` holds the settings it was compiled against), so
+    it is reused until one of them changes.
+    """
+
+    service_id: str
+    selection_paths: Tuple[str, ...]
+    selection: Tuple[Any, ...]
+    capabilities: Tuple[PlannedCapability, ...]
+    config: Tuple[dict, ...]
+
+    def matches(self, settings: SettingsSnapshot) -> bool:
+        """Whether the provider selection is unchanged in a snapshot."""
+        return all(
+            settings.get(path) == value
+            for path, value in zip(self.selection_paths, self.selection)
+        )
+
+    def execute(self, settings: SettingsSnapshot) -> Tuple[Dict[str, str], List[str]]:
+        """
+        Resolve the planned capability env vars against a settings snapshot.
+
+        Returns:
+            (env, errors) - errors from required capabilities. A capability
+            missing a required value contributes no env vars.
+        """
+        env: Dict[str, str] = {}
+        errors: List[str] = []
+
+        for planned in self.capabilities:
+            error = planned.error
+            if error is None:
+                values: Dict[str, str] = {}
+                for var in planned.env_vars:
+                    value = settings.get(var.settings_path) if var.settings_path else None
+                    if value:
+                        values[var.env_var] = str(value)
+                    elif var.default is not None:
+                        values[var.env_var] = str(var.default)
+                    elif var.missing_error:
+                        error = var.missing_error
+                        break
+                else:
+                    env.update(values)
+                    continue
+
+            if planned.required:
+                errors.append(error)
+            else:
+                logger.warning(f"Optional capability failed: {error}")
+
+        return env, errors
+
+
 class CapabilityResolver:
     """
     Resolves capability requirements to concrete environment variables.
@@ -33,6 +122,9 @@ class CapabilityResolver:
         self._compose_registry = get_compose_registry()
         self._settings = get_settings_store()
         self._services_cache: Dict[str, dict] = {}
+        self._services_cache_generation: Optional[int] = None  # compose registry generation
+        self._plans: Dict[str, ResolutionPlan] = {}
+        self._plans_generation: Optional[Tuple[int, int]] = None  # (compose, provider) generations
 
     async def resolve_for_service(self, service_id: str) -> Dict[str, str]:
         """
@@ -47,32 +139,23 @@ class CapabilityResolver:
         Raises:
             ValueError: If service not found or required capability missing
         """
-        service_config = self._load_service_config(service_id)
-        if not service_config:
-            raise ValueError(f"Service '{service_id}' not found in {SERVICES_DIR}")
-
-        env: Dict[str, str] = {}
-        errors: List[str] = []
+        settings = await self._settings.snapshot()
+        plan = self.get_resolution_plan(service_id, settings)
+        if plan is None:
+            raise ValueError(f"Service '{service_id}' not found in compose registry")
 
         # Resolve each capability the service uses
-        for use in service_config.get('uses', []):
-            try:
-                capability_env = await self._resolve_capability(use)
-                env.update(capability_env)
-            except ValueError as e:
-                if use.get('required', True):
-                    errors.append(str(e))
-                else:
-                    logger.warning(f"Optional capability failed: {e}")
-
-        # Resolve service-specific config
-        for config_item in service_config.get('config', []):
-            try:
-                value = await self._resolve_config_item(config_item)
-                if value is not None:
-                    env[config_item['env_var']] = str(value)
-            except Exception as e:
-                logger.warning(f"Failed to resolve config {config_item.get('key')}: {e}")
+        env, errors = plan.execute(settings)
+
+        # Resolve service-specific config (generated secrets are saved in one write)
+        async with self._settings.batch():
+            for config_item in plan.config:
+                try:
+                    value = await self._resolve_config_item(config_item, settings)
+                    if value is not None:
+                        env[config_item['env_var']] = str(value)
+                except Exception as e:
+                    logger.warning(f"Failed to resolve config {config_item.get('key')}: {e}")
 
         if errors:
             raise ValueError(
@@ -82,54 +165,100 @@ class CapabilityResolver:
 
         return env
 
-    async def _resolve_capability(self, use: dict) -> Dict[str, str]:
+    def get_resolution_plan(self, service_id: str, settings: SettingsSnapshot) -> Optional[ResolutionPlan]:
         """
-        Resolve a single capability usage.
+        Get the compiled resolution plan for a service.
 
-        Args:
-            use: Dict with 'capability', 'required', 'env_mapping'
+        Plans are rebuilt when the compose or provider catalog reloads, or
+        when the provider selection for one of the service's capabilities
+        changes.
 
         Returns:
-            Dict of env vars for this capability
+            The plan, or None if the service is not in the compose registry
         """
-        capability = use['capability']
-        env_mapping = use.get('env_mapping', {})
-
-        # Get the selected provider for this capability
-        provider = await self._get_selected_provider(capability)
-        if not provider:
-            raise ValueError(
-                f"No provider selected for capability '{capability}'. "
-                f"Run the wizard or set selected_providers.{capability} in settings."
-            )
+        generation = (self._compose_registry.generation, self._provider_registry.generation)
+        if generation != self._plans_generation:
+            self._plans = {}
+            self._plans_generation = generation
 
-        # Resolve each env mapping the provider offers
-        env: Dict[str, str] = {}
+        plan = self._plans.get(service_id)
+        if plan is not None and plan.matches(settings):
+            return plan
 
-        for env_map in provider.env_maps:
-            value = await self._resolve_env_map(env_map)
+        service_config = self._load_service_config(service_id)
+        if not service_config:
+            return None
 
-            if value is None:
-                if env_map.required:
-                    raise ValueError(
-                        f"Provider '{provider.id}' requires {env_map.key} but it's not configured. "
-                        f"Set {env_map.settings_path or env_map.key} in settings."
-                    )
-                continue
+        plan = self._compile_plan(service_id, service_config, settings)
+        self._plans[service_id] = plan
+        return plan
 
-            # Use provider's env_var directly, apply service env_mapping only for overrides
-            provider_env = env_map.env_var or env_map.key.upper()
-            service_env = env_mapping.get(provider_env, provider_env)
+    def _compile_plan(self, service_id: str, service_config: dict, settings: SettingsSnapshot) -> ResolutionPlan:
+        """Bind each capability a service uses to its selected provider's env maps."""
+        uses = service_config.get('uses', [])
+        selection_paths = tuple(
+            f"selected_providers.{use['capability']}" for use in uses
+        ) + ("wizard_mode",)
 
-            env[service_env] = str(value)
-            logger.debug(
-                f"Resolved {capability}.{env_map.key}: "
-                f"{provider_env} -> {service_env} = ***"
-            )
+        capabilities = []
+        for use in uses:
+            capability = use['capability']
+            required = use.get('required', True)
 
-        return env
+            # Get the selected provider for this capability
+            provider = self._get_selected_provider(capability, settings)
+            if not provider:
+                capabilities.append(PlannedCapability(
+                    capability=capability,
+                    required=required,
+                    provider_id=None,
+                    env_vars=(),
+                    error=(
+                        f"No provider selected for capability '{capability}'. "
+                        f"Run the wizard or set selected_providers.{capability} in settings."
+                    ),
+                ))
+                continue
 
-    async def _get_selected_provider(self, capability: str) -> Optional[Provider]:
+            # Use provider's env_var directly, apply service env_mapping only for overrides
+            env_mapping = use.get('env_mapping', {})
+            env_vars = []
+            for env_map in provider.env_maps:
+                provider_env = env_map.env_var or env_map.key.upper()
+                env_vars.append(PlannedEnvVar(
+                    env_var=env_mapping.get(provider_env, provider_env),
+                    settings_path=env_map.settings_path,
+                    default=env_map.default,
+                    missing_error=(
+                        f"Provider '{provider.id}' requires {env_map.key} but it's not configured. "
+                        f"Set {env_map.settings_path or env_map.key} in settings."
+                    ) if env_map.required else None,
+                ))
+
+            capabilities.append(PlannedCapability(
+                capability=capability,
+                required=required,
+                provider_id=provider.id,
+                env_vars=tuple(env_vars),
+            ))
+
+        logger.debug(
+            f"Compiled resolution plan for '{service_id}': "
+            + ", ".join(f"{c.capability}->{c.provider_id}" for c in capabilities)
+        )
+        return ResolutionPlan(
+            service_id=service_id,
+            selection_paths=selection_paths,
+            selection=tuple(settings.get(path) for path in selection_paths),
+            capabilities=tuple(capabilities),
+            config=tuple(service_config.get('config', [])),
+        )
+
+    async def get_selected_provider(self, capability: str) -> Optional[Provider]:
+        """Get the provider selected (or defaulted) for a capability."""
+        return self._get_selected_provider(capability, await self._settings.snapshot())
+
+    def _get_selected_provider(self, capability: str, settings: SettingsSnapshot) -> Optional[Provider]:
         """
         Get the provider selected for a capability.
 
@@ -137,7 +266,7 @@ class CapabilityResolver:
         based on wizard_mode.
         """
         # Try to get explicit selection
-        selected = await self._settings.get(f"selected_providers.{capability}")
+        selected = settings.get(f"selected_providers.{capability}")
         if selected:
             provider = self._provider_registry.get_provider(selected)
             if provider:
@@ -145,7 +274,7 @@ class CapabilityResolver:
             logger.warning(f"Selected provider '{selected}' not found for {capability}")
 
         # Fall back to default based on wizard mode
-        wizard_mode = await self._settings.get("wizard_mode", "quickstart")
+        wizard_mode = settings.get("wizard_mode", "quickstart")
         mode = "local" if wizard_mode == "local" else "cloud"
 
         default_provider = self._provider_registry.get_default_provider(capability, mode)
@@ -158,7 +287,7 @@ class CapabilityResolver:
 
         return None
 
-    async def _resolve_env_map(self, env_map) -> Optional[str]:
+    def _resolve_env_map(self, env_map, settings: SettingsSnapshot) -> Optional[str]:
         """
         Resolve an env mapping to its actual value.
 
@@ -168,7 +297,7 @@ class CapabilityResolver:
         """
         # Try settings path first (user override)
         if env_map.settings_path:
-            value = await self._settings.get(env_map.settings_path)
+            value = settings.get(env_map.settings_path)
             if value:
                 return str(value)
 
@@ -178,14 +307,14 @@ class CapabilityResolver:
 
         return None
 
-    async def _resolve_config_item(self, config: dict) -> Optional[str]:
+    async def _resolve_config_item(self, config: dict, settings: SettingsSnapshot) -> Optional[str]:
         """Resolve a service-specific config item."""
         import secrets
 
         settings_path = config.get('settings_path')
 
         if settings_path:
-            value = await self._settings.get(settings_path)
+            value = settings.get(settings_path)
             if value is not None:
                 return str(value)
 
@@ -220,6 +349,11 @@ class CapabilityResolver:
         1. Exact service name match (e.g., 'chronicle-backend')
         2. Compose file base name match (e.g., 'chronicle' matches chronicle-compose.yaml)
         """
+        # Compose files may change underneath us (directory watcher)
+        generation = self._compose_registry.generation
+        if generation != self._services_cache_generation:
+            self._services_cache = {}
+            self._services_cache_generation = generation
         if service_id in self._services_cache:
             return self._services_cache[service_id]
 
@@ -229,11 +363,8 @@ class CapabilityResolver:
         # If not found, try matching by compose file base name
         # e.g., 'chronicle' matches services in 'chronicle-compose.yaml'
         if not service:
-            for s in self._compose_registry.get_services():
-                compose_base = s.compose_file.stem.replace('-compose', '')
-                if compose_base == service_id:
-                    service = s
-                    break
+            matches = self._compose_registry.get_services_by_compose_base(service_id)
+            service = matches[0] if matches else None
 
         if not service:
             logger.debug(f"Service '{service_id}' not found in compose registry")
@@ -258,9 +389,28 @@ class CapabilityResolver:
     def reload(self) -> None:
         """Clear caches and reload."""
         self._services_cache = {}
+        self._plans = {}
         self._provider_registry.reload()
         self._compose_registry.reload()
 
+    def reload_if_changed(self) -> bool:
+        """
+        Reload registries only if their source files changed.
+
+        Returns:
+            True if anything was reloaded
+        """
+        providers_changed = self._provider_registry.reload_if_changed()
+        # A watched compose registry is already up to date
+        compose_changed = (
+            not self._compose_registry.watched and self._compose_registry.reload_if_changed()
+        )
+        if providers_changed or compose_changed:
+            self._services_cache = {}
+            self._plans = {}
+            return True
+        return False
+
     # =========================================================================
     # Validation Methods
     # =========================================================================
@@ -288,12 +438,13 @@ class CapabilityResolver:
         missing_caps = []
         missing_keys = []
         warnings = []
+        settings = await self._settings.snapshot()
 
         for use in service_config.get('uses', []):
             capability = use['capability']
             required = use.get('required', True)
 
-            provider = await self._get_selected_provider(capability)
+            provider = self._get_selected_provider(capability, settings)
             if not provider:
                 if required:
                     missing_caps.append({
@@ -309,7 +460,7 @@ class CapabilityResolver:
                 if not env_map.required:
                     continue
 
-                value = await self._resolve_env_map(env_map)
+                value = self._resolve_env_map(env_map, settings)
                 if not value:
                     if required:
                         missing_keys.append({
@@ -352,6 +503,7 @@ class CapabilityResolver:
         # Track capabilities we've seen (to deduplicate)
         seen_capabilities: Dict[str, Dict[str, Any]] = {}
         all_can_start = True
+        settings = await self._settings.snapshot()
 
         for service_id in service_ids:
             service_config = self._load_service_config(service_id)
@@ -367,7 +519,7 @@ class CapabilityResolver:
                 if capability in seen_capabilities:
                     continue
 
-                provider = await self._get_selected_provider(capability)
+                provider = self._get_selected_provider(capability, settings)
                 if not provider:
                     if required:
                         seen_capabilities[capability] = {
@@ -388,7 +540,7 @@ class CapabilityResolver:
                     if not env_map.required:
                         continue
 
-                    value = await self._resolve_env_map(env_map)
+                    value = self._resolve_env_map(env_map, settings)
                     if not value:
                         missing_keys.append({
                             "key": env_map.key,
@@ -21,16 +21,24 @@ The compose file format expected:
           - OPTIONAL=${VAR:-default}  # Has default, can override
 """
 
+import asyncio
+import hashlib
 import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any, Tuple
+from dataclasses import asdict, dataclass, field
 from pydantic import BaseModel
 
 try:
+    from ..config.compiled_cache import CACHE_DIR_NAME, CompiledCache
     from ..config.yaml_parser import ComposeParser, ComposeService, ComposeEnvVar, ParsedCompose
 except ImportError:
     # Handle direct execution or different import contexts
+    from config.compiled_cache import CACHE_DIR_NAME, CompiledCache
     from config.yaml_parser import ComposeParser, ComposeService, ComposeEnvVar, ParsedCompose
 
 logger = logging.getLogger(__name__)
@@ -51,8 +59,37 @@ def _get_compose_dir() -> Path:
     return Path("compose")
 
 
+def _get_cache_dir() -> Path:
+    """Compiled config cache lives in the (writable) config directory."""
+    if Path("/config").exists():
+        return Path("/config") / CACHE_DIR_NAME
+    if Path("config").exists():
+        return Path("config") / CACHE_DIR_NAME
+    if Path("../../config").exists():
+        return Path("../../config").resolve() / CACHE_DIR_NAME
+    return Path("config") / CACHE_DIR_NAME
+
+
 COMPOSE_DIR = _get_compose_dir()
 
+# Parse in a process pool once this many files need parsing at once; below
+# that, worker startup costs more than it saves (~10ms per file)
+PARALLEL_PARSE_MIN_FILES = int(os.environ.get("COMPOSE_PARSE_PARALLEL_MIN", "32"))
+PARALLEL_PARSE_MAX_WORKERS = int(os.environ.get("COMPOSE_PARSE_WORKERS", str(min(os.cpu_count() or 1, 8))))
+
+_worker_parser: Optional[ComposeParser] = None
+
+
+def _parse_in_worker(path: str) -> Tuple[Optional[ParsedCompose], Optional[str]]:
+    """Parse one compose file in a pool worker; errors are returned, not raised."""
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = ComposeParser()
+    try:
+        return _worker_parser.parse(path), None
+    except Exception as e:
+        return None, str(e)
+
 
 # ============================================================================
 # Data Models
@@ -109,6 +146,7 @@ class DiscoveredService:
     # From compose parsing
     image: Optional[str] = None
     requires: List[str] = field(default_factory=list)
+    provides: Optional[str] = None  # Capability this service implements (e.g., "memory")
     depends_on: List[str] = field(default_factory=list)
     profiles: List[str] = field(default_factory=list)
     ports: List[Dict[str, Any]] = field(default_factory=list)
@@ -125,6 +163,11 @@ class DiscoveredService:
     # User configuration (loaded from storage)
     env_config: Dict[str, EnvVarConfig] = field(default_factory=dict)
 
+    @property
+    def compose_base(self) -> str:
+        """Compose file base name (e.g. 'chronicle' for chronicle-compose.yaml)."""
+        return self.compose_file.stem.replace('-compose', '')
+
     @property
     def all_env_vars(self) -> List[ComposeEnvVar]:
         """Get all env vars (required + optional)."""
@@ -168,6 +211,17 @@ class DiscoveredService:
         )
 
 
+@dataclass
+class _ComposeFileEntry:
+    """Parse result for one compose file, plus what it was parsed from."""
+    path: Path
+    stat_key: Tuple[int, int, int]  # (inode, mtime_ns, size) when last checked
+    sha256: str  # Content hash the parse result belongs to
+    parsed: Optional[ParsedCompose] = None
+    services: Dict[str, DiscoveredService] = field(default_factory=dict)
+    error: Optional[str] = None
+
+
 # ============================================================================
 # Compose Service Registry
 # ============================================================================
@@ -190,70 +244,300 @@ class ComposeServiceRegistry:
             # Render UI form from schema
     """
 
-    def __init__(self, compose_dir: Optional[Path] = None):
+    def __init__(self, compose_dir: Optional[Path] = None, cache_dir: Optional[Path] = None):
         """
         Initialize the registry.
 
         Args:
             compose_dir: Directory containing compose files. Defaults to auto-detected.
+            cache_dir: Where the parsed catalog is cached between restarts.
+                Defaults to config/.cache.
         """
         self.compose_dir = compose_dir or COMPOSE_DIR
         self.parser = ComposeParser()
+        self._compiled = CompiledCache(cache_dir or _get_cache_dir())
+        # Loads may run from a worker thread (warm_up) and the event loop at once
+        self._lock = threading.RLock()
+        # Set while a ComposeWatcher keeps the registry in sync with the
+        # directory; callers can then skip defensive reload_if_changed() calls
+        self.watched = False
+        # Per-file parse results; only files whose content changed are re-parsed
+        self._files: Dict[str, _ComposeFileEntry] = {}  # compose file path -> entry
+        # Lookup tables assembled from _files after every change
         self._services: Dict[str, DiscoveredService] = {}
         self._compose_files: Dict[str, ParsedCompose] = {}
+        self._file_hashes: Dict[str, str] = {}  # compose file path -> content sha256
+        self._by_name: Dict[str, DiscoveredService] = {}
+        self._by_compose_base: Dict[str, List[DiscoveredService]] = {}
+        self._requiring: Dict[str, List[DiscoveredService]] = {}  # capability -> services
+        self._providing: Dict[str, List[DiscoveredService]] = {}  # capability -> services
         self._loaded = False
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """
+        Counter bumped every time the registry contents change.
+
+        Consumers can cache anything derived from the registry and rebuild
+        only when this value changes.
+        """
+        self._load()
+        return self._generation
 
     def _load(self) -> None:
-        """Load and parse all compose files."""
+        """Load and parse all compose files (first use only)."""
         if self._loaded:
             return
+        with self._lock:
+            if not self._loaded:
+                self._load_locked()
+
+    async def warm_up(self) -> None:
+        """Load the catalog on a worker thread, so first use doesn't block the event loop."""
+        if not self._loaded:
+            await asyncio.to_thread(self._load)
+
+    def _load_locked(self) -> None:
+        if not self.compose_dir.exists():
+            logger.warning(f"Compose directory not found: {self.compose_dir}")
+        on_disk = self._stat_files()
+        logger.info(f"Found {len(on_disk)} compose files in {self.compose_dir}")
+
+        # Hash each file once: for the cache key here and again in _sync
+        digests: Dict[str, Tuple[Tuple[int, int, int], str]] = {}
+        for key, (path, stat_key) in on_disk.items():
+            try:
+                digests[key] = (stat_key, hashlib.sha256(path.read_bytes()).hexdigest())
+            except OSError:
+                continue
 
-        self._discover_compose_files()
+        # Parsed catalog from a previous run, if no compose file changed since
+        catalog_key = self._catalog_key({key: sha256 for key, (_, sha256) in digests.items()})
+        compiled = self._compiled.load("compose", catalog_key, modules=self._modules)
+        if compiled is not None:
+            self._files = {key: self._restore_entry(data) for key, data in compiled.items()}
+
+        if not self._sync(digests=digests):
+            self._rebuild_indexes()
+            self._generation += 1
+        # Only now: readers that skip the lock on _loaded must see full indexes
         self._loaded = True
         logger.info(
             f"ComposeServiceRegistry loaded: {len(self._compose_files)} compose files, "
             f"{len(self._services)} services"
         )
 
+    @property
+    def _modules(self) -> List[str]:
+        """Modules whose code shapes the cached catalog."""
+        return [__name__, ComposeParser.__module__]
+
+    @staticmethod
+    def _catalog_key(hashes: Dict[str, str]) -> str:
+        """Cache key for a set of compose files and their content hashes."""
+        listing = "\n".join(f"{path}:{sha}" for path, sha in sorted(hashes.items()))
+        return hashlib.sha256(listing.encode()).hexdigest()
+
     def refresh(self) -> None:
-        """Refresh the registry by re-discovering compose files."""
+        """Refresh the registry, re-parsing compose files whose content changed."""
         logger.info("Refreshing ComposeServiceRegistry...")
-        self._services.clear()
-        self._compose_files.clear()
-        self._loaded = False
-        self._load()
+        self.reload()
         logger.info(f"ComposeServiceRegistry refreshed: {len(self._services)} services")
 
-    def _discover_compose_files(self) -> None:
-        """Discover and parse compose files in the compose directory."""
+    def _find_compose_files(self) -> List[Path]:
+        """List compose files (pattern: *-compose.yaml or *-compose.yml)."""
         if not self.compose_dir.exists():
-            logger.warning(f"Compose directory not found: {self.compose_dir}")
-            return
+            return []
 
-        # Find compose files (pattern: *-compose.yaml or *-compose.yml)
         patterns = ["*-compose.yaml", "*-compose.yml"]
         compose_files = []
         for pattern in patterns:
             compose_files.extend(self.compose_dir.glob(pattern))
+        return sorted(compose_files)
+
+    def _stat_files(self) -> Dict[str, Tuple[Path, Tuple[int, int, int]]]:
+        """(path, (inode, mtime_ns, size)) of each compose file, keyed by path."""
+        on_disk: Dict[str, Tuple[Path, Tuple[int, int, int]]] = {}
+        for path in self._find_compose_files():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            on_disk[str(path)] = (path, (stat.st_ino, stat.st_mtime_ns, stat.st_size))
+        return on_disk
+
+    def stat_signature(self) -> Tuple:
+        """
+        Cheap fingerprint of the compose directory (file list and stats).
+
+        Changes whenever a compose file is added, removed or modified; used
+        by the directory watcher's polling mode.
+        """
+        return tuple((key, stat_key) for key, (_, stat_key) in self._stat_files().items())
+
+    def _sync(
+        self,
+        verify: bool = False,
+        digests: Optional[Dict[str, Tuple[Tuple[int, int, int], str]]] = None,
+    ) -> bool:
+        """
+        Bring the parsed files in line with the compose directory.
+
+        Files with an unchanged (inode, mtime, size) are skipped without
+        being read, unless verify is set. Other files are hashed and only
+        re-parsed when their content actually changed.
+
+        Args:
+            verify: Hash every file, even if its stat is unchanged
+            digests: Content hashes already computed by the caller, as
+                path -> (stat_key, sha256); reused while the stat still matches
+
+        Returns:
+            True if a file was added, removed or re-parsed
+        """
+        on_disk = self._stat_files()
+        changed = set(self._files) - set(on_disk)
+        for key in changed:
+            del self._files[key]
+            logger.info(f"Compose file removed: {key}")
+
+        to_parse: List[Tuple[str, Path, Tuple[int, int, int], str]] = []
+        for key, (path, stat_key) in on_disk.items():
+            entry = self._files.get(key)
+            if entry is not None and entry.stat_key == stat_key and not verify:
+                continue
+            known = (digests or {}).get(key)
+            try:
+                if known is not None and known[0] == stat_key:
+                    sha256 = known[1]
+                else:
+                    sha256 = hashlib.sha256(path.read_bytes()).hexdigest()
+            except OSError:
+                # Removed between listing and reading
+                if self._files.pop(key, None) is not None:
+                    changed.add(key)
+                continue
+            if entry is not None and entry.sha256 == sha256:
+                # Touched but not modified - keep the parse result
+                entry.stat_key = stat_key
+                continue
+            to_parse.append((key, path, stat_key, sha256))
+
+        results = self._parse_files([path for _, path, _, _ in to_parse])
+        for (key, path, stat_key, sha256), (parsed, error) in zip(to_parse, results):
+            self._files[key] = self._build_entry(path, stat_key, sha256, parsed, error)
+            changed.add(key)
+
+        if not changed:
+            return False
+
+        # Keep file order deterministic (sorted by path) however files were added
+        self._files = {key: self._files[key] for key in on_disk if key in self._files}
+
+        self._rebuild_indexes()
+        self._generation += 1
+        self._compiled.store(
+            "compose",
+            self._catalog_key(self._file_hashes),
+            {key: self._compile_entry(entry) for key, entry in self._files.items()},
+            modules=self._modules,
+        )
+        logger.debug(f"Compose files changed: {sorted(changed)}")
+        return True
 
-        logger.info(f"Found {len(compose_files)} compose files in {self.compose_dir}")
+    def _rebuild_indexes(self) -> None:
+        """Assemble the lookup tables from the per-file entries."""
+        services: Dict[str, DiscoveredService] = {}
+        compose_files: Dict[str, ParsedCompose] = {}
+        file_hashes: Dict[str, str] = {}
+        for key, entry in self._files.items():
+            file_hashes[key] = entry.sha256
+            if entry.parsed is not None:
+                compose_files[key] = entry.parsed
+            services.update(entry.services)
+
+        by_name: Dict[str, DiscoveredService] = {}
+        by_compose_base: Dict[str, List[DiscoveredService]] = {}
+        requiring: Dict[str, List[DiscoveredService]] = {}
+        providing: Dict[str, List[DiscoveredService]] = {}
+        for service in services.values():
+            # First match wins, as with the previous linear scan
+            by_name.setdefault(service.service_name, service)
+            by_compose_base.setdefault(service.compose_base, []).append(service)
+            for capability in dict.fromkeys(service.requires):
+                requiring.setdefault(capability, []).append(service)
+            if service.provides:
+                providing.setdefault(service.provides, []).append(service)
+
+        # Replace rather than mutate, so callers iterating the old tables are unaffected
+        self._services = services
+        self._compose_files = compose_files
+        self._file_hashes = file_hashes
+        self._by_name = by_name
+        self._by_compose_base = by_compose_base
+        self._requiring = requiring
+        self._providing = providing
+
+    def _parse_files(self, paths: List[Path]) -> List[Tuple[Optional[ParsedCompose], Optional[str]]]:
+        """
+        Parse compose files, in a process pool when there are enough of them.
 
-        for compose_file in compose_files:
+        Returns:
+            (parsed, error) per path, in the same order as paths
+        """
+        workers = min(PARALLEL_PARSE_MAX_WORKERS, len(paths))
+        if len(paths) >= PARALLEL_PARSE_MIN_FILES and workers > 1:
             try:
-                self._load_compose_file(compose_file)
+                return self._parse_files_parallel(paths, workers)
             except Exception as e:
-                logger.error(f"Failed to parse {compose_file}: {e}")
+                logger.warning(f"Parallel compose parsing failed, parsing serially: {e}")
 
-    def _load_compose_file(self, filepath: Path) -> None:
-        """Load and parse a single compose file."""
-        parsed = self.parser.parse(filepath)
+        results = []
+        for path in paths:
+            try:
+                results.append((self.parser.parse(path), None))
+            except Exception as e:
+                results.append((None, str(e)))
+        return results
+
+    @staticmethod
+    def _parse_files_parallel(
+        paths: List[Path],
+        workers: int,
+    ) -> List[Tuple[Optional[ParsedCompose], Optional[str]]]:
+        # Workers are forked from a clean server process (never from this
+        # multi-threaded one); the parser module is imported there once
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+        if context.get_start_method() == "forkserver":
+            context.set_forkserver_preload([__name__])
+
+        logger.info(f"Parsing {len(paths)} compose files with {workers} workers")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            chunksize = max(1, len(paths) // (workers * 4))
+            return list(pool.map(_parse_in_worker, [str(p) for p in paths], chunksize=chunksize))
+
+    def _build_entry(
+        self,
+        filepath: Path,
+        stat_key: Tuple[int, int, int],
+        sha256: str,
+        parsed: Optional[ParsedCompose],
+        error: Optional[str] = None,
+    ) -> _ComposeFileEntry:
+        """Turn one file's parse result into an entry with its discovered services."""
+        entry = _ComposeFileEntry(path=filepath, stat_key=stat_key, sha256=sha256)
+        if parsed is None:
+            entry.error = f"Failed to parse {filepath}: {error}"
+            logger.error(entry.error)
+            return entry
 
         if not parsed.services:
             logger.warning(f"No services found in {filepath}")
-            return
+            return entry
 
-        # Store parsed compose
-        self._compose_files[str(filepath)] = parsed
+        entry.parsed = parsed
 
         # Extract services
         for name, service in parsed.services.items():
@@ -265,6 +549,7 @@ class ComposeServiceRegistry:
                 compose_file=filepath,
                 image=service.image,
                 requires=service.requires,
+                provides=service.provides,
                 depends_on=service.depends_on,
                 profiles=service.profiles,
                 ports=service.ports,
@@ -277,15 +562,82 @@ class ComposeServiceRegistry:
                 optional_env_vars=service.optional_env_vars,
             )
 
-            self._services[service_id] = discovered
+            entry.services[service_id] = discovered
             logger.debug(f"Discovered service: {service_id} (display: {service.display_name})")
 
+        return entry
+
+    @staticmethod
+    def _compile_entry(entry: _ComposeFileEntry) -> Dict[str, Any]:
+        """One file's parse result as plain JSON data, for the compiled cache."""
+        parsed = None
+        if entry.parsed is not None:
+            parsed = asdict(entry.parsed)
+            parsed["path"] = str(entry.parsed.path)
+        return {
+            "path": str(entry.path),
+            "stat_key": list(entry.stat_key),
+            "sha256": entry.sha256,
+            "parsed": parsed,
+            "error": entry.error,
+        }
+
+    def _restore_entry(self, data: Dict[str, Any]) -> _ComposeFileEntry:
+        """Rebuild an entry, and its discovered services, from _compile_entry() output."""
+        path = Path(data["path"])
+        stat_key = tuple(data["stat_key"])
+        if data["error"]:
+            # Same file, same problem - keep it visible on every start
+            logger.error(data["error"])
+            return _ComposeFileEntry(path=path, stat_key=stat_key, sha256=data["sha256"], error=data["error"])
+        if data["parsed"] is None:
+            # Parsed, but declared no services
+            return self._build_entry(path, stat_key, data["sha256"], ParsedCompose(path=path))
+
+        parsed = dict(data["parsed"])
+        parsed["path"] = Path(parsed["path"])
+        parsed["services"] = {
+            name: ComposeService(**{
+                **service,
+                "env_vars": [ComposeEnvVar(**env_var) for env_var in service["env_vars"]],
+            })
+            for name, service in parsed["services"].items()
+        }
+        return self._build_entry(path, stat_key, data["sha256"], ParsedCompose(**parsed))
+
     def reload(self) -> None:
-        """Force reload from compose files."""
-        self._loaded = False
-        self._services = {}
-        self._compose_files = {}
+        """
+        Re-read all compose files, re-parsing only those whose content changed.
+
+        Unlike reload_if_changed(), every file is hashed, so edits that kept
+        the same mtime and size are picked up too.
+        """
+        with self._lock:
+            if not self._loaded:
+                self._load()
+                return
+            self._sync(verify=True)
+
+    def reload_if_changed(self) -> bool:
+        """
+        Re-parse compose files that were added, removed or modified.
+
+        Uses each file's stat (inode, mtime, size), so the common "nothing
+        changed" case costs a directory listing and a few stat calls.
+
+        Returns:
+            True if the registry contents changed
+        """
+        with self._lock:
+            if not self._loaded:
+                self._load()
+                return True
+            return self._sync()
+
+    def get_compose_file_hash(self, compose_file: Path) -> Optional[str]:
+        """Get the content hash of a loaded compose file."""
         self._load()
+        return self._file_hashes.get(str(compose_file))
 
     # ========================================================================
     # Query Methods
@@ -330,10 +682,21 @@ class ComposeServiceRegistry:
             DiscoveredService or None
         """
         self._load()
-        for service in self._services.values():
-            if service.service_name == service_name:
-                return service
-        return None
+        return self._by_name.get(service_name)
+
+    def get_services_by_compose_base(self, compose_base: str) -> List[DiscoveredService]:
+        """
+        Get the services defined in a compose file, by its base name.
+
+        Args:
+            compose_base: Compose file name without '-compose' and extension
+                          (e.g., 'chronicle' for chronicle-compose.yaml)
+
+        Returns:
+            List of services in that compose file
+        """
+        self._load()
+        return list(self._by_compose_base.get(compose_base, []))
 
     def get_services_requiring(self, capability: str) -> List[DiscoveredService]:
         """
@@ -346,7 +709,20 @@ class ComposeServiceRegistry:
             List of services requiring that capability
         """
         self._load()
-        return [s for s in self._services.values() if capability in s.requires]
+        return list(self._requiring.get(capability, []))
+
+    def get_services_providing(self, capability: str) -> List[DiscoveredService]:
+        """
+        Get all services that implement a specific capability.
+
+        Args:
+            capability: Capability name (e.g., 'memory')
+
+        Returns:
+            List of services whose x-ushadow `provides` matches
+        """
+        self._load()
+        return list(self._providing.get(capability, []))
 
     def get_compose_file(self, filepath: str) -> Optional[ParsedCompose]:
         """
@@ -372,10 +748,8 @@ class ComposeServiceRegistry:
             List of services in that compose file
         """
         self._load()
-        return [
-            s for s in self._services.values()
-            if s.compose_file == compose_file
-        ]
+        entry = self._files.get(str(compose_file))
+        return list(entry.services.values()) if entry else []
 
     # ========================================================================
     # Environment Variable Resolution
@@ -0,0 +1,178 @@
+"""Background watcher that keeps the compose registry in sync with its directory.
+
+New, edited and removed *-compose.yaml files are picked up within about a
+second, so callers don't need to reload the registry defensively:
+
+- inotify events via watchfiles (installed with uvicorn[standard]) when available
+- otherwise polling the compose files' stats once per interval
+
+Bursts of changes (editor save sequences, git checkouts) are debounced into
+one reload, which re-parses only the files whose content changed and bumps
+the registry generation.
+"""
+
+import asyncio
+import logging
+import os
+from pathlib import Path
+from typing import Optional
+
+from src.services.compose_registry import ComposeServiceRegistry, get_compose_registry
+
+try:
+    from watchfiles import awatch
+except ImportError:
+    awatch = None
+
+logger = logging.getLogger(__name__)
+
+# Quiet period that ends a burst of changes (seconds)
+DEFAULT_DEBOUNCE = float(os.environ.get("COMPOSE_WATCH_DEBOUNCE", "0.3"))
+
+# Stat polling interval when inotify isn't available (seconds, 0 disables the watcher)
+DEFAULT_POLL_INTERVAL = float(os.environ.get("COMPOSE_WATCH_POLL_INTERVAL", "1.0"))
+
+# Force polling, e.g. for bind mounts that don't deliver inotify events
+FORCE_POLLING = os.environ.get("COMPOSE_WATCH_POLLING", "").lower() in ("true", "1", "yes")
+
+COMPOSE_FILE_SUFFIXES = ("-compose.yaml", "-compose.yml")
+
+
+def _is_compose_file(change, path: str) -> bool:
+    """watchfiles filter: only compose files in the watched directory."""
+    return Path(path).name.endswith(COMPOSE_FILE_SUFFIXES)
+
+
+class ComposeWatcher:
+    """
+    Watches the compose directory and applies changes to the registry.
+
+    Usage:
+        watcher = get_compose_watcher()
+        watcher.start()
+        ...
+        await watcher.stop()
+    """
+
+    def __init__(
+        self,
+        registry: Optional[ComposeServiceRegistry] = None,
+        debounce: float = DEFAULT_DEBOUNCE,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        force_polling: bool = FORCE_POLLING,
+    ):
+        self._registry = registry or get_compose_registry()
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.force_polling = force_polling
+        self._task: Optional[asyncio.Task] = None
+        self.mode: Optional[str] = None  # "inotify" / "polling" while running
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start watching on the running event loop (idempotent)."""
+        if self.poll_interval <= 0:
+            logger.info("Compose directory watcher disabled")
+            return
+        if self.is_running:
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        try:
+            if awatch is not None and not self.force_polling and self._registry.compose_dir.exists():
+                try:
+                    await self._watch_events()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.warning(f"Compose directory events unavailable, polling instead: {e}")
+            await self._poll()
+        finally:
+            self._registry.watched = False
+            self.mode = None
+
+    async def _set_watched(self) -> None:
+        """Mark the registry as kept in sync, catching up on changes made before."""
+        self._registry.watched = True
+        await self._reload()
+
+    async def _watch_events(self) -> None:
+        """Reload after each debounced batch of filesystem events."""
+        self.mode = "inotify"
+        logger.info(f"Watching {self._registry.compose_dir} for compose file changes")
+        try:
+            # Timeouts yield an empty batch - the first one shows the watch is up
+            async for changes in awatch(
+                self._registry.compose_dir,
+                watch_filter=_is_compose_file,
+                debounce=int(self.debounce * 1000),
+                rust_timeout=int(self.poll_interval * 1000),
+                yield_on_timeout=True,
+                recursive=False,
+            ):
+                if not self._registry.watched:
+                    await self._set_watched()
+                elif changes:
+                    await self._reload()
+            # The iterator ends if the directory goes away
+            logger.warning(f"Stopped receiving events for {self._registry.compose_dir}")
+        finally:
+            self._registry.watched = False
+
+    async def _poll(self) -> None:
+        """Reload when the compose files' stats change and then settle."""
+        self.mode = "polling"
+        logger.info(f"Polling {self._registry.compose_dir} for compose file changes every {self.poll_interval}s")
+        last = await asyncio.to_thread(self._registry.stat_signature)
+        await self._set_watched()
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            current = await asyncio.to_thread(self._registry.stat_signature)
+            if current == last:
+                continue
+
+            # Debounce: wait until the files stop changing
+            while True:
+                await asyncio.sleep(self.debounce)
+                settled = await asyncio.to_thread(self._registry.stat_signature)
+                if settled == current:
+                    break
+                current = settled
+
+            last = current
+            await self._reload()
+
+    async def _reload(self) -> None:
+        try:
+            changed = await asyncio.to_thread(self._registry.reload_if_changed)
+        except Exception as e:
+            logger.warning(f"Compose registry reload failed: {e}")
+            return
+        if changed:
+            logger.info(f"Compose catalog updated (generation {self._registry.generation})")
+
+
+# Global instance
+_compose_watcher: Optional[ComposeWatcher] = None
+
+
+def get_compose_watcher() -> ComposeWatcher:
+    """Get the global ComposeWatcher instance."""
+    global _compose_watcher
+    if _compose_watcher is None:
+        _compose_watcher = ComposeWatcher()
+    return _compose_watcher
@@ -0,0 +1,417 @@
+"""Event-driven container state cache for DockerManager.
+
+Keeps an in-memory view of every container on the Docker host so that
+status and health reads cost zero daemon round-trips.
+
+The cache is:
+1. Seeded once from a single `GET /containers/json?all=1` call
+2. Kept current by a background thread subscribed to the Docker events
+   stream (create/start/stop/die/health_status/destroy/...)
+
+If the events stream drops, the cache marks itself as not live, reconnects
+with backoff and re-seeds, so readers can fall back to direct API calls
+while it recovers.
+"""
+
+import copy
+import logging
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from docker.errors import NotFound
+
+logger = logging.getLogger(__name__)
+
+# Compose labels used to map containers back to services
+COMPOSE_PROJECT_LABEL = "com.docker.compose.project"
+COMPOSE_SERVICE_LABEL = "com.docker.compose.service"
+
+# Container event actions that change state we care about
+TRACKED_ACTIONS = {
+    "create", "start", "restart", "stop", "die", "kill", "oom",
+    "pause", "unpause", "rename", "update", "destroy",
+}
+
+# Health from the list endpoint's human status, e.g. "Up 5 minutes (healthy)"
+_STATUS_HEALTH_PATTERN = re.compile(r"\((healthy|unhealthy|health: starting)\)")
+
+# Backoff bounds (seconds) when the events stream fails
+_RECONNECT_MIN_DELAY = 1.0
+_RECONNECT_MAX_DELAY = 30.0
+
+
+def _parse_docker_timestamp(value: Any) -> Optional[datetime]:
+    """Parse a Docker timestamp (unix int or RFC3339 with nanoseconds)."""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value, tz=timezone.utc)
+    try:
+        text = str(value).replace("Z", "+00:00")
+        # Python only accepts up to microseconds - trim Docker's nanoseconds
+        match = re.match(r"^(.*\.\d{6})\d*(.*)$", text)
+        if match:
+            text = match.group(1) + match.group(2)
+        return datetime.fromisoformat(text)
+    except ValueError:
+        return None
+
+
+@dataclass(frozen=True)
+class ContainerState:
+    """Immutable snapshot of a single container's state."""
+
+    id: str
+    name: str
+    status: str
+    health: Optional[str]
+    image: Optional[str]
+    created: Optional[datetime]
+    ports: Dict[str, str] = field(default_factory=dict)  # "8000/tcp" -> "8080"
+    labels: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def short_id(self) -> str:
+        return self.id[:12]
+
+    @property
+    def compose_project(self) -> Optional[str]:
+        return self.labels.get(COMPOSE_PROJECT_LABEL)
+
+    @property
+    def compose_service(self) -> Optional[str]:
+        return self.labels.get(COMPOSE_SERVICE_LABEL)
+
+    @property
+    def host_ports(self) -> List[int]:
+        """Host ports published by this container."""
+        result = []
+        for host_port in self.ports.values():
+            try:
+                result.append(int(host_port))
+            except (TypeError, ValueError):
+                continue
+        return result
+
+    @classmethod
+    def from_list_entry(cls, entry: Dict[str, Any]) -> "ContainerState":
+        """Build from an item of the `GET /containers/json` response."""
+        names = entry.get("Names") or []
+        name = names[0].lstrip("/") if names else entry.get("Id", "")[:12]
+
+        ports: Dict[str, str] = {}
+        for port in entry.get("Ports") or []:
+            public_port = port.get("PublicPort")
+            if public_port:
+                ports[f"{port.get('PrivatePort')}/{port.get('Type', 'tcp')}"] = str(public_port)
+
+        health = None
+        match = _STATUS_HEALTH_PATTERN.search(entry.get("Status") or "")
+        if match:
+            health = "starting" if match.group(1) == "health: starting" else match.group(1)
+
+        return cls(
+            id=entry.get("Id", ""),
+            name=name,
+            status=(entry.get("State") or "unknown").lower(),
+            health=health,
+            image=entry.get("Image"),
+            created=_parse_docker_timestamp(entry.get("Created")),
+            ports=ports,
+            labels=dict(entry.get("Labels") or {}),
+        )
+
+    @classmethod
+    def from_inspect(cls, attrs: Dict[str, Any]) -> "ContainerState":
+        """Build from a `GET /containers/{id}/json` response."""
+        state = attrs.get("State") or {}
+        config = attrs.get("Config") or {}
+
+        ports: Dict[str, str] = {}
+        for container_port, bindings in ((attrs.get("NetworkSettings") or {}).get("Ports") or {}).items():
+            for binding in bindings or []:
+                host_port = binding.get("HostPort")
+                if host_port:
+                    ports[container_port] = host_port
+
+        health = (state.get("Health") or {}).get("Status")
+
+        return cls(
+            id=attrs.get("Id", ""),
+            name=(attrs.get("Name") or "").lstrip("/"),
+            status=(state.get("Status") or "unknown").lower(),
+            health=health,
+            image=config.get("Image"),
+            created=_parse_docker_timestamp(attrs.get("Created")),
+            ports=ports,
+            labels=dict(config.get("Labels") or {}),
+        )
+
+
+class ContainerSnapshot:
+    """
+    Point-in-time view of all containers with lookup indexes.
+
+    Indexes:
+    - by container name
+    - by compose service label
+    - by (compose project, compose service) label pair
+    """
+
+    def __init__(self, containers: Iterable[ContainerState], taken_at: Optional[float] = None):
+        self.taken_at = taken_at if taken_at is not None else time.time()
+        self._by_id: Dict[str, ContainerState] = {}
+        self._by_name: Dict[str, ContainerState] = {}
+        self._by_service: Dict[str, List[ContainerState]] = {}
+        self._by_project_service: Dict[Tuple[str, str], ContainerState] = {}
+
+        for container in containers:
+            self._by_id[container.id] = container
+            self._by_name[container.name] = container
+            service = container.compose_service
+            if service:
+                self._by_service.setdefault(service, []).append(container)
+                project = container.compose_project or ""
+                self._by_project_service.setdefault((project, service), container)
+
+    @classmethod
+    def from_list(cls, entries: Iterable[Dict[str, Any]]) -> "ContainerSnapshot":
+        """Build a snapshot from a raw `GET /containers/json` response."""
+        return cls(ContainerState.from_list_entry(entry) for entry in entries)
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def containers(self) -> List[ContainerState]:
+        """All containers in the snapshot."""
+        return list(self._by_id.values())
+
+    def get(self, name: str) -> Optional[ContainerState]:
+        """Get a container by exact name."""
+        return self._by_name.get(name)
+
+    def get_by_id(self, container_id: str) -> Optional[ContainerState]:
+        return self._by_id.get(container_id)
+
+    def for_compose_service(self, service_name: str) -> List[ContainerState]:
+        """All containers carrying a compose service label."""
+        return list(self._by_service.get(service_name, []))
+
+    def replace(self, container_id: str, container: Optional[ContainerState]) -> "ContainerSnapshot":
+        """
+        Copy of this snapshot with one container added, updated or removed (None).
+
+        Only that container's index entries are recomputed; everything else
+        is shared with this snapshot, which readers may still be holding.
+        """
+        old = self._by_id.get(container_id)
+        snapshot = copy.copy(self)
+        snapshot.taken_at = time.time()
+        snapshot._by_id = dict(self._by_id)
+        snapshot._by_name = dict(self._by_name)
+        snapshot._by_service = dict(self._by_service)
+        snapshot._by_project_service = dict(self._by_project_service)
+
+        if old is not None and snapshot._by_name.get(old.name) is old:
+            del snapshot._by_name[old.name]
+        if container is None:
+            snapshot._by_id.pop(container_id, None)
+        else:
+            snapshot._by_id[container_id] = container
+            snapshot._by_name[container.name] = container
+
+        for service in {c.compose_service for c in (old, container) if c is not None} - {None}:
+            members = list(self._by_service.get(service, []))
+            index = next((i for i, c in enumerate(members) if c.id == container_id), None)
+            if container is not None and container.compose_service == service:
+                if index is None:
+                    members.append(container)
+                else:
+                    members[index] = container
+            elif index is not None:
+                del members[index]
+
+            if members:
+                snapshot._by_service[service] = members
+            else:
+                snapshot._by_service.pop(service, None)
+
+            # The first container of a project keeps the (project, service) slot
+            projects = {
+                c.compose_project or "" for c in (old, container)
+                if c is not None and c.compose_service == service
+            }
+            for project in projects:
+                first = next((c for c in members if (c.compose_project or "") == project), None)
+                if first is None:
+                    snapshot._by_project_service.pop((project, service), None)
+                else:
+                    snapshot._by_project_service[(project, service)] = first
+
+        return snapshot
+
+    def find_compose_service(
+        self,
+        service_name: str,
+        projects: List[str],
+    ) -> Optional[ContainerState]:
+        """
+        Find a compose service container, preferring projects in order.
+
+        Returns None if no container for the service is in any of the projects.
+        """
+        for project in projects:
+            container = self._by_project_service.get((project, service_name))
+            if container:
+                return container
+        return None
+
+
+class ContainerStateCache:
+    """
+    In-memory container state kept current by the Docker events stream.
+
+    Usage:
+        cache = ContainerStateCache(client)
+        cache.start()
+        snapshot = cache.snapshot()  # None until seeded and live
+    """
+
+    def __init__(self, client):
+        self._client = client
+        self._lock = threading.Lock()
+        self._snapshot = ContainerSnapshot(())
+        self._live = False
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stream = None
+
+    @property
+    def is_live(self) -> bool:
+        """True once seeded and while the events stream is connected."""
+        return self._live
+
+    def snapshot(self) -> Optional[ContainerSnapshot]:
+        """Current snapshot, or None if the cache is not live."""
+        if not self._live:
+            return None
+        return self._snapshot
+
+    def start(self) -> None:
+        """Start the background events subscriber (idempotent)."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="docker-events", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background subscriber."""
+        self._stop.set()
+        self._live = False
+        stream = self._stream
+        if stream is not None:
+            try:
+                stream.close()
+            except Exception:
+                pass
+
+    # =========================================================================
+    # Background subscriber
+    # =========================================================================
+
+    def _run(self) -> None:
+        delay = _RECONNECT_MIN_DELAY
+        while not self._stop.is_set():
+            try:
+                # Subscribe from just before seeding so nothing is missed in between
+                since = int(time.time()) - 1
+                self._seed()
+                self._stream = self._client.api.events(
+                    since=since,
+                    filters={"type": "container"},
+                    decode=True,
+                )
+                self._live = True
+                delay = _RECONNECT_MIN_DELAY
+                logger.info(f"Container state cache live: {len(self._snapshot)} containers")
+
+                for event in self._stream:
+                    if self._stop.is_set():
+                        break
+                    self._handle_event(event)
+
+            except Exception as e:
+                if self._stop.is_set():
+                    break
+                logger.warning(f"Docker events stream failed: {e}")
+            finally:
+                self._live = False
+                self._stream = None
+
+            if not self._stop.is_set():
+                self._stop.wait(delay)
+                delay = min(delay * 2, _RECONNECT_MAX_DELAY)
+
+    def _seed(self) -> None:
+        """Seed from one full container listing."""
+        snapshot = ContainerSnapshot.from_list(self._client.api.containers(all=True))
+        with self._lock:
+            self._snapshot = snapshot
+
+    def _handle_event(self, event: Dict[str, Any]) -> None:
+        action = event.get("Action") or event.get("status") or ""
+        actor = event.get("Actor") or {}
+        container_id = actor.get("ID") or event.get("id")
+        if not container_id:
+            return
+
+        if action == "destroy":
+            self._remove(container_id)
+            return
+
+        if action.startswith("health_status"):
+            # "health_status: healthy" - update in place, no API call needed
+            health = action.split(":", 1)[1].strip() if ":" in action else None
+            current = self._snapshot.get_by_id(container_id)
+            if current:
+                self._upsert(ContainerState(
+                    id=current.id,
+                    name=current.name,
+                    status=current.status,
+                    health=health,
+                    image=current.image,
+                    created=current.created,
+                    ports=current.ports,
+                    labels=current.labels,
+                ))
+                return
+
+        elif action.split(":", 1)[0] not in TRACKED_ACTIONS:
+            return
+
+        # State change - one inspect for this container only
+        try:
+            attrs = self._client.api.inspect_container(container_id)
+        except NotFound:
+            self._remove(container_id)
+            return
+        self._upsert(ContainerState.from_inspect(attrs))
+
+    def _upsert(self, state: ContainerState) -> None:
+        with self._lock:
+            self._snapshot = self._snapshot.replace(state.id, state)
+        logger.debug(f"Container state updated: {state.name} -> {state.status} ({state.health})")
+
+    def _remove(self, container_id: str) -> None:
+        with self._lock:
+            if self._snapshot.get_by_id(container_id) is None:
+                return
+            self._snapshot = self._snapshot.replace(container_id, None)
+        logger.debug(f"Container removed from state cache: {container_id[:12]}")
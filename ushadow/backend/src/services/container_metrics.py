@@ -0,0 +1,457 @@
+"""Per-service container resource telemetry.
+
+A background collector polls the Docker stats API for every running
+managed container (one-shot reads on the Docker executor, a few at a time
+so interactive calls aren't queued behind telemetry, one round per
+interval) and keeps samples in fixed-size in-memory ring buffers per
+service:
+
+- fine:   one sample per interval (default 5s), last hour
+- coarse: one downsampled sample per minute, last 24 hours
+
+Coarse samples keep both the mean and the peak of CPU and memory for the
+minute, so right-sizing decisions aren't hidden by averaging.
+
+Nothing is persisted; history starts when the backend starts.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional
+
+from src.services.docker_manager import DockerManager, ServiceStatus, get_docker_manager
+
+logger = logging.getLogger(__name__)
+
+# Seconds between collection rounds (0 disables the collector)
+DEFAULT_INTERVAL = float(os.environ.get("CONTAINER_METRICS_INTERVAL", "5"))
+
+# Stats reads in flight at once - the Docker executor is shared with
+# start/stop/status requests, so telemetry must never fill it
+STATS_CONCURRENCY = int(os.environ.get("CONTAINER_METRICS_CONCURRENCY", "2"))
+
+# Ring buffer sizes
+FINE_RETENTION = 3600          # seconds kept at full resolution
+COARSE_RESOLUTION = 60         # seconds per downsampled sample
+COARSE_RETENTION = 24 * 3600   # seconds kept at coarse resolution
+
+RESOLUTION_FINE = "fine"
+RESOLUTION_COARSE = "coarse"
+
+
+@dataclass
+class MetricSample:
+    """Resource usage of one service's container at (or over) a point in time."""
+
+    timestamp: float
+    cpu_percent: float
+    memory_bytes: int
+    memory_limit_bytes: int
+    net_rx_bps: float = 0.0
+    net_tx_bps: float = 0.0
+    block_read_bps: float = 0.0
+    block_write_bps: float = 0.0
+    # Peaks within the sample window (same as the values for fine samples)
+    cpu_percent_max: Optional[float] = None
+    memory_bytes_max: Optional[int] = None
+
+    def __post_init__(self):
+        if self.cpu_percent_max is None:
+            self.cpu_percent_max = self.cpu_percent
+        if self.memory_bytes_max is None:
+            self.memory_bytes_max = self.memory_bytes
+
+    @property
+    def memory_percent(self) -> float:
+        if not self.memory_limit_bytes:
+            return 0.0
+        return self.memory_bytes / self.memory_limit_bytes * 100
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "timestamp": self.timestamp,
+            "cpu_percent": round(self.cpu_percent, 2),
+            "cpu_percent_max": round(self.cpu_percent_max, 2),
+            "memory_bytes": self.memory_bytes,
+            "memory_bytes_max": self.memory_bytes_max,
+            "memory_limit_bytes": self.memory_limit_bytes,
+            "memory_percent": round(self.memory_percent, 2),
+            "net_rx_bps": round(self.net_rx_bps, 1),
+            "net_tx_bps": round(self.net_tx_bps, 1),
+            "block_read_bps": round(self.block_read_bps, 1),
+            "block_write_bps": round(self.block_write_bps, 1),
+        }
+
+    @classmethod
+    def average(cls, samples: List["MetricSample"], timestamp: float) -> "MetricSample":
+        """Downsample: means of the rates/usage, peaks of CPU and memory."""
+        n = len(samples)
+        return cls(
+            timestamp=timestamp,
+            cpu_percent=sum(s.cpu_percent for s in samples) / n,
+            memory_bytes=int(sum(s.memory_bytes for s in samples) / n),
+            memory_limit_bytes=samples[-1].memory_limit_bytes,
+            net_rx_bps=sum(s.net_rx_bps for s in samples) / n,
+            net_tx_bps=sum(s.net_tx_bps for s in samples) / n,
+            block_read_bps=sum(s.block_read_bps for s in samples) / n,
+            block_write_bps=sum(s.block_write_bps for s in samples) / n,
+            cpu_percent_max=max(s.cpu_percent_max for s in samples),
+            memory_bytes_max=max(s.memory_bytes_max for s in samples),
+        )
+
+
+@dataclass
+class _RawCounters:
+    """Cumulative counters from the previous stats read (for rate/CPU deltas)."""
+
+    container_id: str
+    timestamp: float
+    cpu_total: int
+    system_cpu: int
+    net_rx: int
+    net_tx: int
+    block_read: int
+    block_write: int
+
+
+def _memory_usage(memory_stats: Dict[str, Any]) -> int:
+    """Working-set memory, as `docker stats` reports it (usage minus page cache)."""
+    usage = memory_stats.get("usage") or 0
+    stats = memory_stats.get("stats") or {}
+    # cgroup v2: inactive_file, cgroup v1: total_inactive_file / cache
+    cache = stats.get("inactive_file", stats.get("total_inactive_file", stats.get("cache", 0)))
+    return max(0, usage - (cache or 0))
+
+
+def _read_counters(container_id: str, stats: Dict[str, Any], timestamp: float) -> _RawCounters:
+    cpu_stats = stats.get("cpu_stats") or {}
+
+    net_rx = net_tx = 0
+    for network in (stats.get("networks") or {}).values():
+        net_rx += network.get("rx_bytes", 0)
+        net_tx += network.get("tx_bytes", 0)
+
+    block_read = block_write = 0
+    for entry in (stats.get("blkio_stats") or {}).get("io_service_bytes_recursive") or []:
+        op = (entry.get("op") or "").lower()
+        if op == "read":
+            block_read += entry.get("value", 0)
+        elif op == "write":
+            block_write += entry.get("value", 0)
+
+    return _RawCounters(
+        container_id=container_id,
+        timestamp=timestamp,
+        cpu_total=(cpu_stats.get("cpu_usage") or {}).get("total_usage", 0),
+        system_cpu=cpu_stats.get("system_cpu_usage", 0),
+        net_rx=net_rx,
+        net_tx=net_tx,
+        block_read=block_read,
+        block_write=block_write,
+    )
+
+
+def _cpu_percent(cpu_delta: int, system_delta: int, online_cpus: int) -> float:
+    if cpu_delta <= 0 or system_delta <= 0:
+        return 0.0
+    return cpu_delta / system_delta * online_cpus * 100
+
+
+def sample_from_stats(
+    stats: Dict[str, Any],
+    counters: _RawCounters,
+    previous: Optional[_RawCounters],
+) -> MetricSample:
+    """
+    Build a sample from a Docker stats response.
+
+    CPU and I/O rates are deltas against the previous read of the same
+    container; on the first read CPU falls back to precpu_stats (when the
+    daemon filled it in) and rates are zero.
+    """
+    cpu_stats = stats.get("cpu_stats") or {}
+    online_cpus = cpu_stats.get("online_cpus") or len(
+        (cpu_stats.get("cpu_usage") or {}).get("percpu_usage") or []
+    ) or 1
+    memory_stats = stats.get("memory_stats") or {}
+
+    net_rx_bps = net_tx_bps = block_read_bps = block_write_bps = 0.0
+    if previous is not None and previous.container_id == counters.container_id:
+        cpu_percent = _cpu_percent(
+            counters.cpu_total - previous.cpu_total,
+            counters.system_cpu - previous.system_cpu,
+            online_cpus,
+        )
+        elapsed = counters.timestamp - previous.timestamp
+        if elapsed > 0:
+            net_rx_bps = max(0, counters.net_rx - previous.net_rx) / elapsed
+            net_tx_bps = max(0, counters.net_tx - previous.net_tx) / elapsed
+            block_read_bps = max(0, counters.block_read - previous.block_read) / elapsed
+            block_write_bps = max(0, counters.block_write - previous.block_write) / elapsed
+    else:
+        precpu = stats.get("precpu_stats") or {}
+        cpu_percent = _cpu_percent(
+            counters.cpu_total - (precpu.get("cpu_usage") or {}).get("total_usage", 0),
+            counters.system_cpu - precpu.get("system_cpu_usage", 0),
+            online_cpus,
+        ) if precpu.get("system_cpu_usage") else 0.0
+
+    return MetricSample(
+        timestamp=counters.timestamp,
+        cpu_percent=cpu_percent,
+        memory_bytes=_memory_usage(memory_stats),
+        memory_limit_bytes=memory_stats.get("limit") or 0,
+        net_rx_bps=net_rx_bps,
+        net_tx_bps=net_tx_bps,
+        block_read_bps=block_read_bps,
+        block_write_bps=block_write_bps,
+    )
+
+
+@dataclass
+class ServiceMetrics:
+    """Fixed-size fine and coarse ring buffers for one service."""
+
+    fine: Deque[MetricSample]
+    coarse: Deque[MetricSample]
+    container_id: Optional[str] = None
+    _bucket: List[MetricSample] = field(default_factory=list)
+    _bucket_start: Optional[float] = None
+
+    @classmethod
+    def create(cls, interval: float) -> "ServiceMetrics":
+        fine_size = max(1, int(FINE_RETENTION / interval)) if interval > 0 else 1
+        return cls(
+            fine=deque(maxlen=fine_size),
+            coarse=deque(maxlen=COARSE_RETENTION // COARSE_RESOLUTION),
+        )
+
+    def add(self, sample: MetricSample) -> None:
+        """Append a fine sample, flushing the previous minute into the coarse buffer."""
+        bucket_start = sample.timestamp - sample.timestamp % COARSE_RESOLUTION
+        if self._bucket and bucket_start != self._bucket_start:
+            self.coarse.append(MetricSample.average(self._bucket, self._bucket_start))
+            self._bucket = []
+        self._bucket_start = bucket_start
+        self._bucket.append(sample)
+        self.fine.append(sample)
+
+    @property
+    def latest(self) -> Optional[MetricSample]:
+        return self.fine[-1] if self.fine else None
+
+    def series(self, resolution: str = RESOLUTION_FINE, since: Optional[float] = None) -> List[MetricSample]:
+        samples = list(self.fine if resolution == RESOLUTION_FINE else self.coarse)
+        if since is not None:
+            samples = [s for s in samples if s.timestamp >= since]
+        return samples
+
+
+class ContainerMetricsCollector:
+    """
+    Background collector of container resource usage for managed services.
+
+    Usage:
+        collector = get_metrics_collector()
+        collector.start()
+        samples = collector.get_series("chronicle-backend")
+    """
+
+    def __init__(
+        self,
+        docker_manager: Optional[DockerManager] = None,
+        interval: float = DEFAULT_INTERVAL,
+        stats_concurrency: int = STATS_CONCURRENCY,
+    ):
+        self._docker_manager = docker_manager or get_docker_manager()
+        self.interval = interval
+        self.stats_concurrency = max(1, stats_concurrency)
+        self._services: Dict[str, ServiceMetrics] = {}
+        self._counters: Dict[str, _RawCounters] = {}
+        self._task: Optional[asyncio.Task] = None
+        self.last_collected_at: Optional[float] = None
+        self.last_duration_ms: float = 0.0
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the collection loop on the running event loop (idempotent)."""
+        if self.interval <= 0:
+            logger.info("Container metrics collector disabled")
+            return
+        if self.is_running:
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            started_at = time.monotonic()
+            try:
+                await self.collect_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Container metrics collection failed: {e}")
+            self.last_duration_ms = (time.monotonic() - started_at) * 1000
+            await asyncio.sleep(max(0.0, self.interval - (time.monotonic() - started_at)))
+
+    async def collect_once(self) -> int:
+        """
+        Read stats for every running managed container once.
+
+        Returns:
+            Number of services sampled
+        """
+        aio = self._docker_manager.aio
+        if not await aio.is_available():
+            return 0
+
+        infos = await aio.get_service_infos(list(self._docker_manager.MANAGEABLE_SERVICES))
+        running = {
+            name: info.container_id
+            for name, info in infos.items()
+            if info.status == ServiceStatus.RUNNING and info.container_id
+        }
+
+        semaphore = asyncio.Semaphore(self.stats_concurrency)
+
+        async def _read_stats(container_id: str) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                return await aio.get_container_stats(container_id)
+
+        results = await asyncio.gather(
+            *[_read_stats(container_id) for container_id in running.values()],
+            return_exceptions=True,
+        )
+
+        sampled = 0
+        for (service_name, container_id), stats in zip(running.items(), results):
+            if isinstance(stats, BaseException) or not stats:
+                logger.debug(f"No stats for {service_name}: {stats}")
+                continue
+            now = time.time()
+            counters = _read_counters(container_id, stats, now)
+            sample = sample_from_stats(stats, counters, self._counters.get(service_name))
+            self._counters[service_name] = counters
+
+            metrics = self._services.get(service_name)
+            if metrics is None:
+                metrics = self._services[service_name] = ServiceMetrics.create(self.interval)
+            metrics.container_id = container_id
+            metrics.add(sample)
+            sampled += 1
+
+        # Forget counters of stopped containers so a restart starts a fresh delta
+        for service_name in list(self._counters):
+            if service_name not in running:
+                del self._counters[service_name]
+
+        self.last_collected_at = time.time()
+        return sampled
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def get_series(
+        self,
+        service_name: str,
+        resolution: str = RESOLUTION_FINE,
+        since: Optional[float] = None,
+    ) -> Optional[List[MetricSample]]:
+        """Samples for a service, or None if it has never been sampled."""
+        metrics = self._services.get(service_name)
+        if metrics is None:
+            return None
+        return metrics.series(resolution, since)
+
+    def get_service_metrics(
+        self,
+        service_name: str,
+        resolution: str = RESOLUTION_FINE,
+        since: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Series plus a summary for one service."""
+        samples = self.get_series(service_name, resolution, since) or []
+        metrics = self._services.get(service_name)
+        return {
+            "service": service_name,
+            "container_id": metrics.container_id if metrics else None,
+            "resolution": resolution,
+            "interval_seconds": self.interval if resolution == RESOLUTION_FINE else COARSE_RESOLUTION,
+            "summary": self._summarize(samples),
+            "samples": [sample.to_dict() for sample in samples],
+        }
+
+    def get_summary(self) -> Dict[str, Any]:
+        """Latest sample and last-hour summary for every sampled service."""
+        services = {}
+        totals = {"cpu_percent": 0.0, "memory_bytes": 0}
+        for service_name, metrics in sorted(self._services.items()):
+            latest = metrics.latest
+            services[service_name] = {
+                "container_id": metrics.container_id,
+                "latest": latest.to_dict() if latest else None,
+                "last_hour": self._summarize(list(metrics.fine)),
+            }
+            if latest and service_name in self._counters:
+                totals["cpu_percent"] += latest.cpu_percent
+                totals["memory_bytes"] += latest.memory_bytes
+
+        return {
+            "collector": {
+                "running": self.is_running,
+                "interval_seconds": self.interval,
+                "last_collected_at": self.last_collected_at,
+                "last_duration_ms": round(self.last_duration_ms, 1),
+            },
+            "totals": {
+                "cpu_percent": round(totals["cpu_percent"], 2),
+                "memory_bytes": totals["memory_bytes"],
+            },
+            "services": services,
+        }
+
+    @staticmethod
+    def _summarize(samples: List[MetricSample]) -> Optional[Dict[str, Any]]:
+        if not samples:
+            return None
+        n = len(samples)
+        return {
+            "samples": n,
+            "from": samples[0].timestamp,
+            "to": samples[-1].timestamp,
+            "cpu_percent_avg": round(sum(s.cpu_percent for s in samples) / n, 2),
+            "cpu_percent_max": round(max(s.cpu_percent_max for s in samples), 2),
+            "memory_bytes_avg": int(sum(s.memory_bytes for s in samples) / n),
+            "memory_bytes_max": max(s.memory_bytes_max for s in samples),
+            "memory_limit_bytes": samples[-1].memory_limit_bytes,
+        }
+
+
+# Global instance
+_metrics_collector: Optional[ContainerMetricsCollector] = None
+
+
+def get_metrics_collector() -> ContainerMetricsCollector:
+    """Get the global ContainerMetricsCollector instance."""
+    global _metrics_collector
+    if _metrics_collector is None:
+        _metrics_collector = ContainerMetricsCollector()
+    return _metrics_collector
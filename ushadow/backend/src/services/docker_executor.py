@@ -0,0 +1,189 @@
+"""Bounded executor for blocking Docker SDK calls.
+
+The docker SDK is synchronous. Calling it directly from `async def`
+handlers blocks the event loop, so one slow daemon call stalls every
+request (including u-node heartbeats). DockerExecutor runs those calls on
+a dedicated, bounded thread pool with per-operation timeouts and keeps
+metrics on queue depth and call latency.
+
+Usage:
+    executor = get_docker_executor()
+    info = await executor.run(manager.get_service_info, "chronicle", op="get_service_info")
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class DockerTimeoutError(TimeoutError):
+    """A Docker call didn't finish within its operation timeout."""
+
+
+# Max concurrent blocking Docker calls
+DEFAULT_MAX_WORKERS = int(os.environ.get("DOCKER_EXECUTOR_WORKERS", "8"))
+
+# Default per-call timeout (seconds) when an operation has no specific entry
+DEFAULT_TIMEOUT = 30.0
+
+# Per-operation timeouts (seconds)
+OPERATION_TIMEOUTS: Dict[str, float] = {
+    "is_available": 5.0,
+    "get_service_info": 10.0,
+    "get_service_infos": 15.0,
+    "list_services": 15.0,
+    "get_service_ports": 10.0,
+    "check_port_conflicts": 15.0,
+    "check_port": 10.0,
+    "get_service_logs": 15.0,
+    "get_container_snapshot": 15.0,
+    "get_container_stats": 10.0,
+    "stop_service": 60.0,
+    "restart_service": 90.0,
+    "exec_tailscale_command": 30.0,
+    "get_container": 10.0,
+    "start_container": 60.0,
+    "get_container_archive": 30.0,
+    "create_container": 300.0,  # May pull the image first
+    "configure_tailscale_serve": 60.0,
+    "regenerate_tailscale_routes": 60.0,
+}
+
+
+@dataclass
+class OperationStats:
+    """Call statistics for one operation name."""
+
+    calls: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+    last_latency: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "avg_latency_ms": round(self.total_latency / self.calls * 1000, 2) if self.calls else 0.0,
+            "max_latency_ms": round(self.max_latency * 1000, 2),
+            "last_latency_ms": round(self.last_latency * 1000, 2),
+        }
+
+
+class DockerExecutor:
+    """Dedicated bounded thread pool for Docker SDK calls."""
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
+        self.max_workers = max_workers
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="docker")
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._in_flight = 0
+        self._stats: Dict[str, OperationStats] = {}
+
+    async def run(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        op: Optional[str] = None,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Run a blocking call on the Docker pool and await its result.
+
+        Args:
+            func: Blocking callable
+            op: Operation name for metrics/timeouts (defaults to func name)
+            timeout: Override the per-operation timeout (seconds)
+
+        Returns:
+            The callable's return value
+
+        Raises:
+            DockerTimeoutError: If the call exceeds its timeout. The worker
+                thread finishes the call in the background.
+        """
+        op = op or getattr(func, "__name__", "call")
+        if timeout is None:
+            timeout = OPERATION_TIMEOUTS.get(op, DEFAULT_TIMEOUT)
+
+        with self._lock:
+            self._queued += 1
+        submitted_at = time.monotonic()
+
+        def _call():
+            with self._lock:
+                self._queued -= 1
+                self._in_flight += 1
+            try:
+                return func(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self._in_flight -= 1
+
+        future = self._pool.submit(_call)
+        # A call cancelled before it started (timeout or shutdown) never runs _call
+        future.add_done_callback(self._on_done)
+        try:
+            result = await asyncio.wait_for(asyncio.wrap_future(future), timeout=timeout)
+        except asyncio.TimeoutError:
+            self._record(op, time.monotonic() - submitted_at, timed_out=True)
+            logger.warning(f"Docker operation '{op}' timed out after {timeout}s")
+            raise DockerTimeoutError(f"Docker operation '{op}' timed out after {timeout}s") from None
+        except Exception:
+            self._record(op, time.monotonic() - submitted_at, error=True)
+            raise
+
+        self._record(op, time.monotonic() - submitted_at)
+        return result
+
+    def _on_done(self, future: Future) -> None:
+        if future.cancelled():
+            with self._lock:
+                self._queued -= 1
+
+    def _record(self, op: str, latency: float, error: bool = False, timed_out: bool = False) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(op, OperationStats())
+            stats.calls += 1
+            stats.errors += int(error)
+            stats.timeouts += int(timed_out)
+            stats.total_latency += latency
+            stats.max_latency = max(stats.max_latency, latency)
+            stats.last_latency = latency
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Queue depth, in-flight calls and per-operation latency stats."""
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "queue_depth": self._queued,
+                "in_flight": self._in_flight,
+                "operations": {op: stats.to_dict() for op, stats in sorted(self._stats.items())},
+            }
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop accepting calls and drop queued ones (in-flight calls can't be interrupted)."""
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+
+# Global instance
+_docker_executor: Optional[DockerExecutor] = None
+
+
+def get_docker_executor() -> DockerExecutor:
+    """Get the global DockerExecutor instance."""
+    global _docker_executor
+    if _docker_executor is None:
+        _docker_executor = DockerExecutor()
+    return _docker_executor
@@ -7,13 +7,16 @@ Services are discovered from Docker Compose files via ComposeServiceRegistry
 and use capability-based composition via CapabilityResolver.
 """
 
+import asyncio
 import logging
 import os
 import re
 import subprocess
+from collections.abc import Mapping
 from pathlib import Path
 from enum import Enum
-from typing import Dict, List, Optional, Any
+from types import MappingProxyType
+from typing import Callable, Dict, Iterator, List, Optional, Any
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -21,6 +24,9 @@ import docker
 from docker.errors import DockerException, NotFound, APIError
 
 from src.services.compose_registry import get_compose_registry
+from src.services.container_cache import ContainerSnapshot, ContainerState, ContainerStateCache
+from src.services.docker_executor import DockerExecutor, get_docker_executor
+from src.services.port_index import PortAllocator
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +36,16 @@ SERVICE_NAME_PATTERN = re.compile(r'^[a-z0-9_-]+$')
 # Pattern to extract env var and default from port strings like "${CHRONICLE_PORT:-8080}"
 PORT_ENV_VAR_PATTERN = re.compile(r'\$\{([A-Z_][A-Z0-9_]*):-?(\d+)\}')
 
+# Max infra services docker compose brings up in parallel (COMPOSE_PARALLEL_LIMIT)
+INFRA_START_CONCURRENCY = int(os.environ.get("INFRA_START_CONCURRENCY", "4"))
+
+# Seconds allowed per infra service for `compose up` (covers an image pull);
+# a start of several services gets this budget for each of them
+INFRA_START_TIMEOUT_PER_SERVICE = float(os.environ.get("INFRA_START_TIMEOUT_PER_SERVICE", "120"))
+
+# Receives docker compose output lines (pull/create/start progress) as they arrive
+ProgressCallback = Callable[[str], None]
+
 
 def _extract_port_env_vars(ports: List[Dict[str, Any]]) -> Dict[str, int]:
     """
@@ -263,6 +279,47 @@ class ServiceInfo:
     metadata: Optional[Dict[str, Any]] = None  # Extra service-specific data
 
 
+class ServiceCatalog(Mapping):
+    """
+    Immutable catalog of manageable services (core + compose + dynamic).
+
+    Behaves like a read-only dict of service name -> config, with O(1)
+    secondary lookups by docker service name and compose service id.
+    Built once per compose registry generation by DockerManager.
+    """
+
+    def __init__(self, services: Dict[str, Dict[str, Any]], generation: Optional[tuple] = None):
+        self.generation = generation
+        self._services: Dict[str, Mapping] = {
+            name: MappingProxyType(dict(config)) for name, config in services.items()
+        }
+        self._by_docker_name: Dict[str, str] = {}
+        self._by_compose_id: Dict[str, str] = {}
+
+        for name, config in self._services.items():
+            self._by_docker_name.setdefault(config.get("docker_service_name", name), name)
+            compose_service_id = (config.get("metadata") or {}).get("compose_service_id")
+            if compose_service_id:
+                self._by_compose_id[compose_service_id] = name
+
+    def __getitem__(self, service_name: str) -> Mapping:
+        return self._services[service_name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._services)
+
+    def __len__(self) -> int:
+        return len(self._services)
+
+    def get_by_docker_name(self, docker_service_name: str) -> Optional[str]:
+        """Get the catalog key for a docker/compose service name."""
+        return self._by_docker_name.get(docker_service_name)
+
+    def get_by_compose_id(self, compose_service_id: str) -> Optional[str]:
+        """Get the catalog key for a compose service id (e.g. "chronicle-compose:chronicle-backend")."""
+        return self._by_compose_id.get(compose_service_id)
+
+
 class DockerManager:
     """
     Manages Docker containers for Ushadow services and integrations.
@@ -345,15 +402,45 @@ class DockerManager:
         self._client: Optional[docker.DockerClient] = None
         self._initialized = False
         self._docker_available = False
+        self._container_cache: Optional[ContainerStateCache] = None
+        self._dynamic_services: Dict[str, Dict[str, Any]] = {}
+        self._dynamic_version = 0
+        self._catalog: Optional[ServiceCatalog] = None
+        # service name -> (cache key, resolved container env)
+        self._env_cache: Dict[str, tuple[tuple, Dict[str, str]]] = {}
+        self._port_allocator = PortAllocator(self._list_running_containers)
+        self._aio: Optional["AsyncDockerManager"] = None
 
     @property
-    def MANAGEABLE_SERVICES(self) -> Dict[str, Any]:
+    def aio(self) -> "AsyncDockerManager":
+        """Awaitable versions of the blocking operations (run on the Docker executor)."""
+        if self._aio is None:
+            self._aio = AsyncDockerManager(self)
+        return self._aio
+
+    @property
+    def MANAGEABLE_SERVICES(self) -> ServiceCatalog:
         """
-        Get all manageable services (core + compose-discovered).
+        Get all manageable services (core + compose-discovered + dynamic).
 
         Combines hardcoded CORE_SERVICES with services discovered from
         compose/*-compose.yaml files via ComposeServiceRegistry.
+
+        The catalog is memoized and only rebuilt when the compose registry
+        generation changes or a dynamic service is added.
         """
+        try:
+            generation = (get_compose_registry().generation, self._dynamic_version)
+        except Exception as e:
+            logger.warning(f"Failed to load services from compose registry: {e}")
+            generation = None
+
+        if self._catalog is None or generation is None or self._catalog.generation != generation:
+            self._catalog = self._build_catalog(generation)
+        return self._catalog
+
+    def _build_catalog(self, generation: Optional[tuple]) -> ServiceCatalog:
+        """Build the service catalog from core, compose and dynamic services."""
         # Start with core services
         services = dict(self.CORE_SERVICES)
 
@@ -390,8 +477,12 @@ class DockerManager:
         except Exception as e:
             logger.warning(f"Failed to load services from compose registry: {e}")
 
+        # Runtime-registered services
+        for service_name, service_config in self._dynamic_services.items():
+            services.setdefault(service_name, service_config)
+
         logger.debug(f"Loaded {len(services)} manageable services")
-        return services
+        return ServiceCatalog(services, generation)
 
     def reload_services(self) -> None:
         """Force reload services from ComposeServiceRegistry."""
@@ -464,6 +555,10 @@ class DockerManager:
             self._client.ping()
             self._docker_available = True
             logger.info("Docker client initialized successfully")
+
+            # Keep container state in memory, updated from the events stream
+            self._container_cache = ContainerStateCache(self._client)
+            self._container_cache.start()
         except DockerException as e:
             logger.warning(f"Docker not available: {e}")
             self._docker_available = False
@@ -481,6 +576,120 @@ class DockerManager:
             self.initialize()
         return self._docker_available
 
+    def shutdown(self) -> None:
+        """Stop the container state cache's events subscriber."""
+        if self._container_cache:
+            self._container_cache.stop()
+
+    def container_snapshot(self) -> Optional[ContainerSnapshot]:
+        """
+        Get the current in-memory container snapshot.
+
+        Returns:
+            ContainerSnapshot, or None if the event-driven cache is not live
+            (callers should fall back to direct Docker API calls)
+        """
+        if not self.is_available() or not self._container_cache:
+            return None
+        return self._container_cache.snapshot()
+
+    @property
+    def port_allocator(self) -> PortAllocator:
+        """Shared port occupancy index used by preflight checks and port overrides."""
+        return self._port_allocator
+
+    def _list_running_containers(self) -> List[ContainerState]:
+        """Running containers from the state cache, or one Docker API listing."""
+        if not self.is_available():
+            return []
+        snapshot = self.container_snapshot()
+        if snapshot is None:
+            try:
+                snapshot = ContainerSnapshot.from_list(self._client.api.containers())
+            except Exception as e:
+                logger.warning(f"Docker API check failed: {e}")
+                return []
+        return [c for c in snapshot.containers() if c.status == "running"]
+
+    def get_container_snapshot(self) -> Optional[ContainerSnapshot]:
+        """
+        Get a container snapshot, from the live cache or one Docker API listing.
+
+        Returns:
+            ContainerSnapshot, or None if Docker is unavailable
+        """
+        if not self.is_available():
+            return None
+        snapshot = self.container_snapshot()
+        if snapshot is None:
+            try:
+                snapshot = ContainerSnapshot.from_list(self._client.api.containers(all=True))
+            except Exception as e:
+                logger.error(f"Error listing containers: {e}")
+        return snapshot
+
+    def get_target_projects(self, service_config: Dict[str, Any]) -> List[str]:
+        """Compose projects to match a service in, in order of preference."""
+        current_project = os.environ.get("COMPOSE_PROJECT_NAME", "ushadow")
+
+        # Use declared namespace from x-ushadow, fall back to current project
+        target_projects = []
+        service_namespace = service_config.get("namespace")
+        if service_namespace:
+            target_projects.append(service_namespace)
+        target_projects.append(current_project)
+        return target_projects
+
+    def _find_container_state(
+        self,
+        snapshot: ContainerSnapshot,
+        service_config: Dict[str, Any],
+        docker_container_name: str,
+    ) -> Optional[ContainerState]:
+        """Resolve a service's container from a snapshot (same rules as the API path)."""
+        state = snapshot.get(docker_container_name)
+        if state:
+            return state
+        return snapshot.find_compose_service(
+            docker_container_name, self.get_target_projects(service_config)
+        )
+
+    def _service_info_from_state(
+        self,
+        service_name: str,
+        service_config: Dict[str, Any],
+        state: Optional[ContainerState],
+    ) -> ServiceInfo:
+        """Build ServiceInfo from cached container state."""
+        if state is None:
+            return ServiceInfo(
+                name=service_name,
+                container_id=None,
+                status=ServiceStatus.NOT_FOUND,
+                service_type=service_config["service_type"],
+                image=None,
+                created=None,
+                ports={},
+                health=None,
+                endpoints=service_config.get("endpoints", []),
+                description=service_config.get("description"),
+                metadata=service_config.get("metadata")
+            )
+
+        return ServiceInfo(
+            name=service_name,
+            container_id=state.short_id,
+            status=ServiceStatus(state.status) if state.status in [s.value for s in ServiceStatus] else ServiceStatus.UNKNOWN,
+            service_type=service_config["service_type"],
+            image=state.image,
+            created=state.created,
+            ports=dict(state.ports),
+            health=state.health,
+            endpoints=service_config.get("endpoints", []),
+            description=service_config.get("description"),
+            metadata=service_config.get("metadata")
+        )
+
     def validate_service_name(self, service_name: str) -> tuple[bool, str]:
         """
         Validate service name format and whitelist.
@@ -504,9 +713,12 @@ class DockerManager:
             return False, "Invalid service name format"
 
         # Whitelist check - needs instance access for dynamic MANAGEABLE_SERVICES
-        available_services = list(self.MANAGEABLE_SERVICES.keys())
-        if service_name not in self.MANAGEABLE_SERVICES:
-            logger.warning(f"Service '{service_name}' not in MANAGEABLE_SERVICES. Available: {available_services}")
+        manageable_services = self.MANAGEABLE_SERVICES
+        if service_name not in manageable_services:
+            logger.warning(
+                f"Service '{service_name}' not in MANAGEABLE_SERVICES. "
+                f"Available: {list(manageable_services.keys())}"
+            )
             return False, "Service not found"
 
         logger.debug(f"Service '{service_name}' validated OK")
@@ -542,39 +754,23 @@ class DockerManager:
         valid, _ = self.validate_service_name(service_name)
         if not valid:
             logger.warning(f"Invalid service name attempted: {repr(service_name)}")
-            return ServiceInfo(
-                name=service_name,
-                container_id=None,
-                status=ServiceStatus.UNKNOWN,
-                service_type=ServiceType.APPLICATION,
-                image=None,
-                created=None,
-                ports={},
-                health=None,
-                endpoints=[],
-                error="Service not found"
-            )
+            return self._unknown_service_info(service_name, None, "Service not found")
 
         service_config = self.MANAGEABLE_SERVICES[service_name]
 
         if not self.is_available():
-            return ServiceInfo(
-                name=service_name,
-                container_id=None,
-                status=ServiceStatus.UNKNOWN,
-                service_type=service_config["service_type"],
-                image=None,
-                created=None,
-                ports={},
-                health=None,
-                endpoints=service_config.get("endpoints", []),
-                description=service_config.get("description"),
-                error="Docker not available"
-            )
+            return self._unknown_service_info(service_name, service_config, "Docker not available")
+
+        # Use docker_service_name if specified (e.g., "mem0" for "openmemory" service)
+        docker_container_name = service_config.get("docker_service_name", service_name)
+
+        # Fast path: answer from the event-driven container cache (no Docker API calls)
+        snapshot = self.container_snapshot()
+        if snapshot is not None:
+            state = self._find_container_state(snapshot, service_config, docker_container_name)
+            return self._service_info_from_state(service_name, service_config, state)
 
         try:
-            # Use docker_service_name if specified (e.g., "mem0" for "openmemory" service)
-            docker_container_name = service_config.get("docker_service_name", service_name)
             logger.info(f"[get_service_info] Looking for docker_container_name: {docker_container_name}")
 
             # Try to find container by exact name first
@@ -585,15 +781,7 @@ class DockerManager:
             except NotFound:
                 # Container name may have project prefix (e.g., "ushadow-wiz-frame-chronicle-backend")
                 # Search by compose service label, preferring declared namespace
-                import os
-                current_project = os.environ.get("COMPOSE_PROJECT_NAME", "ushadow")
-
-                # Use declared namespace from x-ushadow, fall back to current project
-                service_namespace = service_config.get("namespace")
-                target_projects = []
-                if service_namespace:
-                    target_projects.append(service_namespace)
-                target_projects.append(current_project)
+                target_projects = self.get_target_projects(service_config)
 
                 logger.info(f"[get_service_info] Searching by label, target_projects: {target_projects}")
 
@@ -674,19 +862,43 @@ class DockerManager:
         except Exception as e:
             # Log detailed error but return generic message to user
             logger.error(f"Error getting service info for {service_name}: {e}")
+            return self._unknown_service_info(
+                service_name, service_config, "Unable to retrieve service information"
+            )
+
+    @staticmethod
+    def _unknown_service_info(
+        service_name: str,
+        service_config: Optional[Mapping],
+        error: str,
+    ) -> ServiceInfo:
+        """ServiceInfo for a service whose container state can't be determined."""
+        if service_config is None:
             return ServiceInfo(
                 name=service_name,
                 container_id=None,
                 status=ServiceStatus.UNKNOWN,
-                service_type=service_config["service_type"],
+                service_type=ServiceType.APPLICATION,
                 image=None,
                 created=None,
                 ports={},
                 health=None,
-                endpoints=service_config.get("endpoints", []),
-                description=service_config.get("description"),
-                error="Unable to retrieve service information"
+                endpoints=[],
+                error=error
             )
+        return ServiceInfo(
+            name=service_name,
+            container_id=None,
+            status=ServiceStatus.UNKNOWN,
+            service_type=service_config["service_type"],
+            image=None,
+            created=None,
+            ports={},
+            health=None,
+            endpoints=service_config.get("endpoints", []),
+            description=service_config.get("description"),
+            error=error
+        )
 
     def list_services(
         self,
@@ -703,7 +915,7 @@ class DockerManager:
         Returns:
             List of ServiceInfo objects
         """
-        services = []
+        service_names = []
         for service_name, config in self.MANAGEABLE_SERVICES.items():
             # Filter by user controllable flag
             if user_controllable_only and not config.get("user_controllable", True):
@@ -713,10 +925,56 @@ class DockerManager:
             if service_type and config.get("service_type") != service_type:
                 continue
 
-            service_info = self.get_service_info(service_name)
-            services.append(service_info)
+            service_names.append(service_name)
+
+        infos = self.get_service_infos(service_names)
+        return [infos[name] for name in service_names]
+
+    def get_service_infos(self, service_names: List[str]) -> Dict[str, ServiceInfo]:
+        """
+        Get information about many services from a single container snapshot.
 
-        return services
+        Uses the event-driven cache when live, otherwise one container
+        listing - never one Docker call per service. If Docker is
+        unavailable or the listing fails, every service is reported as
+        unknown.
+
+        Args:
+            service_names: Names of the services to resolve
+
+        Returns:
+            Dict of service name -> ServiceInfo
+        """
+        results: Dict[str, ServiceInfo] = {}
+        if not service_names:
+            return results
+
+        snapshot = self.get_container_snapshot()
+        if snapshot is None:
+            error = (
+                "Unable to retrieve service information" if self.is_available()
+                else "Docker not available"
+            )
+
+        manageable_services = self.MANAGEABLE_SERVICES
+        for service_name in service_names:
+            service_config = manageable_services.get(service_name)
+            if service_config is None:
+                results[service_name] = self._unknown_service_info(
+                    service_name, None, "Service not found"
+                )
+                continue
+            if snapshot is None:
+                results[service_name] = self._unknown_service_info(
+                    service_name, service_config, error
+                )
+                continue
+
+            docker_container_name = service_config.get("docker_service_name", service_name)
+            state = self._find_container_state(snapshot, service_config, docker_container_name)
+            results[service_name] = self._service_info_from_state(service_name, service_config, state)
+
+        return results
 
     def get_service_ports(self, service_name: str) -> List[Dict[str, Any]]:
         """
@@ -812,24 +1070,22 @@ class DockerManager:
         exclude_pattern = f"{compose_project}-{service_name}"
         logger.debug(f"Exclude pattern for self-check: {exclude_pattern}")
 
-        # Debug: log all Docker port bindings
-        docker_ports = debug_list_docker_ports()
-        if docker_ports:
-            logger.info(f"Current Docker port bindings: {docker_ports}")
-        else:
-            logger.info("No Docker port bindings found")
+        # One container listing + one read of listening sockets for all checks
+        self._port_allocator.invalidate()
+        port_index = self._port_allocator.index()
+        logger.debug(f"Port index has {len(port_index)} ports in use")
 
         for port_info in service_ports:
             port = port_info['port']
             # Exclude ONLY our own environment's container when checking
-            used_by = check_port_in_use(port, exclude_container=exclude_pattern)
+            used_by = port_index.owner(port, exclude_container=exclude_pattern)
 
             if used_by:
                 logger.warning(f"Port conflict detected: port {port} is used by {used_by}")
-                # Find a suggested alternative port
-                suggested = port + 1
-                while check_port_in_use(suggested) and suggested < port + 100:
-                    suggested += 1
+                # Find (and reserve) a suggested alternative port
+                suggested = self._port_allocator.reserve_next_free(port + 1)
+                if suggested is None:
+                    suggested = port + 100
 
                 conflicts.append(PortConflict(
                     port=port,
@@ -847,16 +1103,37 @@ class DockerManager:
 
         return conflicts
 
-    async def start_service(self, service_name: str) -> tuple[bool, str]:
+    async def start_service(
+        self,
+        service_name: str,
+        progress: Optional[ProgressCallback] = None,
+        start_infra: bool = True
+    ) -> tuple[bool, str]:
         """
         Start a Docker service.
 
         Args:
             service_name: Name of the service to start
+            progress: Optional callback receiving compose progress lines
+            start_infra: Start the service's x-ushadow infra_services first
+                (False when a caller such as StartupPlanner already started them)
 
         Returns:
             Tuple of (success: bool, message: str)
         """
+        return await self.aio.start_service(service_name, progress, start_infra=start_infra)
+
+    def _start_existing_container(self, service_name: str) -> Optional[tuple[bool, str]]:
+        """
+        Start a service's existing container (blocking - runs on the Docker executor).
+
+        Args:
+            service_name: Name of the service to start
+
+        Returns:
+            Tuple of (success: bool, message: str), or None if the service has
+            no container yet and should be started from its compose file
+        """
         logger.info(f"start_service called with: {repr(service_name)}")
 
         # Validate service name first
@@ -883,9 +1160,8 @@ class DockerManager:
 
         except NotFound:
             # Container doesn't exist - try to start via compose if compose_file is specified
-            compose_file = self.MANAGEABLE_SERVICES[service_name].get("compose_file")
-            if compose_file:
-                return await self._start_service_via_compose(service_name, compose_file)
+            if self.MANAGEABLE_SERVICES[service_name].get("compose_file"):
+                return None
 
             logger.error(f"Container not found for service: {service_name}")
             return False, "Service not found"
@@ -929,30 +1205,32 @@ class DockerManager:
         saved_config = await settings.get(config_key)
         saved_config = saved_config or {}
 
-        resolved = {}
-
+        env_specs = []
         for env_var in service.all_env_vars:
             config = saved_config.get(env_var.name, {})
-            source = config.get("source", "default")
-            setting_path = config.get("setting_path")
-            literal_value = config.get("value")
-
-            # Use settings.resolve_env_value as single source of truth
-            # This ensures UI display and container startup use identical resolution
-            value = await settings.resolve_env_value(
-                source=source,
-                setting_path=setting_path,
-                literal_value=literal_value,
-                default_value=env_var.default_value,
-                env_name=env_var.name
-            )
+            env_specs.append({
+                "name": env_var.name,
+                "source": config.get("source", "default"),
+                "setting_path": config.get("setting_path"),
+                "literal_value": config.get("value"),
+                "default_value": env_var.default_value,
+            })
+
+        # Use settings.resolve_env_values as single source of truth
+        # This ensures UI display and container startup use identical resolution
+        # (batched: one settings snapshot for all env vars)
+        values = await settings.resolve_env_values(env_specs)
 
+        resolved = {}
+
+        for env_var, spec in zip(service.all_env_vars, env_specs):
+            value = values.get(env_var.name)
             if value:
                 resolved[env_var.name] = str(value)
-            elif env_var.is_required and source != "default":
+            elif env_var.is_required and spec["source"] != "default":
                 logger.warning(
                     f"Service {service_name}: env var {env_var.name} "
-                    f"has no value for source={source}"
+                    f"has no value for source={spec['source']}"
                 )
 
         logger.info(
@@ -960,6 +1238,27 @@ class DockerManager:
         )
         return resolved
 
+    async def _get_env_cache_key(self, service_name: str) -> tuple:
+        """
+        Cache key for a service's resolved environment.
+
+        Changes whenever settings, provider definitions or the service's
+        compose file change.
+        """
+        from src.config.omegaconf_settings import get_settings_store
+        from src.services.provider_registry import get_provider_registry
+
+        settings = get_settings_store()
+        # Load first so the generation reflects the current files
+        await settings.load_config()
+
+        compose_file = self.MANAGEABLE_SERVICES.get(service_name, {}).get("compose_file")
+        compose_hash = (
+            get_compose_registry().get_compose_file_hash(Path(compose_file))
+            if compose_file else None
+        )
+        return (settings.generation, get_provider_registry().generation, compose_hash)
+
     async def _build_env_vars_for_service(
         self, service_name: str
     ) -> tuple[Dict[str, str], Dict[str, str]]:
@@ -969,6 +1268,10 @@ class DockerManager:
         Uses saved compose config for compose-discovered services, with fallback
         to CapabilityResolver for required capabilities.
 
+        Resolved container env vars are cached per service and reused until
+        the settings generation, provider registry generation or compose file
+        hash changes.
+
         Args:
             service_name: Name of the service
 
@@ -980,7 +1283,33 @@ class DockerManager:
         Raises:
             ValueError: If service has unresolved required capabilities
         """
+        from src.services.capability_resolver import get_capability_resolver
+
+        # Pick up edited YAML files without re-parsing everything on every start
+        get_capability_resolver().reload_if_changed()
+
+        cache_key = await self._get_env_cache_key(service_name)
+        cached = self._env_cache.get(service_name)
+        if cached and cached[0] == cache_key:
+            container_env = dict(cached[1])
+            logger.info(f"Using cached env vars for {service_name} ({len(container_env)} vars)")
+        else:
+            container_env = await self._resolve_container_env(service_name)
+            self._env_cache[service_name] = (cache_key, dict(container_env))
+
         subprocess_env = os.environ.copy()  # For compose file variable substitution
+        subprocess_env.update(container_env)
+        return subprocess_env, container_env
+
+    async def _resolve_container_env(self, service_name: str) -> Dict[str, str]:
+        """
+        Resolve the container env vars for a service (uncached).
+
+        Raises:
+            ValueError: If service has unresolved required capabilities
+        """
+        from src.services.capability_resolver import get_capability_resolver
+
         container_env: Dict[str, str] = {}  # For container env vars
 
         # Check if this is a compose-discovered service
@@ -991,14 +1320,11 @@ class DockerManager:
             # Use compose config approach
             try:
                 container_env = await self._build_env_vars_from_compose_config(service_name)
-                subprocess_env.update(container_env)
 
                 # Also try CapabilityResolver for any capabilities declared in x-ushadow
                 requires = service_config.get("metadata", {}).get("requires", [])
                 if requires:
-                    from src.services.capability_resolver import get_capability_resolver
                     resolver = get_capability_resolver()
-                    resolver.reload()
 
                     # Get additional env vars from capability resolver
                     # This handles the case where user hasn't explicitly configured
@@ -1009,7 +1335,6 @@ class DockerManager:
                         for key, value in cap_env.items():
                             if key not in container_env:
                                 container_env[key] = value
-                                subprocess_env[key] = value
                     except Exception as e:
                         logger.debug(f"CapabilityResolver fallback for {service_name}: {e}")
 
@@ -1020,10 +1345,9 @@ class DockerManager:
                 port_overrides = settings.get_sync(f"services.{config_key}.ports") or {}
                 for env_var, port in port_overrides.items():
                     container_env[env_var] = str(port)
-                    subprocess_env[env_var] = str(port)
                     logger.info(f"Applied port override: {env_var}={port}")
 
-                return subprocess_env, container_env
+                return container_env
 
             except Exception as e:
                 logger.error(f"Failed to build env vars from compose config: {e}")
@@ -1031,14 +1355,8 @@ class DockerManager:
 
         # Traditional approach using CapabilityResolver
         try:
-            # Import here to avoid circular dependencies
-            from src.services.capability_resolver import get_capability_resolver
-
             resolver = get_capability_resolver()
 
-            # Reload to pick up any config changes (YAML files might have been edited)
-            resolver.reload()
-
             # Validate first to get clear error messages
             validation = await resolver.validate_service(service_name)
 
@@ -1070,9 +1388,6 @@ class DockerManager:
             # Resolve all env vars for the container
             container_env = await resolver.resolve_for_service(service_name)
 
-            # Also add to subprocess env for compose file substitution
-            subprocess_env.update(container_env)
-
             logger.info(
                 f"Resolved {len(container_env)} env vars for {service_name} "
                 f"via capability resolver"
@@ -1085,14 +1400,91 @@ class DockerManager:
             logger.error(f"Failed to resolve env vars for {service_name}: {e}")
             raise ValueError(f"Failed to configure service: {e}")
 
-        return subprocess_env, container_env
+        return container_env
 
-    async def _start_infra_services(self, infra_services: list[str]) -> tuple[bool, str]:
+    async def _run_compose(
+        self,
+        cmd: List[str],
+        env: Dict[str, str],
+        cwd: str,
+        timeout: float,
+        progress: Optional[ProgressCallback] = None
+    ) -> tuple[int, str, str]:
+        """
+        Run a docker compose command without blocking the event loop.
+
+        stdout/stderr lines are forwarded to `progress` as they arrive.
+
+        Args:
+            cmd: Command and arguments
+            env: Environment for the subprocess
+            cwd: Working directory
+            timeout: Seconds before the process is killed
+            progress: Optional callback receiving output lines
+
+        Returns:
+            Tuple of (returncode, stdout, stderr)
+
+        Raises:
+            asyncio.TimeoutError: If the command exceeds the timeout
+        """
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            env=env,
+            cwd=cwd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout_lines: List[str] = []
+        stderr_lines: List[str] = []
+
+        async def _pump(stream: asyncio.StreamReader, lines: List[str]) -> None:
+            async for raw in stream:
+                line = raw.decode(errors="replace").rstrip()
+                if not line:
+                    continue
+                lines.append(line)
+                if progress:
+                    try:
+                        progress(line)
+                    except Exception as e:
+                        logger.debug(f"Progress callback failed: {e}")
+
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(
+                    _pump(process.stdout, stdout_lines),
+                    _pump(process.stderr, stderr_lines),
+                    process.wait(),
+                ),
+                timeout=timeout,
+            )
+        finally:
+            # Timed out or cancelled: don't leave compose running with nobody reading its pipes
+            if process.returncode is None:
+                try:
+                    process.kill()
+                except ProcessLookupError:
+                    pass
+                await process.wait()
+
+        return process.returncode, "\n".join(stdout_lines), "\n".join(stderr_lines)
+
+    async def _start_infra_services(
+        self,
+        infra_services: list[str],
+        progress: Optional[ProgressCallback] = None
+    ) -> tuple[bool, str]:
         """
         Start infrastructure services from docker-compose.infra.yml.
 
+        All services go to a single `docker compose up`, which starts
+        independent services concurrently (bounded by INFRA_START_CONCURRENCY)
+        while still honouring depends_on between them.
+
         Args:
             infra_services: List of service names to start (e.g., ["postgres", "qdrant"])
+            progress: Optional callback receiving compose progress lines
 
         Returns:
             Tuple of (success: bool, message: str)
@@ -1107,50 +1499,56 @@ class DockerManager:
                 logger.warning(f"Infra compose file not found: {infra_compose_path}")
                 return False, "Infrastructure compose file not found"
 
-            import os
             subprocess_env = os.environ.copy()
             subprocess_env["COMPOSE_IGNORE_ORPHANS"] = "true"
+            subprocess_env["COMPOSE_PARALLEL_LIMIT"] = str(INFRA_START_CONCURRENCY)
+
+            logger.info(f"Starting infra services: {infra_services}")
+            cmd = [
+                "docker", "compose",
+                "-f", str(infra_compose_path),
+                "-p", "infra",
+                "up", "-d", *infra_services
+            ]
 
-            for service in infra_services:
-                logger.info(f"Starting infra service: {service}")
-                cmd = [
-                    "docker", "compose",
-                    "-f", str(infra_compose_path),
-                    "-p", "infra",
-                    "up", "-d", service
-                ]
-
-                result = subprocess.run(
-                    cmd,
-                    env=subprocess_env,
-                    cwd=str(infra_compose_path.parent),
-                    capture_output=True,
-                    text=True,
-                    timeout=120  # Longer timeout for pulling images
-                )
-
-                if result.returncode != 0:
-                    logger.error(f"Failed to start infra service {service}: {result.stderr}")
-                    return False, f"Failed to start infra service '{service}': {result.stderr[:200]}"
+            returncode, _, stderr = await self._run_compose(
+                cmd,
+                env=subprocess_env,
+                cwd=str(infra_compose_path.parent),
+                # Pulls share bandwidth, so budget for every service's image
+                timeout=INFRA_START_TIMEOUT_PER_SERVICE * len(infra_services),
+                progress=progress,
+            )
 
-                logger.info(f"Started infra service: {service}")
+            if returncode != 0:
+                logger.error(f"Failed to start infra services {infra_services}: {stderr}")
+                return False, f"Failed to start infra services '{', '.join(infra_services)}': {stderr[:200]}"
 
+            logger.info(f"Started infra services: {infra_services}")
             return True, f"Started infra services: {', '.join(infra_services)}"
 
-        except subprocess.TimeoutExpired:
-            logger.error("Timeout starting infra services")
+        except asyncio.TimeoutError:
+            logger.error(f"Timeout starting infra services {infra_services}")
             return False, "Infrastructure service start timeout"
         except Exception as e:
             logger.error(f"Error starting infra services: {e}")
             return False, f"Failed to start infrastructure: {str(e)}"
 
-    async def _start_service_via_compose(self, service_name: str, compose_file: str) -> tuple[bool, str]:
+    async def _start_service_via_compose(
+        self,
+        service_name: str,
+        compose_file: str,
+        progress: Optional[ProgressCallback] = None,
+        start_infra: bool = True
+    ) -> tuple[bool, str]:
         """
         Start a service using docker-compose.
 
         Args:
             service_name: Name of the service to start
             compose_file: Relative path to the compose file (from project root)
+            progress: Optional callback receiving compose progress lines
+            start_infra: Start the service's infra_services first
 
         Returns:
             Tuple of (success: bool, message: str)
@@ -1161,10 +1559,10 @@ class DockerManager:
             discovered = compose_registry.get_service_by_name(service_name)
 
             # Check if this service requires infra services to be started first
-            infra_services = discovered.infra_services if discovered else []
+            infra_services = discovered.infra_services if discovered and start_infra else []
             if infra_services:
                 logger.info(f"Service {service_name} requires infra services: {infra_services}")
-                success, msg = await self._start_infra_services(infra_services)
+                success, msg = await self._start_infra_services(infra_services, progress)
                 if not success:
                     return False, msg
 
@@ -1237,28 +1635,27 @@ class DockerManager:
                 logged_vars.append(f"{key}={'***' if is_secret else container_env[key][:20]+'...' if len(container_env.get(key, '')) > 20 else container_env.get(key, '')}")
             logger.debug(f"Container env vars for {service_name}: {logged_vars}")
 
-            result = subprocess.run(
+            returncode, _, stderr = await self._run_compose(
                 cmd,
                 env=subprocess_env,  # All env vars passed here for compose variable substitution
                 cwd=str(compose_dir),
-                capture_output=True,
-                text=True,
-                timeout=60
+                timeout=60,
+                progress=progress,
             )
 
-            if result.returncode == 0:
+            if returncode == 0:
                 logger.info(f"Started service via compose: {service_name}")
                 return True, f"Service '{service_name}' started successfully"
             else:
-                logger.error(f"Failed to start {service_name} via compose: {result.stderr}")
+                logger.error(f"Failed to start {service_name} via compose: {stderr}")
                 # Extract useful error message from stderr
-                error_msg = result.stderr.strip() if result.stderr else "Unknown error"
+                error_msg = stderr.strip() if stderr else "Unknown error"
                 # Truncate very long errors but keep useful info
                 if len(error_msg) > 300:
                     error_msg = error_msg[:300] + "..."
                 return False, f"Failed to start: {error_msg}"
 
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             logger.error(f"Timeout starting {service_name} via compose")
             return False, "Service start timeout"
         except ValueError as e:
@@ -1428,6 +1825,29 @@ class DockerManager:
             logger.error(f"Error getting logs for {service_name}: {e}")
             return False, "Failed to retrieve logs"
 
+    def get_container_stats(self, container_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Read one resource usage sample for a container.
+
+        Uses a one-shot stats read (no 1s wait for a second sample), so CPU
+        percentages have to be computed against the caller's previous read.
+
+        Args:
+            container_id: Container ID (short or full)
+
+        Returns:
+            Raw Docker stats dict, or None if Docker/the container is unavailable
+        """
+        if not self.is_available():
+            return None
+        try:
+            return self._client.api.stats(container_id, stream=False, one_shot=True)
+        except NotFound:
+            return None
+        except Exception as e:
+            logger.debug(f"Error reading stats for {container_id}: {e}")
+            return None
+
     def add_dynamic_service(
         self,
         service_name: str,
@@ -1465,8 +1885,8 @@ class DockerManager:
             if field not in service_config:
                 return False, f"Missing required field: {field}"
 
-        # Add service to manageable services
-        self.MANAGEABLE_SERVICES[service_name] = {
+        # Add service to manageable services (picked up on next catalog build)
+        self._dynamic_services[service_name] = {
             "description": service_config["description"],
             "service_type": service_config["service_type"],
             "endpoints": service_config["endpoints"],
@@ -1475,11 +1895,129 @@ class DockerManager:
             "compose_file": service_config.get("compose_file"),
             "metadata": service_config.get("metadata", {})
         }
+        self._dynamic_version += 1
 
         logger.info(f"Added dynamic service: {service_name}")
         return True, f"Service '{service_name}' registered successfully"
 
 
+class AsyncDockerManager:
+    """
+    Non-blocking facade over DockerManager for async code paths.
+
+    Every blocking Docker SDK operation runs on the bounded DockerExecutor
+    with a per-operation timeout, so a slow daemon never stalls the event loop.
+
+    Usage:
+        info = await get_docker_manager().aio.get_service_info("chronicle")
+    """
+
+    def __init__(self, manager: DockerManager, executor: Optional[DockerExecutor] = None):
+        self._manager = manager
+        self._executor = executor or get_docker_executor()
+
+    async def is_available(self) -> bool:
+        return await self._executor.run(self._manager.is_available, op="is_available")
+
+    async def get_service_info(self, service_name: str) -> ServiceInfo:
+        return await self._executor.run(
+            self._manager.get_service_info, service_name, op="get_service_info"
+        )
+
+    async def get_service_infos(self, service_names: List[str]) -> Dict[str, ServiceInfo]:
+        return await self._executor.run(
+            self._manager.get_service_infos, service_names, op="get_service_infos"
+        )
+
+    async def list_services(
+        self,
+        user_controllable_only: bool = True,
+        service_type: Optional[ServiceType] = None
+    ) -> List[ServiceInfo]:
+        return await self._executor.run(
+            self._manager.list_services,
+            user_controllable_only=user_controllable_only,
+            service_type=service_type,
+            op="list_services",
+        )
+
+    async def get_service_ports(self, service_name: str) -> List[Dict[str, Any]]:
+        return await self._executor.run(
+            self._manager.get_service_ports, service_name, op="get_service_ports"
+        )
+
+    async def check_port_conflicts(self, service_name: str) -> List[PortConflict]:
+        return await self._executor.run(
+            self._manager.check_port_conflicts, service_name, op="check_port_conflicts"
+        )
+
+    async def check_port(self, port: int, exclude_container: Optional[str] = None) -> Optional[str]:
+        return await self._executor.run(
+            self._manager.port_allocator.check, port, exclude_container, op="check_port"
+        )
+
+    async def start_service(
+        self,
+        service_name: str,
+        progress: Optional[ProgressCallback] = None,
+        start_infra: bool = True
+    ) -> tuple[bool, str]:
+        try:
+            result = await self._executor.run(
+                self._manager._start_existing_container, service_name, op="start_container"
+            )
+        except Exception as e:
+            logger.error(f"Error starting {service_name}: {e}")
+            return False, "Failed to start service"
+        if result is not None:
+            return result
+
+        # No container yet - compose runs as a subprocess, so it stays on the loop
+        compose_file = self._manager.MANAGEABLE_SERVICES[service_name]["compose_file"]
+        return await self._manager._start_service_via_compose(
+            service_name, compose_file, progress, start_infra=start_infra
+        )
+
+    async def start_infra_services(
+        self,
+        infra_services: List[str],
+        progress: Optional[ProgressCallback] = None
+    ) -> tuple[bool, str]:
+        return await self._manager._start_infra_services(infra_services, progress)
+
+    async def get_container_snapshot(self) -> Optional[ContainerSnapshot]:
+        return await self._executor.run(
+            self._manager.get_container_snapshot, op="get_container_snapshot"
+        )
+
+    async def get_container_stats(self, container_id: str) -> Optional[Dict[str, Any]]:
+        return await self._executor.run(
+            self._manager.get_container_stats, container_id, op="get_container_stats"
+        )
+
+    async def stop_service(self, service_name: str, timeout: int = 10) -> tuple[bool, str]:
+        # Positional: the executor's own `timeout` kwarg is the call deadline
+        return await self._executor.run(
+            self._manager.stop_service, service_name, timeout, op="stop_service"
+        )
+
+    async def restart_service(
+        self,
+        service_name: str,
+        timeout: int = 10,
+        internal: bool = False
+    ) -> tuple[bool, str]:
+        return await self._executor.run(
+            self._manager.restart_service, service_name, timeout, internal,
+            op="restart_service",
+        )
+
+    async def get_service_logs(self, service_name: str, tail: int = 100) -> tuple[bool, str]:
+        return await self._executor.run(
+            self._manager.get_service_logs, service_name, tail=tail, op="get_service_logs"
+        )
+
+
 # Global instance
 _docker_manager: Optional[DockerManager] = None
 
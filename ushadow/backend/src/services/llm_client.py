@@ -18,7 +18,7 @@ import litellm
 from litellm import acompletion
 
 from src.services.provider_registry import get_provider_registry
-from src.config.omegaconf_settings import get_settings_store
+from src.config.omegaconf_settings import SettingsSnapshot, get_settings_store
 
 logger = logging.getLogger(__name__)
 
@@ -43,15 +43,36 @@ class LLMClient:
         self._settings = get_settings_store()
         self._provider_registry = get_provider_registry()
 
+        # Resolved config, keyed on (settings generation, provider generation)
+        self._config: Optional[Dict[str, Any]] = None
+        self._config_key: Optional[tuple] = None
+
     async def get_llm_config(self) -> Dict[str, Any]:
         """
         Get the current LLM configuration from the capability system.
 
+        Cached per settings and provider registry generation, so any
+        settings change (including interpolated values such as
+        ${api_keys.openai}) or provider reload rebuilds it.
+
         Returns:
             Dict with keys: provider_id, model, api_key, base_url
         """
+        # One consistent settings view for the key and all reads below
+        settings = await self._settings.snapshot()
+        key = (settings.generation, self._provider_registry.generation)
+        if self._config is not None and self._config_key == key:
+            return dict(self._config)
+
+        config = self._build_llm_config(settings)
+        self._config = config
+        self._config_key = key
+        return dict(config)
+
+    def _build_llm_config(self, settings: SettingsSnapshot) -> Dict[str, Any]:
+        """Resolve the LLM configuration from settings and the selected provider."""
         # Get selected provider for 'llm' capability
-        selected_provider_id = await self._settings.get("selected_providers.llm", "openai")
+        selected_provider_id = settings.get("selected_providers.llm", "openai")
         provider = self._provider_registry.get_provider(selected_provider_id)
 
         if not provider:
@@ -67,7 +88,7 @@ class LLMClient:
             # Get value from settings or use default
             value = None
             if env_map.settings_path:
-                value = await self._settings.get(env_map.settings_path)
+                value = settings.get(env_map.settings_path)
             if value is None and env_map.default:
                 value = env_map.default
 
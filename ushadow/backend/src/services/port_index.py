@@ -0,0 +1,243 @@
+"""Port occupancy index for preflight checks and free-port suggestions.
+
+Builds a view of which host ports are in use from exactly:
+1. One container listing (from the container state cache when live)
+2. One read of the host's listening sockets (/proc/net/tcp{,6})
+
+and answers "is port X taken" / "next free port >= X" from sorted arrays
+with bisect, instead of probing the Docker API and sockets per port.
+
+Ports handed out as suggestions are reserved for a short time so that
+concurrent preflight checks don't suggest the same port twice.
+"""
+
+import bisect
+import logging
+import socket
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+from src.services.container_cache import ContainerState
+
+logger = logging.getLogger(__name__)
+
+# Sources of listening sockets (Linux). TCP state 0A == LISTEN.
+PROC_NET_TCP_FILES = [Path("/proc/net/tcp"), Path("/proc/net/tcp6")]
+TCP_LISTEN_STATE = "0A"
+
+# How long an index snapshot is reused before re-reading Docker and /proc
+DEFAULT_REFRESH_INTERVAL = 2.0
+
+# How long a suggested/claimed port stays reserved
+DEFAULT_RESERVATION_TTL = 60.0
+
+# How far above the requested port to search for a free one
+DEFAULT_SEARCH_RANGE = 100
+
+HOST_PROCESS_OWNER = "host process"
+
+
+def read_listening_ports(files: Iterable[Path] = PROC_NET_TCP_FILES) -> Optional[Set[int]]:
+    """
+    Read all TCP ports in LISTEN state from /proc/net/tcp{,6}.
+
+    Note: when running inside a container this is the container's network
+    namespace (same limitation as a socket bind test).
+
+    Returns:
+        Set of listening ports, or None if /proc is not available (non-Linux)
+    """
+    ports: Set[int] = set()
+    found = False
+    for path in files:
+        try:
+            lines = path.read_text().splitlines()[1:]
+        except OSError:
+            continue
+        found = True
+        for line in lines:
+            parts = line.split()
+            if len(parts) < 4 or parts[3] != TCP_LISTEN_STATE:
+                continue
+            try:
+                ports.add(int(parts[1].rsplit(":", 1)[1], 16))
+            except (IndexError, ValueError):
+                continue
+    return ports if found else None
+
+
+def _probe_bind(port: int, host: str = "0.0.0.0") -> bool:
+    """Fallback when /proc is unavailable: True if the port can't be bound."""
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            s.bind((host, port))
+            return False
+    except OSError:
+        return True
+
+
+class PortIndex:
+    """
+    Immutable index of occupied host ports.
+
+    Lookups by port are O(1); "next free port" walks a sorted array from a
+    bisect position, so it only touches the run of taken ports above start.
+    """
+
+    def __init__(
+        self,
+        container_ports: Dict[int, List[str]],
+        host_ports: Optional[Set[int]],
+        built_at: Optional[float] = None,
+    ):
+        self.built_at = built_at if built_at is not None else time.monotonic()
+        self._container_ports = container_ports
+        self._host_ports = host_ports
+        self._sorted = sorted(set(container_ports) | (host_ports or set()))
+
+    @classmethod
+    def build(
+        cls,
+        containers: Iterable[ContainerState],
+        host_ports: Optional[Set[int]],
+    ) -> "PortIndex":
+        """Build from running containers and the host's listening ports."""
+        container_ports: Dict[int, List[str]] = {}
+        for container in containers:
+            if container.status != "running":
+                continue
+            for port in container.host_ports:
+                owners = container_ports.setdefault(port, [])
+                if container.name not in owners:
+                    owners.append(container.name)
+        return cls(container_ports, host_ports)
+
+    def __len__(self) -> int:
+        return len(self._sorted)
+
+    def owner(self, port: int, exclude_container: Optional[str] = None) -> Optional[str]:
+        """
+        Describe what is using a port.
+
+        Args:
+            port: Port to check
+            exclude_container: Container name pattern to ignore (for self-check)
+
+        Returns:
+            None if free, "Docker: <name>" for containers, or "host process"
+        """
+        for name in self._container_ports.get(port, ()):
+            if exclude_container and exclude_container in name:
+                continue
+            return f"Docker: {name}"
+
+        if self._host_ports is None:
+            return HOST_PROCESS_OWNER if _probe_bind(port) else None
+        if port in self._host_ports and port not in self._container_ports:
+            return HOST_PROCESS_OWNER
+        return None
+
+    def is_taken(self, port: int) -> bool:
+        return self.owner(port) is not None
+
+    def next_free(
+        self,
+        start: int,
+        limit: int = DEFAULT_SEARCH_RANGE,
+        skip: Optional[Set[int]] = None,
+    ) -> Optional[int]:
+        """
+        Find the lowest free port >= start (and < start + limit).
+
+        Args:
+            start: First port to consider
+            limit: Size of the search window
+            skip: Extra ports to treat as taken (e.g. reservations)
+
+        Returns:
+            Free port, or None if the whole window is taken
+        """
+        skip = skip or set()
+        i = bisect.bisect_left(self._sorted, start)
+        candidate = start
+        while candidate < start + limit and candidate <= 65535:
+            if i < len(self._sorted) and self._sorted[i] == candidate:
+                i += 1
+                candidate += 1
+                continue
+            if candidate in skip or (self._host_ports is None and _probe_bind(candidate)):
+                candidate += 1
+                continue
+            return candidate
+        return None
+
+
+class PortAllocator:
+    """
+    Shared port index with short-lived reservations.
+
+    Usage:
+        allocator = PortAllocator(list_containers)
+        used_by = allocator.check(8080)
+        suggested = allocator.reserve_next_free(8081)
+    """
+
+    def __init__(
+        self,
+        containers_provider: Callable[[], Iterable[ContainerState]],
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+        reservation_ttl: float = DEFAULT_RESERVATION_TTL,
+    ):
+        self._containers_provider = containers_provider
+        self.refresh_interval = refresh_interval
+        self.reservation_ttl = reservation_ttl
+        self._lock = threading.Lock()
+        self._index: Optional[PortIndex] = None
+        self._reservations: Dict[int, float] = {}  # port -> expiry (monotonic)
+
+    def index(self) -> PortIndex:
+        """Get the current index, rebuilding it if it is older than refresh_interval."""
+        index = self._index
+        if index is not None and time.monotonic() - index.built_at < self.refresh_interval:
+            return index
+
+        index = PortIndex.build(self._containers_provider(), read_listening_ports())
+        self._index = index
+        logger.debug(f"Port index rebuilt: {len(index)} ports in use")
+        return index
+
+    def invalidate(self) -> None:
+        """Drop the cached index (e.g. after starting/stopping a container)."""
+        self._index = None
+
+    def check(self, port: int, exclude_container: Optional[str] = None) -> Optional[str]:
+        """What is using a port (ignores reservations), or None if free."""
+        return self.index().owner(port, exclude_container=exclude_container)
+
+    def reserve(self, port: int) -> None:
+        """Reserve a port so it isn't suggested to other callers."""
+        with self._lock:
+            self._reservations[port] = time.monotonic() + self.reservation_ttl
+
+    def release(self, port: int) -> None:
+        with self._lock:
+            self._reservations.pop(port, None)
+
+    def reserve_next_free(self, start: int, limit: int = DEFAULT_SEARCH_RANGE) -> Optional[int]:
+        """
+        Find and reserve the lowest free, unreserved port >= start.
+
+        Returns:
+            Reserved port, or None if none is free in the window
+        """
+        index = self.index()
+        with self._lock:
+            now = time.monotonic()
+            self._reservations = {p: exp for p, exp in self._reservations.items() if exp > now}
+            port = index.next_free(start, limit=limit, skip=set(self._reservations))
+            if port is not None:
+                self._reservations[port] = now + self.reservation_ttl
+        return port
@@ -7,11 +7,14 @@ from config/providers/*.yaml and provides query methods.
 """
 
 import logging
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, Tuple
 
 import yaml
 
+from src.config.compiled_cache import CACHE_DIR_NAME, CompiledCache, hash_sources
 from src.models.provider import (
     EnvMap,
     Provider,
@@ -41,6 +44,56 @@ PROVIDERS_DIR = CONFIG_DIR / "providers"
 CAPABILITIES_FILE = CONFIG_DIR / "capabilities.yaml"
 
 
+@dataclass(frozen=True)
+class _CatalogIndexes:
+    """Lookups derived from one provider catalog load (shared, read-only)."""
+
+    env_to_settings: Mapping[str, str]  # env var -> settings path (last provider wins)
+    settings_paths_by_env_var: Mapping[str, Tuple[str, ...]]
+    providers_by_capability: Mapping[str, Tuple[Provider, ...]]
+    providers_by_capability_mode: Mapping[Tuple[str, str], Tuple[Provider, ...]]
+    providers_by_settings_path: Mapping[str, Tuple[Provider, ...]]
+
+    @classmethod
+    def build(
+        cls,
+        providers: Dict[str, Provider],
+        providers_by_capability: Dict[str, List[Provider]],
+    ) -> "_CatalogIndexes":
+        env_to_settings: Dict[str, str] = {}
+        paths_by_env_var: Dict[str, Dict[str, None]] = {}
+        by_settings_path: Dict[str, Dict[str, Provider]] = {}
+        for provider in providers.values():
+            for env_map in provider.env_maps:
+                if not env_map.settings_path:
+                    continue
+                by_settings_path.setdefault(env_map.settings_path, {})[provider.id] = provider
+                if env_map.env_var:
+                    env_to_settings[env_map.env_var] = env_map.settings_path
+                    paths_by_env_var.setdefault(env_map.env_var, {})[env_map.settings_path] = None
+
+        by_capability_mode: Dict[Tuple[str, str], List[Provider]] = {}
+        for capability, cap_providers in providers_by_capability.items():
+            for provider in cap_providers:
+                by_capability_mode.setdefault((capability, provider.mode), []).append(provider)
+
+        return cls(
+            env_to_settings=MappingProxyType(env_to_settings),
+            settings_paths_by_env_var=MappingProxyType(
+                {env_var: tuple(paths) for env_var, paths in paths_by_env_var.items()}
+            ),
+            providers_by_capability=MappingProxyType(
+                {capability: tuple(ps) for capability, ps in providers_by_capability.items()}
+            ),
+            providers_by_capability_mode=MappingProxyType(
+                {key: tuple(ps) for key, ps in by_capability_mode.items()}
+            ),
+            providers_by_settings_path=MappingProxyType(
+                {path: tuple(ps.values()) for path, ps in by_settings_path.items()}
+            ),
+        )
+
+
 class ProviderRegistry:
     """
     Registry for capabilities and their providers.
@@ -52,26 +105,117 @@ class ProviderRegistry:
     Default provider selection is stored in config.defaults.yaml under selected_providers.
     """
 
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """
+        Initialize the registry.
+
+        Args:
+            cache_dir: Where the parsed providers are cached between restarts.
+                Defaults to config/.cache.
+        """
         self._capabilities: Dict[str, Capability] = {}
         self._providers: Dict[str, Provider] = {}
         self._providers_by_capability: Dict[str, List[Provider]] = {}
         self._loaded = False
+        self._generation = 0
+        self._source_signature: Optional[Tuple] = None
+        self._compiled = CompiledCache(cache_dir or CONFIG_DIR / CACHE_DIR_NAME)
+        self._parse_errors: List[str] = []
+        self._indexes = _CatalogIndexes.build({}, {})
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped every time providers are (re)loaded."""
+        self._load()
+        return self._generation
+
+    def _get_source_paths(self) -> List[Path]:
+        paths = [CAPABILITIES_FILE]
+        if PROVIDERS_DIR.exists():
+            paths.extend(sorted(PROVIDERS_DIR.glob("*.yaml")))
+        return paths
+
+    def _get_source_signature(self) -> Tuple:
+        """Stat signature (path, mtime_ns, size) of all provider YAML sources."""
+        signature = []
+        for path in self._get_source_paths():
+            try:
+                stat = path.stat()
+                signature.append((str(path), stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                continue
+        return tuple(signature)
 
     def _load(self) -> None:
         """Load capabilities and providers from YAML files."""
         if self._loaded:
             return
 
-        self._load_capabilities()
-        self._load_providers()
+        self._source_signature = self._get_source_signature()
+
+        # Parsed catalog from a previous run, if no source file changed since
+        key, _ = hash_sources(self._get_source_paths())
+        compiled = self._compiled.load("providers", key, modules=[__name__, Provider.__module__])
+        if compiled is not None:
+            self._restore(compiled)
+            # Same sources, same problems - keep them visible on every start
+            for message in self._parse_errors:
+                logger.error(message)
+        else:
+            self._parse_errors = []
+            self._load_capabilities()
+            self._load_providers()
+            # Don't persist a catalog that raced an edit to its sources
+            if hash_sources(self._get_source_paths())[0] == key:
+                self._compiled.store(
+                    "providers", key, self._to_compiled(), modules=[__name__, Provider.__module__]
+                )
+        # Built once per load so lookups never rescan every provider's env_maps
+        self._indexes = _CatalogIndexes.build(self._providers, self._providers_by_capability)
         self._loaded = True
+        self._generation += 1
 
         logger.info(
             f"ProviderRegistry loaded: {len(self._capabilities)} capabilities, "
             f"{len(self._providers)} providers"
         )
 
+    def _to_compiled(self) -> Dict[str, Any]:
+        """The parsed catalog as plain JSON data, for the compiled cache."""
+        # A provider id reused by another capability is shadowed in _providers
+        # but still listed under its capability, so keep every instance
+        instances: Dict[int, int] = {}
+        providers: List[Dict[str, Any]] = []
+        for provider in [*self._providers.values(), *(
+            p for group in self._providers_by_capability.values() for p in group
+        )]:
+            if id(provider) not in instances:
+                instances[id(provider)] = len(providers)
+                providers.append(provider.model_dump(mode="json"))
+        return {
+            "capabilities": [c.model_dump(mode="json") for c in self._capabilities.values()],
+            "providers": providers,
+            "by_id": [instances[id(p)] for p in self._providers.values()],
+            "by_capability": {
+                cap_id: [instances[id(p)] for p in group]
+                for cap_id, group in self._providers_by_capability.items()
+            },
+            "errors": list(self._parse_errors),
+        }
+
+    def _restore(self, compiled: Dict[str, Any]) -> None:
+        """Rebuild the catalog from _to_compiled() output."""
+        providers = [Provider.model_validate(p) for p in compiled["providers"]]
+        self._capabilities = {
+            c["id"]: Capability.model_validate(c) for c in compiled["capabilities"]
+        }
+        self._providers = {providers[i].id: providers[i] for i in compiled["by_id"]}
+        self._providers_by_capability = {
+            cap_id: [providers[i] for i in group]
+            for cap_id, group in compiled["by_capability"].items()
+        }
+        self._parse_errors = list(compiled["errors"])
+
     def refresh(self) -> None:
         """Refresh the registry by reloading all YAML files."""
         logger.info("Refreshing ProviderRegistry...")
@@ -119,7 +263,8 @@ class ProviderRegistry:
             logger.debug(f"Loaded {len(self._capabilities)} capabilities")
 
         except Exception as e:
-            logger.error(f"Failed to load capabilities: {e}")
+            self._parse_errors.append(f"Failed to load capabilities: {e}")
+            logger.error(self._parse_errors[-1])
 
     def _load_providers(self) -> None:
         """Load provider definitions from config/providers/*.yaml."""
@@ -128,11 +273,13 @@ class ProviderRegistry:
                 logger.warning(f"Providers directory not found: {PROVIDERS_DIR}")
                 return
 
-            for provider_file in PROVIDERS_DIR.glob("*.yaml"):
+            # Sorted, so "last provider wins" mappings don't depend on directory order
+            for provider_file in sorted(PROVIDERS_DIR.glob("*.yaml")):
                 self._load_provider_file(provider_file)
 
         except Exception as e:
-            logger.error(f"Failed to load providers: {e}")
+            self._parse_errors.append(f"Failed to load providers: {e}")
+            logger.error(self._parse_errors[-1])
 
     def _load_provider_file(self, file_path: Path) -> None:
         """Load providers from a single capability file."""
@@ -155,7 +302,8 @@ class ProviderRegistry:
             logger.debug(f"Loaded providers from {file_path.name}")
 
         except Exception as e:
-            logger.error(f"Failed to load {file_path}: {e}")
+            self._parse_errors.append(f"Failed to load {file_path}: {e}")
+            logger.error(self._parse_errors[-1])
 
     def _parse_provider(self, capability: str, data: dict) -> Provider:
         """Parse provider data into Provider model."""
@@ -230,6 +378,18 @@ class ProviderRegistry:
         self._loaded = False
         self._load()
 
+    def reload_if_changed(self) -> bool:
+        """
+        Reload only if a provider/capability file was added, removed or modified.
+
+        Returns:
+            True if the registry was reloaded
+        """
+        if self._loaded and self._get_source_signature() == self._source_signature:
+            return False
+        self.reload()
+        return True
+
     # =========================================================================
     # Query Methods
     # =========================================================================
@@ -270,17 +430,16 @@ class ProviderRegistry:
             List of matching providers
         """
         self._load()
+        indexes = self._indexes
 
-        # Start with all providers or filter by capability
+        if capability and mode:
+            return list(indexes.providers_by_capability_mode.get((capability, mode), ()))
         if capability:
-            results = self._providers_by_capability.get(capability, [])
-        else:
-            results = list(self._providers.values())
+            return list(indexes.providers_by_capability.get(capability, ()))
 
-        # Filter by mode
+        results = list(self._providers.values())
         if mode:
             results = [p for p in results if p.mode == mode]
-
         return results
 
     def get_providers_for_capability(self, capability: str) -> List[Provider]:
@@ -350,24 +509,30 @@ class ProviderRegistry:
 
         return self._providers.get(default_id)
 
-    def get_env_to_settings_mapping(self) -> dict[str, str]:
+    def get_env_to_settings_mapping(self) -> Mapping[str, str]:
         """
-        Build env_var -> settings_path mapping from all providers.
+        Get the env_var -> settings_path mapping derived from all providers.
 
         This replaces hardcoded mappings by deriving them from the
-        provider YAML definitions.
+        provider YAML definitions. When several providers map the same env
+        var, the last one loaded wins.
 
         Returns:
-            Dict mapping env var names to their settings paths
+            Read-only mapping of env var names to their settings paths,
+            shared until the provider catalog reloads
         """
         self._load()
+        return self._indexes.env_to_settings
 
-        mapping = {}
-        for provider in self._providers.values():
-            for env_map in provider.env_maps:
-                if env_map.env_var and env_map.settings_path:
-                    mapping[env_map.env_var] = env_map.settings_path
-        return mapping
+    def get_settings_paths_for_env_var(self, env_var: str) -> Tuple[str, ...]:
+        """Every settings path a provider maps to an env var, in load order."""
+        self._load()
+        return self._indexes.settings_paths_by_env_var.get(env_var, ())
+
+    def get_providers_for_setting(self, settings_path: str) -> Tuple[Provider, ...]:
+        """Providers with an env_map that reads a settings path."""
+        self._load()
+        return self._indexes.providers_by_settings_path.get(settings_path, ())
 
 # Global singleton instance
 _registry: Optional[ProviderRegistry] = None
@@ -9,9 +9,12 @@ This is the single entry point for all service operations, combining:
 Routers should use this layer instead of calling underlying managers directly.
 """
 
+import asyncio
 import logging
+import time
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from pathlib import Path
+from typing import AsyncIterator, List, Dict, Any, Optional
 
 from src.services.compose_registry import (
     get_compose_registry,
@@ -22,6 +25,7 @@ from src.services.compose_registry import (
 from src.services.docker_manager import (
     get_docker_manager,
     DockerManager,
+    ProgressCallback,
     ServiceInfo,
     ServiceStatus as DockerServiceStatus,
     ServiceType,
@@ -32,6 +36,8 @@ from src.config.omegaconf_settings import (
     SettingsStore,
 )
 from src.services.provider_registry import get_provider_registry
+from src.services.docker_executor import DockerTimeoutError, get_docker_executor
+from src.services.container_metrics import RESOLUTION_FINE, get_metrics_collector
 from src.services.tailscale_serve_config import regenerate_and_apply
 
 logger = logging.getLogger(__name__)
@@ -235,9 +241,12 @@ class ServiceOrchestrator:
             s for s in all_services
             if self._service_matches_installed(s, installed_names, removed_names)
         ]
+        docker_infos = await self._get_docker_infos(installed_services)
 
         return [
-            (await self._build_service_summary(s, installed=True)).to_dict()
+            (await self._build_service_summary(
+                s, installed=True, docker_info=docker_infos.get(s.service_name)
+            )).to_dict()
             for s in installed_services
         ]
 
@@ -246,10 +255,14 @@ class ServiceOrchestrator:
         installed_names, removed_names = await self._get_installed_service_names()
         all_services = self.compose_registry.get_services()
 
+        docker_infos = await self._get_docker_infos(all_services)
+
         results = []
         for service in all_services:
             is_installed = self._service_matches_installed(service, installed_names, removed_names)
-            summary = await self._build_service_summary(service, installed=is_installed)
+            summary = await self._build_service_summary(
+                service, installed=is_installed, docker_info=docker_infos.get(service.service_name)
+            )
             results.append(summary.to_dict())
 
         return results
@@ -292,11 +305,13 @@ class ServiceOrchestrator:
         """Get services requiring a specific capability."""
         services = self.compose_registry.get_services_requiring(capability)
         installed_names, removed_names = await self._get_installed_service_names()
+        docker_infos = await self._get_docker_infos(services)
 
         return [
             (await self._build_service_summary(
                 s,
-                installed=self._service_matches_installed(s, installed_names, removed_names)
+                installed=self._service_matches_installed(s, installed_names, removed_names),
+                docker_info=docker_infos.get(s.service_name)
             )).to_dict()
             for s in services
         ]
@@ -305,9 +320,9 @@ class ServiceOrchestrator:
     # Status Methods
     # =========================================================================
 
-    def get_docker_status(self) -> Dict[str, Any]:
+    async def get_docker_status(self) -> Dict[str, Any]:
         """Check Docker daemon availability."""
-        available = self.docker_manager.is_available()
+        available = await self.docker_manager.aio.is_available()
         return {
             "available": available,
             "message": "Docker is available" if available else "Docker is not available"
@@ -315,7 +330,7 @@ class ServiceOrchestrator:
 
     async def get_all_statuses(self) -> Dict[str, Dict[str, Any]]:
         """Get lightweight status for all services (for polling)."""
-        services = self.docker_manager.list_services(user_controllable_only=False)
+        services = await self.docker_manager.aio.list_services(user_controllable_only=False)
         return {
             service.name: {
                 "status": service.status.value,
@@ -326,7 +341,7 @@ class ServiceOrchestrator:
 
     async def get_service_status(self, name: str) -> Optional[Dict[str, Any]]:
         """Get status for a single service."""
-        service_info = self.docker_manager.get_service_info(name)
+        service_info = await self.docker_manager.aio.get_service_info(name)
         if service_info.error == "Service not found":
             return None
         return {
@@ -336,7 +351,7 @@ class ServiceOrchestrator:
 
     async def get_docker_details(self, name: str) -> Optional[DockerDetails]:
         """Get Docker container details for a service."""
-        service_info = self.docker_manager.get_service_info(name)
+        service_info = await self.docker_manager.aio.get_service_info(name)
         if service_info.error == "Service not found":
             return None
 
@@ -363,39 +378,258 @@ class ServiceOrchestrator:
             metadata=service_info.metadata,
         )
 
+    def get_service_metrics(
+        self,
+        name: str,
+        resolution: str = RESOLUTION_FINE,
+        since: Optional[float] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Resource usage samples for a service's container."""
+        if name not in self.docker_manager.MANAGEABLE_SERVICES:
+            return None
+        return get_metrics_collector().get_service_metrics(name, resolution, since)
+
+    def get_metrics_summary(self) -> Dict[str, Any]:
+        """Latest resource usage and last-hour summary for all services."""
+        return get_metrics_collector().get_summary()
+
     # =========================================================================
     # Lifecycle Methods
     # =========================================================================
 
-    async def start_service(self, name: str) -> ActionResult:
+    async def start_service(
+        self,
+        name: str,
+        progress: Optional[ProgressCallback] = None,
+        regenerate_routes: bool = True,
+        start_infra: bool = True
+    ) -> ActionResult:
         """Start a service container."""
-        success, message = await self.docker_manager.start_service(name)
-        if success:
+        try:
+            success, message = await self.docker_manager.aio.start_service(
+                name, progress, start_infra=start_infra
+            )
+        except DockerTimeoutError:
+            return self._timed_out(name, "start")
+        if success and regenerate_routes:
             # Regenerate Tailscale Serve routes for newly started service
-            self._regenerate_tailscale_routes()
+            await self._regenerate_tailscale_routes()
         return ActionResult(success=success, message=message)
 
-    def stop_service(self, name: str) -> ActionResult:
+    async def start_service_stream(self, name: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Start a service, yielding progress events as they happen.
+
+        Yields:
+            {"event": "progress", "data": <compose output line>} while starting,
+            then one {"event": "result", "data": ActionResult dict}
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        task = asyncio.create_task(self.start_service(name, progress=queue.put_nowait))
+
+        while True:
+            getter = asyncio.ensure_future(queue.get())
+            done, _ = await asyncio.wait({getter, task}, return_when=asyncio.FIRST_COMPLETED)
+            if getter in done:
+                yield {"event": "progress", "data": getter.result()}
+                continue
+
+            getter.cancel()
+            # Drain lines that arrived just before completion
+            while not queue.empty():
+                yield {"event": "progress", "data": queue.get_nowait()}
+            break
+
+        try:
+            result = task.result()
+        except Exception as e:
+            logger.error(f"Error starting {name}: {e}")
+            result = ActionResult(success=False, message="Failed to start service")
+        yield {"event": "result", "data": result.to_dict()}
+
+    async def stop_service(self, name: str, regenerate_routes: bool = True) -> ActionResult:
         """Stop a service container."""
-        success, message = self.docker_manager.stop_service(name)
-        if success:
+        try:
+            success, message = await self.docker_manager.aio.stop_service(name)
+        except DockerTimeoutError:
+            return self._timed_out(name, "stop")
+        if success and regenerate_routes:
             # Regenerate Tailscale Serve routes to remove stopped service
-            self._regenerate_tailscale_routes()
+            await self._regenerate_tailscale_routes()
         return ActionResult(success=success, message=message)
 
-    def restart_service(self, name: str) -> ActionResult:
+    async def restart_service(self, name: str) -> ActionResult:
         """Restart a service container."""
-        success, message = self.docker_manager.restart_service(name)
+        try:
+            success, message = await self.docker_manager.aio.restart_service(name)
+        except DockerTimeoutError:
+            return self._timed_out(name, "restart")
         return ActionResult(success=success, message=message)
 
-    def _regenerate_tailscale_routes(self) -> None:
+    @staticmethod
+    def _timed_out(name: str, action: str) -> ActionResult:
+        """Failed result for a lifecycle call the Docker daemon didn't answer in time."""
+        logger.error(f"Timed out trying to {action} {name}")
+        return ActionResult(
+            success=False,
+            message=f"Timed out waiting for Docker to {action} service"
+        )
+
+    async def bulk_action(
+        self,
+        names: List[str],
+        action: str,
+        concurrency: int = 4
+    ) -> Dict[str, Any]:
+        """
+        Start, stop or restart several services concurrently.
+
+        For "start", the union of the services' infra_services is started
+        once up front rather than by every service in parallel. Tailscale
+        Serve routes are regenerated once at the end instead of once per
+        service.
+
+        Args:
+            names: Service names (duplicates are ignored)
+            action: "start", "stop" or "restart"
+            concurrency: Max services acted on at once (capped at the
+                Docker executor's worker count)
+
+        Returns:
+            Overall success, duration and per-service results
+
+        Raises:
+            ValueError: For an unknown action
+        """
+        actions = {
+            "start": lambda name: self.start_service(
+                name, regenerate_routes=False, start_infra=False
+            ),
+            "stop": lambda name: self.stop_service(name, regenerate_routes=False),
+            "restart": self.restart_service,
+        }
+        if action not in actions:
+            raise ValueError(f"Unknown action '{action}' (expected start, stop or restart)")
+
+        run_action = actions[action]
+        concurrency = min(concurrency, get_docker_executor().max_workers)
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        started_at = time.monotonic()
+        names = list(dict.fromkeys(names))
+
+        if action == "start":
+            infra_result = await self._start_bulk_infra(names)
+            if infra_result and not infra_result.success:
+                return {
+                    "action": action,
+                    "success": False,
+                    "duration_ms": round((time.monotonic() - started_at) * 1000, 1),
+                    "results": {name: infra_result.to_dict() for name in names},
+                }
+
+        async def _run(name: str) -> ActionResult:
+            async with semaphore:
+                try:
+                    return await run_action(name)
+                except Exception as e:
+                    logger.error(f"Bulk {action} failed for {name}: {e}")
+                    return ActionResult(success=False, message=f"Failed to {action} service")
+
+        results = await asyncio.gather(*[_run(name) for name in names])
+
+        # Routes only change when the set of running services does
+        if action in ("start", "stop") and any(result.success for result in results):
+            await self._regenerate_tailscale_routes()
+
+        return {
+            "action": action,
+            "success": all(result.success for result in results),
+            "duration_ms": round((time.monotonic() - started_at) * 1000, 1),
+            "results": {name: result.to_dict() for name, result in zip(names, results)},
+        }
+
+    async def _start_bulk_infra(self, names: List[str]) -> Optional[ActionResult]:
+        """Start the union of the services' infra_services in one call.
+
+        Returns:
+            None if none of the services need infra, otherwise the result
+        """
+        infra_services: List[str] = []
+        for name in names:
+            service = self.compose_registry.get_service_by_name(name)
+            if service:
+                infra_services.extend(service.infra_services)
+        infra_services = list(dict.fromkeys(infra_services))
+        if not infra_services:
+            return None
+
+        try:
+            success, message = await self.docker_manager.aio.start_infra_services(infra_services)
+        except DockerTimeoutError:
+            logger.error(f"Timed out starting infra services {infra_services}")
+            return ActionResult(
+                success=False,
+                message="Timed out waiting for Docker to start infra services"
+            )
+        return ActionResult(success=success, message=message)
+
+    async def bring_up(
+        self,
+        services: Optional[List[str]] = None,
+        compose_file: Optional[str] = None,
+        concurrency: int = 4,
+        dry_run: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Start a set of services in dependency order, one topological level at a time.
+
+        Args:
+            services: Service names to bring up (default: default_services)
+            compose_file: Bring up every service in this compose file instead
+                (file name or stem, e.g. "chronicle-compose.yaml")
+            concurrency: Max services starting at once within a level
+            dry_run: Only return the plan
+
+        Returns:
+            Plan (dry_run) or StartupResult as dict
+
+        Raises:
+            ValueError: For unknown services/compose files or dependency cycles
+        """
+        from src.services.startup_planner import StartupPlanner
+
+        if compose_file:
+            compose_base = Path(compose_file).stem.replace('-compose', '')
+            services = [
+                s.service_name for s in self.compose_registry.get_services_by_compose_base(compose_base)
+                if compose_file in (s.compose_file.name, s.compose_file.stem)
+            ]
+            if not services:
+                raise ValueError(f"No services found in compose file '{compose_file}'")
+        elif not services:
+            services = await self.settings.get("default_services") or []
+
+        planner = StartupPlanner(
+            compose_registry=self.compose_registry,
+            docker_manager=self.docker_manager,
+        )
+        plan = await planner.build_plan(list(services))
+        if dry_run:
+            return plan.to_dict()
+
+        result = await planner.execute(plan, concurrency=concurrency)
+        # One route regeneration for the whole bring-up
+        await self._regenerate_tailscale_routes()
+        return result.to_dict()
+
+    async def _regenerate_tailscale_routes(self) -> None:
         """Regenerate Tailscale Serve routes after service lifecycle changes.
 
         This updates the tailscale-serve.json with routes from all running services
         and applies it via `tailscale serve set-raw`.
         """
         try:
-            if regenerate_and_apply():
+            if await get_docker_executor().run(regenerate_and_apply, op="regenerate_tailscale_routes"):
                 logger.info("Tailscale Serve routes regenerated successfully")
             else:
                 logger.warning("Failed to regenerate Tailscale Serve routes")
@@ -403,9 +637,13 @@ class ServiceOrchestrator:
             # Don't fail the service operation if route regeneration fails
             logger.error(f"Error regenerating Tailscale Serve routes: {e}")
 
-    def get_service_logs(self, name: str, tail: int = 100) -> LogResult:
+    async def get_service_logs(self, name: str, tail: int = 100) -> LogResult:
         """Get service container logs."""
-        success, logs = self.docker_manager.get_service_logs(name, tail=tail)
+        try:
+            success, logs = await self.docker_manager.aio.get_service_logs(name, tail=tail)
+        except DockerTimeoutError:
+            logger.error(f"Timed out getting logs for {name}")
+            return LogResult(success=False, logs="Timed out waiting for Docker to return logs")
         return LogResult(success=success, logs=logs)
 
     # =========================================================================
@@ -527,18 +765,19 @@ class ServiceOrchestrator:
                     "value": ev.get("value"),
                 }
 
-        # Create new settings if any
-        if new_settings_to_create:
-            await self.settings.update(new_settings_to_create)
-            logger.info(f"Created {len(new_settings_to_create)} new settings")
-
-        # Save env config mapping
         service_key = service.service_id.replace(':', '_')
-        await self.settings.update({
-            "service_env_config": {
-                service_key: env_config
-            }
-        })
+        async with self.settings.batch():
+            # Create new settings if any
+            if new_settings_to_create:
+                await self.settings.update(new_settings_to_create)
+                logger.info(f"Created {len(new_settings_to_create)} new settings")
+
+            # Save env config mapping
+            await self.settings.update({
+                "service_env_config": {
+                    service_key: env_config
+                }
+            })
 
         logger.info(f"Saved env config for {service.service_id}: {len(env_config)} vars")
 
@@ -798,21 +1037,36 @@ class ServiceOrchestrator:
         if service.service_name in installed_names:
             return True
 
-        compose_base = service.compose_file.stem.replace('-compose', '')
-        if compose_base in installed_names:
+        if service.compose_base in installed_names:
             return True
 
         return False
 
-    async def _build_service_summary(self, service: DiscoveredService, installed: bool) -> ServiceSummary:
-        """Build a ServiceSummary from a DiscoveredService."""
+    async def _get_docker_infos(self, services: List[DiscoveredService]) -> Dict[str, ServiceInfo]:
+        """Resolve docker status for many services from one container snapshot."""
+        return await self.docker_manager.aio.get_service_infos([s.service_name for s in services])
+
+    async def _build_service_summary(
+        self,
+        service: DiscoveredService,
+        installed: bool,
+        docker_info: Optional[ServiceInfo] = None
+    ) -> ServiceSummary:
+        """Build a ServiceSummary from a DiscoveredService.
+
+        Args:
+            service: The discovered service
+            installed: Whether the service is installed
+            docker_info: Pre-fetched docker status (from a bulk lookup), fetched if omitted
+        """
         # Get enabled state
         enabled = await self.settings.get(f"installed_services.{service.service_name}.enabled")
         if enabled is None:
             enabled = True
 
         # Get docker status
-        docker_info = self.docker_manager.get_service_info(service.service_name)
+        if docker_info is None:
+            docker_info = await self.docker_manager.aio.get_service_info(service.service_name)
         status = docker_info.status.value if docker_info else "unknown"
         health = docker_info.health if docker_info else None
 
@@ -820,7 +1074,7 @@ class ServiceOrchestrator:
         needs_setup = await self._check_needs_setup(service)
 
         # Get resolved ports (with overrides applied)
-        resolved_ports = self.docker_manager.get_service_ports(service.service_name)
+        resolved_ports = await self.docker_manager.aio.get_service_ports(service.service_name)
         # Convert to the expected format with actual port values
         ports_with_actual = []
         for rp in resolved_ports:
@@ -860,8 +1114,9 @@ class ServiceOrchestrator:
         if not required_without_defaults:
             return False
 
+        settings = await self.settings.snapshot()
         config_key = f"service_env_config.{service.service_id.replace(':', '_')}"
-        saved_config = await self.settings.get(config_key) or {}
+        saved_config = settings.get(config_key) or {}
 
         for ev in required_without_defaults:
             saved = saved_config.get(ev.name, {})
@@ -869,7 +1124,7 @@ class ServiceOrchestrator:
                 saved = dict(saved)
 
             if saved.get("source") == "setting" and saved.get("setting_path"):
-                value = await self.settings.get(saved["setting_path"])
+                value = settings.get(saved["setting_path"])
                 if not value:
                     return True
             elif saved.get("source") == "literal" and saved.get("value"):
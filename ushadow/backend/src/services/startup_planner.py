@@ -0,0 +1,383 @@
+"""Dependency-aware parallel startup planner for multi-service bring-up.
+
+Builds a dependency DAG for a set of services from:
+- x-ushadow infra_services (nodes in docker-compose.infra.yml)
+- compose depends_on
+- capability providers (the selected local provider's docker service, or a
+  service in the same bring-up set that `provides` the capability)
+
+and starts each topological level concurrently, waiting for containers to be
+running (and healthy, when they define a healthcheck) before moving on to
+their dependents. A cold stack then takes as long as its longest dependency
+chain instead of the sum of all services.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set
+
+from src.services.compose_registry import ComposeServiceRegistry, get_compose_registry
+from src.services.docker_manager import DockerManager, ServiceStatus, get_docker_manager
+
+logger = logging.getLogger(__name__)
+
+# Node kinds
+NODE_INFRA = "infra"
+NODE_SERVICE = "service"
+
+# Compose project used for docker-compose.infra.yml
+INFRA_PROJECT = "infra"
+
+# Defaults for execution
+DEFAULT_CONCURRENCY = 4
+DEFAULT_HEALTH_TIMEOUT = 180.0
+HEALTH_POLL_INTERVAL = 1.0
+
+# Container events reach the state cache asynchronously; don't trust an
+# exited/dead state seen right after `up` until this many seconds have passed
+EXIT_GRACE_PERIOD = 5.0
+
+
+@dataclass
+class StartupNode:
+    """A single thing to start: an infra service or a manageable service."""
+
+    key: str
+    name: str
+    kind: str
+    depends_on: Set[str] = field(default_factory=set)
+    reason: str = "requested"  # requested / infra / depends_on / provider
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "key": self.key,
+            "name": self.name,
+            "kind": self.kind,
+            "depends_on": sorted(self.depends_on),
+            "reason": self.reason,
+        }
+
+
+@dataclass
+class StartupPlan:
+    """Topologically ordered startup levels (each level starts concurrently)."""
+
+    nodes: Dict[str, StartupNode]
+    levels: List[List[str]]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "levels": self.levels,
+            "nodes": {key: node.to_dict() for key, node in self.nodes.items()},
+        }
+
+
+@dataclass
+class StartupStepResult:
+    """Outcome of starting one node."""
+
+    key: str
+    status: str  # started / failed / skipped
+    message: str
+    duration_ms: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "key": self.key,
+            "status": self.status,
+            "message": self.message,
+            "duration_ms": round(self.duration_ms, 1),
+        }
+
+
+@dataclass
+class StartupResult:
+    """Outcome of executing a plan."""
+
+    success: bool
+    plan: StartupPlan
+    steps: List[StartupStepResult]
+    duration_ms: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "success": self.success,
+            "duration_ms": round(self.duration_ms, 1),
+            "plan": self.plan.to_dict(),
+            "steps": [step.to_dict() for step in self.steps],
+        }
+
+
+def infra_key(name: str) -> str:
+    return f"{NODE_INFRA}:{name}"
+
+
+class StartupPlanner:
+    """
+    Plans and executes dependency-ordered, parallel service startup.
+
+    Usage:
+        planner = StartupPlanner()
+        plan = await planner.build_plan(["chronicle-backend", "mem0"])
+        result = await planner.execute(plan)
+    """
+
+    def __init__(
+        self,
+        compose_registry: Optional[ComposeServiceRegistry] = None,
+        docker_manager: Optional[DockerManager] = None,
+        capability_resolver=None,
+    ):
+        self._compose_registry = compose_registry or get_compose_registry()
+        self._docker_manager = docker_manager or get_docker_manager()
+        if capability_resolver is None:
+            from src.services.capability_resolver import get_capability_resolver
+            capability_resolver = get_capability_resolver()
+        self._resolver = capability_resolver
+
+    # =========================================================================
+    # Planning
+    # =========================================================================
+
+    async def build_plan(self, service_names: List[str]) -> StartupPlan:
+        """
+        Build the dependency DAG and its topological levels.
+
+        Args:
+            service_names: Manageable service names to bring up
+
+        Returns:
+            StartupPlan
+
+        Raises:
+            ValueError: If a service is unknown or dependencies form a cycle
+        """
+        manageable = self._docker_manager.MANAGEABLE_SERVICES
+        unknown = [name for name in service_names if name not in manageable]
+        if unknown:
+            raise ValueError(f"Unknown services: {', '.join(unknown)}")
+
+        requested = set(service_names)
+        nodes: Dict[str, StartupNode] = {}
+        pending = [(name, "requested") for name in service_names]
+
+        while pending:
+            name, reason = pending.pop()
+            if name in nodes:
+                continue
+            node = StartupNode(key=name, name=name, kind=NODE_SERVICE, reason=reason)
+            nodes[name] = node
+
+            discovered = self._compose_registry.get_service_by_name(name)
+            if not discovered:
+                continue
+
+            # Infra services from docker-compose.infra.yml
+            for infra in discovered.infra_services:
+                key = infra_key(infra)
+                node.depends_on.add(key)
+                nodes.setdefault(key, StartupNode(key=key, name=infra, kind=NODE_INFRA, reason="infra"))
+
+            # Compose depends_on (services compose would start anyway, but health-gated here)
+            for dependency in discovered.depends_on:
+                if dependency in manageable and dependency != name:
+                    node.depends_on.add(dependency)
+                    pending.append((dependency, "depends_on"))
+
+            # Capability providers
+            for capability in discovered.requires:
+                provider_service = await self._get_provider_service(capability, requested)
+                if provider_service and provider_service != name:
+                    node.depends_on.add(provider_service)
+                    pending.append((provider_service, "provider"))
+
+        return StartupPlan(nodes=nodes, levels=self._topological_levels(nodes))
+
+    async def _get_provider_service(self, capability: str, requested: Set[str]) -> Optional[str]:
+        """Find the local service that provides a capability, if any."""
+        manageable = self._docker_manager.MANAGEABLE_SERVICES
+
+        try:
+            provider = await self._resolver.get_selected_provider(capability)
+        except Exception as e:
+            logger.debug(f"Could not resolve provider for {capability}: {e}")
+            provider = None
+
+        if provider is not None:
+            if provider.mode == "local" and provider.docker and provider.docker.service_name:
+                # The provider names its docker service, which may differ from the catalog key
+                return manageable.get_by_docker_name(provider.docker.service_name)
+            # Cloud (or non-managed) provider - nothing to start
+            return None
+
+        # No provider selection - order after a service in this bring-up that provides it
+        for service in self._compose_registry.get_services_providing(capability):
+            if service.service_name in requested:
+                return service.service_name
+        return None
+
+    @staticmethod
+    def _topological_levels(nodes: Dict[str, StartupNode]) -> List[List[str]]:
+        """Kahn's algorithm, grouping nodes whose dependencies are all satisfied."""
+        for key, node in nodes.items():
+            missing = node.depends_on - nodes.keys()
+            if missing:
+                # Would otherwise never be satisfied and be reported as a cycle
+                raise ValueError(f"{key} depends on unknown nodes: {', '.join(sorted(missing))}")
+
+        remaining = {key: set(node.depends_on) for key, node in nodes.items()}
+        levels: List[List[str]] = []
+
+        while remaining:
+            ready = sorted(key for key, deps in remaining.items() if not deps)
+            if not ready:
+                raise ValueError(f"Dependency cycle between: {', '.join(sorted(remaining))}")
+            levels.append(ready)
+            for key in ready:
+                del remaining[key]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+
+        return levels
+
+    # =========================================================================
+    # Execution
+    # =========================================================================
+
+    async def execute(
+        self,
+        plan: StartupPlan,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        health_timeout: float = DEFAULT_HEALTH_TIMEOUT,
+    ) -> StartupResult:
+        """
+        Start the plan level by level; nodes within a level start concurrently.
+
+        Nodes whose dependencies failed are skipped.
+
+        Args:
+            plan: Plan from build_plan()
+            concurrency: Max services starting at once
+            health_timeout: Seconds to wait for each node to become ready
+        """
+        started_at = time.monotonic()
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        results: Dict[str, StartupStepResult] = {}
+        failed: Set[str] = set()
+
+        for level in plan.levels:
+            runnable = []
+            for key in level:
+                blocked_by = plan.nodes[key].depends_on & failed
+                if blocked_by:
+                    results[key] = StartupStepResult(
+                        key, "skipped", f"Dependency failed: {', '.join(sorted(blocked_by))}"
+                    )
+                    failed.add(key)
+                else:
+                    runnable.append(plan.nodes[key])
+
+            infra = [node for node in runnable if node.kind == NODE_INFRA]
+            services = [node for node in runnable if node.kind == NODE_SERVICE]
+
+            tasks = []
+            if infra:
+                tasks.append(self._start_infra(infra, health_timeout))
+            for node in services:
+                tasks.append(self._start_service(node, semaphore, health_timeout))
+
+            for step_results in await asyncio.gather(*tasks):
+                for step in step_results:
+                    results[step.key] = step
+                    if step.status != "started":
+                        failed.add(step.key)
+
+        steps = [results[key] for level in plan.levels for key in level]
+        duration_ms = (time.monotonic() - started_at) * 1000
+        logger.info(
+            f"Bring-up finished in {duration_ms:.0f}ms: "
+            f"{len(steps) - len(failed)} started, {len(failed)} failed/skipped"
+        )
+        return StartupResult(success=not failed, plan=plan, steps=steps, duration_ms=duration_ms)
+
+    async def _start_infra(
+        self,
+        nodes: List[StartupNode],
+        health_timeout: float,
+    ) -> List[StartupStepResult]:
+        """Start a level's infra services in one compose call, then wait for each."""
+        started_at = time.monotonic()
+        names = [node.name for node in nodes]
+        success, message = await self._docker_manager.aio.start_infra_services(names)
+        if not success:
+            return [StartupStepResult(node.key, "failed", message) for node in nodes]
+
+        waits = await asyncio.gather(*[
+            self._wait_ready(node.name, [INFRA_PROJECT], health_timeout) for node in nodes
+        ])
+        return [
+            StartupStepResult(
+                node.key,
+                "started" if ready else "failed",
+                detail,
+                (time.monotonic() - started_at) * 1000,
+            )
+            for node, (ready, detail) in zip(nodes, waits)
+        ]
+
+    async def _start_service(
+        self,
+        node: StartupNode,
+        semaphore: asyncio.Semaphore,
+        health_timeout: float,
+    ) -> List[StartupStepResult]:
+        started_at = time.monotonic()
+        async with semaphore:
+            success, message = await self._docker_manager.aio.start_service(node.name, start_infra=False)
+        if not success:
+            return [StartupStepResult(node.key, "failed", message, (time.monotonic() - started_at) * 1000)]
+
+        service_config = self._docker_manager.MANAGEABLE_SERVICES[node.name]
+        docker_name = service_config.get("docker_service_name", node.name)
+        projects = self._docker_manager.get_target_projects(service_config)
+        ready, detail = await self._wait_ready(docker_name, projects, health_timeout)
+        return [StartupStepResult(
+            node.key,
+            "started" if ready else "failed",
+            detail if not ready else message,
+            (time.monotonic() - started_at) * 1000,
+        )]
+
+    async def _wait_ready(
+        self,
+        docker_name: str,
+        projects: List[str],
+        timeout: float,
+    ) -> tuple[bool, str]:
+        """
+        Wait until a container is running and, if it has a healthcheck, healthy.
+
+        Reads come from the container state cache when live, so polling is cheap.
+        """
+        started_at = time.monotonic()
+        deadline = started_at + timeout
+        last_state = "not found"
+
+        while time.monotonic() < deadline:
+            snapshot = await self._docker_manager.aio.get_container_snapshot()
+            if snapshot is not None:
+                state = snapshot.get(docker_name) or snapshot.find_compose_service(docker_name, projects)
+                if state:
+                    last_state = f"{state.status} ({state.health})" if state.health else state.status
+                    exited = state.status in (ServiceStatus.EXITED.value, ServiceStatus.DEAD.value)
+                    if exited and time.monotonic() - started_at > EXIT_GRACE_PERIOD:
+                        return False, f"Container {state.name} {state.status}"
+                    if state.status == ServiceStatus.RUNNING.value and state.health in (None, "healthy"):
+                        return True, f"{state.name} ready"
+                    if state.health == "unhealthy":
+                        return False, f"Container {state.name} unhealthy"
+            await asyncio.sleep(HEALTH_POLL_INTERVAL)
+
+        return False, f"Timed out waiting for {docker_name} (last state: {last_state})"
@@ -91,8 +91,16 @@ def get_service_access_url(unode_hostname: str, port: int, is_local: bool = Fals
             return f"http://{dns_name}:{port}"
     return None
 
-# Docker client
-docker_client = docker.from_env()
+# Docker client (created on first use so importing this module never needs the daemon)
+_docker_client: Optional[docker.DockerClient] = None
+
+
+def get_docker_client() -> docker.DockerClient:
+    """Get the shared Docker client, creating it on first use."""
+    global _docker_client
+    if _docker_client is None:
+        _docker_client = docker.from_env()
+    return _docker_client
 
 
 def get_tailscale_container_name() -> str:
@@ -111,7 +119,7 @@ def exec_tailscale_command(command: str) -> tuple[int, str, str]:
     """
     container_name = get_tailscale_container_name()
     try:
-        container = docker_client.containers.get(container_name)
+        container = get_docker_client().containers.get(container_name)
         result = container.exec_run(command, demux=True)
 
         exit_code = result.exit_code
@@ -133,6 +141,19 @@ def exec_tailscale_command(command: str) -> tuple[int, str, str]:
         return 1, "", str(e)
 
 
+async def exec_tailscale_command_async(command: str) -> tuple[int, str, str]:
+    """Execute a tailscale command in the container without blocking the event loop.
+
+    Returns:
+        Tuple of (exit_code, stdout, stderr)
+    """
+    from src.services.docker_executor import get_docker_executor
+
+    return await get_docker_executor().run(
+        exec_tailscale_command, command, op="exec_tailscale_command"
+    )
+
+
 @dataclass
 class TailscaleStatus:
     """Unified Tailscale status information."""
@@ -152,20 +173,11 @@ class TailscaleStatus:
         return f"http://localhost:{backend_port}"
 
 
-def get_tailscale_status() -> TailscaleStatus:
-    """Get Tailscale status (hostname, IP) from container.
-
-    This is the single source of truth for Tailscale connection info.
-    Use this instead of calling exec_in_container directly.
-
-    Returns:
-        TailscaleStatus with hostname, ip, and authenticated flag
-    """
+def _build_tailscale_status(exit_code: int, stdout: str) -> TailscaleStatus:
+    """Build TailscaleStatus from `tailscale status --json` output plus fallbacks."""
     status = TailscaleStatus()
 
-    # Try to get status from container
     try:
-        exit_code, stdout, _ = exec_tailscale_command("tailscale status --json")
         if exit_code == 0 and stdout.strip():
             data = json.loads(stdout)
             self_node = data.get("Self", {})
@@ -206,6 +218,36 @@ def get_tailscale_status() -> TailscaleStatus:
     return status
 
 
+def get_tailscale_status() -> TailscaleStatus:
+    """Get Tailscale status (hostname, IP) from container.
+
+    This is the single source of truth for Tailscale connection info.
+    Use this instead of calling exec_in_container directly. From async
+    code, use get_tailscale_status_async() instead.
+
+    Returns:
+        TailscaleStatus with hostname, ip, and authenticated flag
+    """
+    exit_code, stdout, _ = exec_tailscale_command("tailscale status --json")
+    return _build_tailscale_status(exit_code, stdout)
+
+
+async def get_tailscale_status_async() -> TailscaleStatus:
+    """Get Tailscale status without blocking the event loop.
+
+    A daemon that doesn't answer within the executor timeout is treated
+    like an unreachable container, so callers fall back to config/env.
+    """
+    from src.services.docker_executor import DockerTimeoutError
+
+    try:
+        exit_code, stdout, _ = await exec_tailscale_command_async("tailscale status --json")
+    except DockerTimeoutError:
+        logger.warning("Timed out getting Tailscale status from container")
+        exit_code, stdout = 1, ""
+    return _build_tailscale_status(exit_code, stdout)
+
+
 def add_serve_route(path: str, target: str) -> bool:
     """Add a route to tailscale serve.
 
@@ -433,7 +475,7 @@ def is_caddy_running() -> bool:
         True if Caddy container exists and is running
     """
     try:
-        container = docker_client.containers.get("ushadow-caddy")
+        container = get_docker_client().containers.get("ushadow-caddy")
         return container.status == "running"
     except docker.errors.NotFound:
         return False
@@ -18,7 +18,7 @@ from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 
 from src.config.omegaconf_settings import get_settings_store
 from src.config.secrets import get_auth_secret_key
-from src.services.tailscale_serve import get_tailscale_status, TailscaleStatus
+from src.services.tailscale_serve import get_tailscale_status_async, TailscaleStatus
 from src.models.unode import (
     UNode,
     UNodeInDB,
@@ -256,7 +256,7 @@ class UNodeManager:
             "capabilities": UNodeCapabilities(can_become_leader=True).model_dump(),
             "last_seen": now,
             "manager_version": "0.1.0",
-            "services": self._detect_running_services(),
+            "services": await self._detect_running_services(),
             "labels": {"type": "leader"},
             "metadata": {"is_origin": True},
         }
@@ -286,7 +286,7 @@ class UNodeManager:
             return "linux"
         return "unknown"
 
-    def _detect_running_services(self) -> list[str]:
+    async def _detect_running_services(self) -> list[str]:
         """Detect running services from DockerManager (compose registry + core services)."""
         from src.services.docker_manager import get_docker_manager, ServiceStatus
 
@@ -294,7 +294,7 @@ class UNodeManager:
         try:
             docker_manager = get_docker_manager()
             # Get all services (not just user-controllable)
-            all_services = docker_manager.list_services(user_controllable_only=False)
+            all_services = await docker_manager.aio.list_services(user_controllable_only=False)
 
             for service in all_services:
                 # Only include running services
@@ -333,7 +333,7 @@ class UNodeManager:
         await self.tokens_collection.insert_one(token_doc)
 
         # Get Tailscale status for URL generation
-        ts_status = get_tailscale_status()
+        ts_status = await get_tailscale_status_async()
         ext_url = ts_status.ext_url  # https://{tailscale-dns} or None
         host_url = ts_status.host_url  # http://localhost:8000
 
@@ -1228,7 +1228,7 @@ Write-Host ""
             return f"#!/bin/sh\necho 'Error: {error}'\nexit 1"
 
         # Get Tailscale status for URL generation
-        ts_status = get_tailscale_status()
+        ts_status = await get_tailscale_status_async()
         ext_url = ts_status.ext_url  # https://{tailscale-dns} or None
         host_url = ts_status.host_url  # http://localhost:8000
         leader_url = ext_url or host_url
@@ -1488,7 +1488,7 @@ echo ""
             return f"Write-Error 'Error: {error}'; exit 1"
 
         # Get Tailscale status for URL generation
-        ts_status = get_tailscale_status()
+        ts_status = await get_tailscale_status_async()
         ext_url = ts_status.ext_url  # https://{tailscale-dns} or None
         host_url = ts_status.host_url  # http://localhost:8000
         leader_url = ext_url or host_url
@@ -0,0 +1,26 @@
+"""
+Shared test fixtures.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import services.provider_registry
+import src.config.omegaconf_settings  # noqa: F401 - must precede src.services.provider_registry
+import src.services.provider_registry
+
+
+@pytest.fixture(autouse=True)
+def provider_cache_dir(tmp_path_factory, monkeypatch):
+    """Keep the global provider registry's compiled cache out of the repo's config/.cache."""
+    cache_root = tmp_path_factory.mktemp("config")
+    # Tests import the registry both as services.* and (via the settings store) src.services.*
+    for module in (services.provider_registry, src.services.provider_registry):
+        monkeypatch.setattr(module, "CONFIG_DIR", cache_root)
+        monkeypatch.setattr(module, "_registry", None)
+    return cache_root / src.services.provider_registry.CACHE_DIR_NAME
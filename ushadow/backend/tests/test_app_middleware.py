@@ -0,0 +1,99 @@
+"""
+Tests for the settings-driven CORS middleware and exception handlers.
+"""
+
+import gc
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+# The middleware reads the store through the src.* package path
+import src.config.omegaconf_settings as omegaconf_settings
+from middleware.app_middleware import DynamicCORSMiddleware, setup_exception_handlers
+from src.services.docker_executor import DockerTimeoutError
+
+
+async def app(scope, receive, send):
+    pass
+
+
+@pytest.fixture
+async def store(tmp_path, monkeypatch):
+    """Global settings store backed by a temp config directory."""
+    (tmp_path / "config.defaults.yaml").write_text("security:\n  cors_origins: http://a\n")
+    store = omegaconf_settings.SettingsStore(config_dir=tmp_path)
+    await store.load_config()
+    monkeypatch.setattr(omegaconf_settings, "_settings_store", store)
+    return store
+
+
+class TestDynamicCORSMiddleware:
+    """Tests for following security.cors_origins at runtime."""
+
+    @pytest.mark.asyncio
+    async def test_origins_follow_settings(self, store):
+        middleware = DynamicCORSMiddleware(app, allow_origins=["http://a"])
+
+        await store.update({"security": {"cors_origins": "http://b, http://c"}})
+
+        assert middleware.allow_origins == ["http://b", "http://c"]
+
+    @pytest.mark.asyncio
+    async def test_dropped_instance_unsubscribes(self, store):
+        """Test that a rebuilt middleware stack doesn't leak old instances' subscriptions."""
+        before = len(store._subscribers)
+        middleware = DynamicCORSMiddleware(app, allow_origins=["http://a"])
+        assert len(store._subscribers) == before + 1
+
+        del middleware
+        gc.collect()
+        await store.update({"security": {"cors_origins": "http://b"}})
+
+        assert len(store._subscribers) == before
+
+    @pytest.mark.asyncio
+    async def test_close_unsubscribes(self, store):
+        middleware = DynamicCORSMiddleware(app, allow_origins=["http://a"])
+        middleware.close()
+
+        await store.update({"security": {"cors_origins": "http://b"}})
+
+        assert middleware.allow_origins == ["http://a"]
+
+
+class TestExceptionHandlers:
+    """Tests for mapping exceptions to error responses."""
+
+    @pytest.fixture
+    def client(self):
+        api = FastAPI()
+        setup_exception_handlers(api)
+
+        @api.get("/docker")
+        async def docker_timeout():
+            raise DockerTimeoutError("Docker operation 'list' timed out after 1s")
+
+        @api.get("/other")
+        async def other_timeout():
+            raise TimeoutError("upstream")
+
+        return TestClient(api, raise_server_exceptions=False)
+
+    def test_docker_timeout_is_gateway_timeout(self, client):
+        response = client.get("/docker")
+
+        assert response.status_code == 504
+        assert response.json()["error_category"] == "docker"
+
+    def test_other_timeouts_not_reported_as_docker(self, client):
+        """Test that an unrelated TimeoutError isn't blamed on the Docker daemon."""
+        response = client.get("/other")
+
+        assert response.status_code == 500
+        assert "docker" not in response.text.lower()
@@ -0,0 +1,337 @@
+"""
+Tests for the compose service registry.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import services.compose_watcher as compose_watcher
+from services.compose_registry import ComposeServiceRegistry
+from services.compose_watcher import ComposeWatcher
+
+
+@pytest.fixture
+def compose_dir():
+    """Create a temporary compose directory with two compose files."""
+    temp_dir = Path(tempfile.mkdtemp())
+    (temp_dir / "alpha-compose.yaml").write_text("""
+services:
+  alpha:
+    image: alpha:latest
+    environment:
+      - ALPHA_KEY
+""")
+    (temp_dir / "beta-compose.yaml").write_text("""
+services:
+  beta:
+    image: beta:latest
+""")
+    yield temp_dir
+    shutil.rmtree(temp_dir)
+
+
+@pytest.fixture
+def registry(compose_dir):
+    """Registry with its compiled cache inside the temp directory."""
+    return ComposeServiceRegistry(compose_dir=compose_dir, cache_dir=compose_dir / ".cache")
+
+
+def count_parses(registry, monkeypatch):
+    """Record the files the registry's parser is asked to parse."""
+    parsed = []
+    original_parse = registry.parser.parse
+
+    def parse(path):
+        parsed.append(Path(path).name)
+        return original_parse(path)
+
+    monkeypatch.setattr(registry.parser, "parse", parse)
+    return parsed
+
+
+class TestIncrementalReload:
+    """Tests for per-file incremental reloads."""
+
+    def test_unchanged_files_not_reparsed(self, registry, monkeypatch):
+        """Test that a reload with no changes parses nothing."""
+        assert sorted(s.service_name for s in registry.get_services()) == ["alpha", "beta"]
+        generation = registry.generation
+        parsed = count_parses(registry, monkeypatch)
+
+        assert registry.reload_if_changed() is False
+        registry.reload()
+
+        assert parsed == []
+        assert registry.generation == generation
+
+    def test_only_modified_file_reparsed(self, registry, compose_dir, monkeypatch):
+        """Test that editing one file re-parses just that file."""
+        registry.get_services()
+        generation = registry.generation
+        beta = registry.get_service_by_name("beta")
+        parsed = count_parses(registry, monkeypatch)
+
+        (compose_dir / "alpha-compose.yaml").write_text("""
+services:
+  alpha:
+    image: alpha:v2
+""")
+
+        assert registry.reload_if_changed() is True
+        assert parsed == ["alpha-compose.yaml"]
+        assert registry.get_service_by_name("alpha").image == "alpha:v2"
+        assert registry.get_service_by_name("beta") is beta
+        assert registry.generation == generation + 1
+
+    def test_touched_file_not_reparsed(self, registry, compose_dir, monkeypatch):
+        """Test that a new mtime with the same content keeps the parse result."""
+        registry.get_services()
+        generation = registry.generation
+        parsed = count_parses(registry, monkeypatch)
+
+        os.utime(compose_dir / "beta-compose.yaml", (1_000_000, 1_000_000))
+
+        assert registry.reload_if_changed() is False
+        assert parsed == []
+        assert registry.generation == generation
+
+    def test_added_and_removed_files(self, registry, compose_dir):
+        """Test that added files are parsed and removed files dropped."""
+        registry.get_services()
+        beta_file = str(compose_dir / "beta-compose.yaml")
+        assert registry.get_compose_file_hash(Path(beta_file)) is not None
+
+        (compose_dir / "beta-compose.yaml").unlink()
+        (compose_dir / "gamma-compose.yaml").write_text("""
+services:
+  gamma:
+    image: gamma:latest
+""")
+
+        assert registry.reload_if_changed() is True
+        assert sorted(s.service_name for s in registry.get_services()) == ["alpha", "gamma"]
+        assert registry.get_compose_file(beta_file) is None
+        assert registry.get_compose_file_hash(Path(beta_file)) is None
+
+    def test_compiled_catalog_reused(self, registry, compose_dir, monkeypatch):
+        """Test that a new registry loads unchanged files from the compiled cache."""
+        registry.get_services()
+
+        fresh = ComposeServiceRegistry(compose_dir=compose_dir, cache_dir=compose_dir / ".cache")
+        parsed = count_parses(fresh, monkeypatch)
+
+        assert sorted(s.service_name for s in fresh.get_services()) == ["alpha", "beta"]
+        assert parsed == []
+        assert fresh.get_services() == registry.get_services()
+
+
+class TestIndexedLookups:
+    """Tests for the secondary indexes."""
+
+    def test_lookups_match_services(self, compose_dir):
+        """Test name, compose base and capability lookups."""
+        (compose_dir / "gamma-compose.yaml").write_text("""
+x-ushadow:
+  gamma:
+    requires: [llm, llm, memory]
+  gamma-worker:
+    requires: [llm]
+  gamma-memory:
+    provides: memory
+services:
+  gamma:
+    image: gamma:latest
+  gamma-worker:
+    image: gamma:latest
+  gamma-memory:
+    image: mem:latest
+""")
+        registry = ComposeServiceRegistry(compose_dir=compose_dir, cache_dir=compose_dir / ".cache")
+
+        assert registry.get_service_by_name("alpha").service_id == "alpha-compose:alpha"
+        assert registry.get_service_by_name("missing") is None
+        assert sorted(s.service_name for s in registry.get_services_by_compose_base("gamma")) == [
+            "gamma", "gamma-memory", "gamma-worker",
+        ]
+        assert [s.service_name for s in registry.get_services_requiring("llm")] == ["gamma", "gamma-worker"]
+        assert [s.service_name for s in registry.get_services_providing("memory")] == ["gamma-memory"]
+        assert registry.get_services_requiring("transcription") == []
+
+    def test_indexes_follow_reload(self, registry, compose_dir):
+        """Test that indexes are rebuilt when a file changes."""
+        assert registry.get_services_by_compose_base("beta")
+
+        (compose_dir / "beta-compose.yaml").unlink()
+        registry.reload_if_changed()
+
+        assert registry.get_service_by_name("beta") is None
+        assert registry.get_services_by_compose_base("beta") == []
+
+
+class TestLoading:
+    """Tests for the first load of the catalog."""
+
+    def test_not_marked_loaded_until_indexes_built(self, registry, monkeypatch):
+        """Test that readers skipping the lock never see a half-built catalog."""
+        original_sync = registry._sync
+        seen = []
+
+        def sync(**kwargs):
+            seen.append(registry._loaded)
+            return original_sync(**kwargs)
+
+        monkeypatch.setattr(registry, "_sync", sync)
+        registry.get_services()
+
+        assert seen == [False]
+        assert registry._loaded
+
+    def test_cold_load_reads_each_file_once(self, registry, monkeypatch):
+        """Test that the cache-key hashes are reused instead of re-reading every file."""
+        reads = []
+        original_read_bytes = Path.read_bytes
+
+        def read_bytes(path):
+            reads.append(path.name)
+            return original_read_bytes(path)
+
+        monkeypatch.setattr(Path, "read_bytes", read_bytes)
+        registry.get_services()
+
+        assert sorted(reads) == ["alpha-compose.yaml", "beta-compose.yaml"]
+
+
+def service_summary(registry):
+    """Comparable view of every discovered service."""
+    return [
+        (s.service_id, s.image, s.requires, s.provides, s.infra_services,
+         [e.name for e in s.required_env_vars], [e.name for e in s.optional_env_vars])
+        for s in registry.get_services()
+    ]
+
+
+class TestParallelParsing:
+    """Tests for parsing compose files in a process pool."""
+
+    def test_matches_serial_parse(self, compose_dir, monkeypatch):
+        """Test that the process pool yields the same catalog as a serial parse."""
+        import services.compose_registry as compose_registry
+
+        for i in range(6):
+            (compose_dir / f"svc{i}-compose.yaml").write_text(f"""
+x-ushadow:
+  svc{i}:
+    requires: [llm]
+    infra_services: [postgres]
+services:
+  svc{i}:
+    image: svc{i}:latest
+    environment:
+      - SVC{i}_KEY
+      - SVC{i}_MODE=${{SVC{i}_MODE:-fast}}
+""")
+        serial = ComposeServiceRegistry(compose_dir=compose_dir, cache_dir=compose_dir / ".serial")
+        expected = service_summary(serial)
+
+        monkeypatch.setattr(compose_registry, "PARALLEL_PARSE_MIN_FILES", 2)
+        monkeypatch.setattr(compose_registry, "PARALLEL_PARSE_MAX_WORKERS", 2)
+        parallel = ComposeServiceRegistry(compose_dir=compose_dir, cache_dir=compose_dir / ".parallel")
+        # The in-process parser must not be used, or the pool silently fell back
+        parsed_serially = count_parses(parallel, monkeypatch)
+
+        assert service_summary(parallel) == expected
+        assert len(expected) == 8
+        assert parsed_serially == []
+
+
+class TestComposeWatcher:
+    """Tests for the compose directory watcher."""
+
+    @pytest.mark.asyncio
+    async def test_picks_up_new_file(self, registry, compose_dir):
+        """Test that a new compose file shows up without an explicit reload."""
+        import asyncio
+
+        registry.get_services()
+        generation = registry.generation
+        watcher = ComposeWatcher(registry, debounce=0.05, poll_interval=0.05, force_polling=True)
+        watcher.start()
+        try:
+            await asyncio.sleep(0.1)
+            assert registry.watched
+            (compose_dir / "gamma-compose.yaml").write_text("""
+services:
+  gamma:
+    image: gamma:latest
+""")
+            for _ in range(50):
+                if registry.get_service_by_name("gamma"):
+                    break
+                await asyncio.sleep(0.05)
+        finally:
+            await watcher.stop()
+
+        assert registry.get_service_by_name("gamma") is not None
+        assert registry.generation == generation + 1
+        assert not registry.watched
+
+    @pytest.mark.asyncio
+    async def test_not_watched_until_events_arrive(self, registry, compose_dir, monkeypatch):
+        """Test that the registry isn't marked watched before the event watch is confirmed."""
+        import asyncio
+
+        confirm = asyncio.Event()
+
+        async def awatch(*args, **kwargs):
+            await confirm.wait()
+            yield set()  # the watch's first timeout
+            await asyncio.Event().wait()
+
+        monkeypatch.setattr(compose_watcher, "awatch", awatch)
+        registry.get_services()
+        watcher = ComposeWatcher(registry, debounce=0.05, poll_interval=0.05)
+        watcher.start()
+        try:
+            await asyncio.sleep(0.1)
+            assert watcher.mode == "inotify"
+            assert not registry.watched
+
+            # Changed before the watch was up - picked up once it is
+            (compose_dir / "gamma-compose.yaml").write_text("services:\n  gamma:\n    image: gamma:latest\n")
+            confirm.set()
+            await asyncio.sleep(0.1)
+            assert registry.watched
+            assert registry.get_service_by_name("gamma") is not None
+        finally:
+            await watcher.stop()
+
+        assert not registry.watched
+
+    @pytest.mark.asyncio
+    async def test_failed_event_watch_falls_back_to_polling(self, registry, monkeypatch):
+        """Test that a failed event watch leaves the registry watched only by polling."""
+        import asyncio
+
+        async def awatch(*args, **kwargs):
+            raise OSError("inotify watch limit reached")
+            yield
+
+        monkeypatch.setattr(compose_watcher, "awatch", awatch)
+        watcher = ComposeWatcher(registry, debounce=0.05, poll_interval=0.05)
+        watcher.start()
+        try:
+            await asyncio.sleep(0.1)
+            assert watcher.mode == "polling"
+            assert registry.watched
+        finally:
+            await watcher.stop()
+
+        assert not registry.watched
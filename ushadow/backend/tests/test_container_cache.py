@@ -0,0 +1,241 @@
+"""
+Tests for the event-driven container state cache.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+from docker.errors import NotFound
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from services.container_cache import ContainerSnapshot, ContainerState, ContainerStateCache
+
+
+def list_entry(container_id, name, state="running", status="Up 5 minutes", project=None,
+               service=None, ports=None):
+    """An item of the `GET /containers/json` response."""
+    labels = {}
+    if project:
+        labels["com.docker.compose.project"] = project
+    if service:
+        labels["com.docker.compose.service"] = service
+    return {
+        "Id": container_id,
+        "Names": [f"/{name}"],
+        "Image": f"{name}:latest",
+        "State": state,
+        "Status": status,
+        "Created": 1700000000,
+        "Ports": ports or [],
+        "Labels": labels,
+    }
+
+
+def inspect_attrs(container_id, name, status="running", health=None, service=None):
+    """A `GET /containers/{id}/json` response."""
+    state = {"Status": status}
+    if health:
+        state["Health"] = {"Status": health}
+    return {
+        "Id": container_id,
+        "Name": f"/{name}",
+        "Created": "2024-01-02T03:04:05.123456789Z",
+        "State": state,
+        "Config": {
+            "Image": f"{name}:latest",
+            "Labels": {"com.docker.compose.service": service} if service else {},
+        },
+        "NetworkSettings": {"Ports": {"8000/tcp": [{"HostIp": "0.0.0.0", "HostPort": "8080"}]}},
+    }
+
+
+class FakeAPI:
+    """Low-level API client serving canned listing/inspect responses."""
+
+    def __init__(self, entries):
+        self.entries = entries
+        self.inspected = {}
+        self.inspect_calls = []
+
+    def containers(self, all=False):
+        return self.entries
+
+    def inspect_container(self, container_id):
+        self.inspect_calls.append(container_id)
+        if container_id not in self.inspected:
+            raise NotFound("No such container")
+        return self.inspected[container_id]
+
+
+class FakeClient:
+    def __init__(self, entries):
+        self.api = FakeAPI(entries)
+
+
+@pytest.fixture
+def entries():
+    return [
+        list_entry("a" * 64, "ushadow-chronicle", project="ushadow", service="chronicle",
+                   status="Up 2 minutes (healthy)",
+                   ports=[{"PrivatePort": 8000, "PublicPort": 8080, "Type": "tcp"}]),
+        list_entry("b" * 64, "other-chronicle", project="other", service="chronicle"),
+        list_entry("c" * 64, "postgres", state="exited", status="Exited (0) 1 hour ago"),
+    ]
+
+
+@pytest.fixture
+def cache(entries):
+    """Seeded cache (without the events thread)."""
+    cache = ContainerStateCache(FakeClient(entries))
+    cache._seed()
+    cache._live = True
+    return cache
+
+
+class TestContainerState:
+    """Tests for building ContainerState from API responses."""
+
+    def test_from_list_entry(self, entries):
+        """Test name, status, health and port parsing from a listing."""
+        state = ContainerState.from_list_entry(entries[0])
+
+        assert state.name == "ushadow-chronicle"
+        assert state.status == "running"
+        assert state.health == "healthy"
+        assert state.ports == {"8000/tcp": "8080"}
+        assert state.host_ports == [8080]
+        assert state.compose_project == "ushadow"
+        assert state.compose_service == "chronicle"
+        assert state.short_id == "a" * 12
+
+    def test_health_starting_from_status(self):
+        """Test that "(health: starting)" becomes health "starting"."""
+        entry = list_entry("d" * 64, "mem0", status="Up 3 seconds (health: starting)")
+        assert ContainerState.from_list_entry(entry).health == "starting"
+
+    def test_from_inspect(self):
+        """Test inspect parsing, including nanosecond timestamps."""
+        state = ContainerState.from_inspect(inspect_attrs("d" * 64, "mem0", health="unhealthy"))
+
+        assert state.name == "mem0"
+        assert state.health == "unhealthy"
+        assert state.ports == {"8000/tcp": "8080"}
+        assert state.created.year == 2024
+        assert state.created.microsecond == 123456
+
+
+class TestContainerSnapshot:
+    """Tests for the snapshot indexes."""
+
+    def test_indexes(self, entries):
+        """Test lookups by name, id and compose service label."""
+        snapshot = ContainerSnapshot.from_list(entries)
+
+        assert len(snapshot) == 3
+        assert snapshot.get("postgres").status == "exited"
+        assert snapshot.get("missing") is None
+        assert snapshot.get_by_id("b" * 64).name == "other-chronicle"
+        assert sorted(c.name for c in snapshot.for_compose_service("chronicle")) == [
+            "other-chronicle", "ushadow-chronicle",
+        ]
+        assert snapshot.for_compose_service("postgres") == []
+
+    def test_find_compose_service_prefers_project_order(self, entries):
+        """Test that the first listed project with the service wins."""
+        snapshot = ContainerSnapshot.from_list(entries)
+
+        assert snapshot.find_compose_service("chronicle", ["other", "ushadow"]).name == "other-chronicle"
+        assert snapshot.find_compose_service("chronicle", ["missing", "ushadow"]).name == "ushadow-chronicle"
+        assert snapshot.find_compose_service("chronicle", ["missing"]) is None
+
+
+    def test_replace_matches_rebuild(self, entries):
+        """Test that single-container updates leave the same indexes as a full rebuild."""
+        states = {e["Id"]: ContainerState.from_list_entry(e) for e in entries}
+        snapshot = ContainerSnapshot(states.values())
+        original = snapshot
+
+        moved = ContainerState.from_inspect(inspect_attrs("a" * 64, "ushadow-chronicle", status="exited",
+                                                          service="chronicle"))
+        added = ContainerState.from_list_entry(list_entry("d" * 64, "ushadow-chronicle-2", project="ushadow",
+                                                          service="chronicle"))
+        for container_id, state in [("a" * 64, moved), ("d" * 64, added), ("b" * 64, None), ("c" * 64, None)]:
+            snapshot = snapshot.replace(container_id, state)
+            if state is None:
+                states.pop(container_id)
+            else:
+                states[container_id] = state
+            rebuilt = ContainerSnapshot(states.values())
+
+            assert snapshot._by_id == rebuilt._by_id
+            assert snapshot._by_name == rebuilt._by_name
+            assert snapshot._by_service == rebuilt._by_service
+            assert snapshot._by_project_service == rebuilt._by_project_service
+
+        # The moved container lost its compose project, so the new one takes the slot
+        assert snapshot.find_compose_service("chronicle", ["ushadow"]).name == "ushadow-chronicle-2"
+        assert len(original) == 3
+        assert original.get("other-chronicle") is not None
+
+
+class TestEventApplication:
+    """Tests for applying Docker events to the cache."""
+
+    def test_snapshot_none_until_live(self, entries):
+        """Test that readers fall back to the API until the cache is live."""
+        cache = ContainerStateCache(FakeClient(entries))
+        cache._seed()
+
+        assert cache.snapshot() is None
+        cache._live = True
+        assert len(cache.snapshot()) == 3
+
+    def test_state_change_inspects_one_container(self, cache):
+        """Test that a tracked action re-inspects only that container."""
+        api = cache._client.api
+        api.inspected["c" * 64] = inspect_attrs("c" * 64, "postgres", status="running")
+        before = cache.snapshot()
+
+        cache._handle_event({"Type": "container", "Action": "start", "Actor": {"ID": "c" * 64}})
+
+        assert api.inspect_calls == ["c" * 64]
+        assert cache.snapshot().get("postgres").status == "running"
+        # Readers holding the old snapshot are unaffected
+        assert before.get("postgres").status == "exited"
+
+    def test_health_status_updates_in_place(self, cache):
+        """Test that health events need no inspect call."""
+        cache._handle_event({"Action": "health_status: unhealthy", "Actor": {"ID": "a" * 64}})
+
+        state = cache.snapshot().get("ushadow-chronicle")
+        assert state.health == "unhealthy"
+        assert state.ports == {"8000/tcp": "8080"}
+        assert cache._client.api.inspect_calls == []
+
+    def test_create_adds_container(self, cache):
+        """Test that a created container is picked up via inspect."""
+        cache._client.api.inspected["d" * 64] = inspect_attrs("d" * 64, "mem0", status="created",
+                                                             service="mem0")
+        cache._handle_event({"Action": "create", "Actor": {"ID": "d" * 64}})
+
+        assert cache.snapshot().get("mem0").status == "created"
+        assert [c.name for c in cache.snapshot().for_compose_service("mem0")] == ["mem0"]
+
+    def test_destroy_and_vanished_containers_removed(self, cache):
+        """Test destroy events, and containers gone by the time they're inspected."""
+        cache._handle_event({"Action": "destroy", "Actor": {"ID": "a" * 64}})
+        cache._handle_event({"Action": "die", "Actor": {"ID": "b" * 64}})
+
+        assert cache.snapshot().get("ushadow-chronicle") is None
+        assert cache.snapshot().get("other-chronicle") is None
+        assert len(cache.snapshot()) == 1
+
+    def test_untracked_actions_ignored(self, cache):
+        """Test that e.g. exec events don't trigger an inspect."""
+        cache._handle_event({"Action": "exec_start: sh", "Actor": {"ID": "a" * 64}})
+        cache._handle_event({"Action": "start", "Actor": {}})
+
+        assert cache._client.api.inspect_calls == []
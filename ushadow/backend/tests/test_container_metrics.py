@@ -0,0 +1,193 @@
+"""
+Tests for container resource telemetry.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from services.container_metrics import (
+    COARSE_RESOLUTION,
+    RESOLUTION_COARSE,
+    ContainerMetricsCollector,
+    MetricSample,
+    ServiceMetrics,
+    ServiceStatus,
+    _read_counters,
+    sample_from_stats,
+)
+
+MB = 1024 * 1024
+
+
+def stats(cpu_total, system_cpu, rx=0, tx=0, read=0, write=0, precpu=None):
+    """A one-shot Docker stats response (cgroup v2 memory layout)."""
+    return {
+        "cpu_stats": {
+            "cpu_usage": {"total_usage": cpu_total},
+            "system_cpu_usage": system_cpu,
+            "online_cpus": 2,
+        },
+        "precpu_stats": precpu or {},
+        "memory_stats": {
+            "usage": 300 * MB,
+            "limit": 1000 * MB,
+            "stats": {"inactive_file": 100 * MB},
+        },
+        "networks": {"eth0": {"rx_bytes": rx, "tx_bytes": tx}},
+        "blkio_stats": {"io_service_bytes_recursive": [
+            {"op": "Read", "value": read},
+            {"op": "Write", "value": write},
+        ]},
+    }
+
+
+class TestSampleFromStats:
+    """Tests for turning stats responses into samples."""
+
+    def test_deltas_against_previous_read(self):
+        """Test CPU percent and I/O rates from two consecutive reads."""
+        first = stats(1_000, 100_000, rx=1_000, tx=500, read=0, write=0)
+        second = stats(11_000, 200_000, rx=11_000, tx=2_500, read=4_000, write=8_000)
+        previous = _read_counters("abc", first, 100.0)
+        counters = _read_counters("abc", second, 105.0)
+
+        sample = sample_from_stats(second, counters, previous)
+
+        # 10k of 100k system time on 2 CPUs
+        assert sample.cpu_percent == pytest.approx(20.0)
+        assert sample.net_rx_bps == pytest.approx(2_000)
+        assert sample.net_tx_bps == pytest.approx(400)
+        assert sample.block_read_bps == pytest.approx(800)
+        assert sample.block_write_bps == pytest.approx(1_600)
+        # Working set excludes page cache
+        assert sample.memory_bytes == 200 * MB
+        assert sample.memory_percent == pytest.approx(20.0)
+
+    def test_first_read_uses_precpu(self):
+        """Test that the first read takes CPU from precpu_stats and has no rates."""
+        data = stats(
+            6_000, 150_000, rx=10_000,
+            precpu={"cpu_usage": {"total_usage": 1_000}, "system_cpu_usage": 100_000},
+        )
+        sample = sample_from_stats(data, _read_counters("abc", data, 100.0), None)
+
+        assert sample.cpu_percent == pytest.approx(20.0)
+        assert sample.net_rx_bps == 0.0
+
+    def test_first_read_without_precpu(self):
+        data = stats(6_000, 150_000)
+        assert sample_from_stats(data, _read_counters("abc", data, 100.0), None).cpu_percent == 0.0
+
+    def test_new_container_not_diffed_against_old(self):
+        """Test that a recreated container doesn't produce deltas against the old one."""
+        old = stats(1_000_000, 100_000, rx=1_000_000)
+        new = stats(1_000, 200_000, rx=10)
+        sample = sample_from_stats(new, _read_counters("new", new, 105.0), _read_counters("old", old, 100.0))
+
+        assert sample.cpu_percent == 0.0
+        assert sample.net_rx_bps == 0.0
+
+    def test_counter_reset_is_not_negative(self):
+        """Test that counters going backwards give zero rates, not negative ones."""
+        first = stats(1_000, 100_000, rx=5_000)
+        second = stats(500, 200_000, rx=1_000)
+        sample = sample_from_stats(
+            second, _read_counters("abc", second, 105.0), _read_counters("abc", first, 100.0)
+        )
+
+        assert sample.cpu_percent == 0.0
+        assert sample.net_rx_bps == 0.0
+
+
+def sample(timestamp, cpu, memory):
+    return MetricSample(timestamp=timestamp, cpu_percent=cpu, memory_bytes=memory, memory_limit_bytes=1000)
+
+
+class TestDownsampling:
+    """Tests for the fine and coarse ring buffers."""
+
+    def test_minute_flushed_to_coarse(self):
+        """Test that a minute's samples become one coarse sample with mean and peak."""
+        metrics = ServiceMetrics.create(interval=5)
+        for i, (cpu, memory) in enumerate([(10, 100), (30, 300), (20, 200)]):
+            metrics.add(sample(6000 + i * 5, cpu, memory))
+
+        # The current minute is still open
+        assert metrics.series(RESOLUTION_COARSE) == []
+
+        metrics.add(sample(6000 + COARSE_RESOLUTION, 50, 500))
+
+        [coarse] = metrics.series(RESOLUTION_COARSE)
+        assert coarse.timestamp == 6000
+        assert coarse.cpu_percent == pytest.approx(20.0)
+        assert coarse.cpu_percent_max == 30
+        assert coarse.memory_bytes == 200
+        assert coarse.memory_bytes_max == 300
+        assert len(metrics.series()) == 4
+        assert metrics.latest.cpu_percent == 50
+
+    def test_peaks_survive_averaging(self):
+        """Test that averaging coarse samples again keeps the original peaks."""
+        averaged = MetricSample.average([sample(0, 10, 100), sample(5, 90, 900)], 0)
+        again = MetricSample.average([averaged, sample(60, 20, 200)], 0)
+
+        assert again.cpu_percent_max == 90
+        assert again.memory_bytes_max == 900
+
+    def test_fine_buffer_is_bounded(self):
+        """Test that the fine ring buffer keeps only the last hour."""
+        metrics = ServiceMetrics.create(interval=600)  # 6 samples per hour
+        for i in range(10):
+            metrics.add(sample(i * 600, i, i))
+
+        fine = metrics.series()
+        assert [s.cpu_percent for s in fine] == [4, 5, 6, 7, 8, 9]
+        assert [s.timestamp for s in metrics.series(since=4800)] == [4800, 5400]
+        # Every sample fell in its own minute, so all but the open one were flushed
+        assert len(metrics.series(RESOLUTION_COARSE)) == 9
+
+
+class TestCollectOnce:
+    """Tests for a collection round."""
+
+    @pytest.mark.asyncio
+    async def test_stats_reads_are_bounded(self):
+        """Test that a round never has more stats reads in flight than its limit."""
+        names = [f"svc{i}" for i in range(10)]
+        in_flight = {"now": 0, "max": 0}
+
+        async def get_service_infos(service_names):
+            return {
+                name: SimpleNamespace(status=ServiceStatus.RUNNING, container_id=f"{name}-id")
+                for name in service_names
+            }
+
+        async def get_container_stats(container_id):
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            return stats(1_000, 100_000)
+
+        async def is_available():
+            return True
+
+        manager = SimpleNamespace(
+            MANAGEABLE_SERVICES={name: {} for name in names},
+            aio=SimpleNamespace(
+                is_available=is_available,
+                get_service_infos=get_service_infos,
+                get_container_stats=get_container_stats,
+            ),
+        )
+        collector = ContainerMetricsCollector(docker_manager=manager, interval=5, stats_concurrency=2)
+
+        assert await collector.collect_once() == 10
+        assert in_flight["max"] == 2
@@ -0,0 +1,61 @@
+"""
+Tests for the bounded Docker executor.
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from services.docker_executor import DockerExecutor, DockerTimeoutError
+
+
+@pytest.fixture
+def executor():
+    executor = DockerExecutor(max_workers=1)
+    yield executor
+    executor.shutdown()
+
+
+class TestQueueDepth:
+    """Tests for the queue_depth / in_flight metrics."""
+
+    @pytest.mark.asyncio
+    async def test_timed_out_queued_calls_leave_the_queue(self, executor):
+        """Test that calls cancelled before they start don't stay counted as queued."""
+        results = await asyncio.gather(
+            *[executor.run(time.sleep, 0.3, op="sleep", timeout=0.1) for _ in range(4)],
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, DockerTimeoutError) for r in results)
+
+        # Let the one call that did start finish in its worker
+        await asyncio.sleep(0.4)
+        metrics = executor.get_metrics()
+        assert metrics["queue_depth"] == 0
+        assert metrics["in_flight"] == 0
+        assert metrics["operations"]["sleep"]["timeouts"] == 4
+
+    @pytest.mark.asyncio
+    async def test_shutdown_cancels_queued_calls(self, executor):
+        """Test that shutdown(cancel_futures=True) also drains the queue count."""
+        tasks = [asyncio.ensure_future(executor.run(time.sleep, 0.2, op="sleep")) for _ in range(3)]
+        await asyncio.sleep(0.05)
+        assert executor.get_metrics()["queue_depth"] == 2
+
+        executor.shutdown()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert executor.get_metrics()["queue_depth"] == 0
+
+    @pytest.mark.asyncio
+    async def test_completed_calls(self, executor):
+        assert await executor.run(sum, [1, 2, 3], op="sum") == 6
+        metrics = executor.get_metrics()
+        assert (metrics["queue_depth"], metrics["in_flight"]) == (0, 0)
+        assert metrics["operations"]["sum"]["calls"] == 1
@@ -0,0 +1,292 @@
+"""
+Tests for the Docker manager.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from docker.errors import NotFound
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from services.container_cache import ContainerSnapshot
+from services.docker_manager import DockerManager, ServiceCatalog, ServiceStatus, ServiceType
+
+
+def python_cmd(code):
+    """A command running a Python snippet, standing in for docker compose."""
+    return [sys.executable, "-c", code]
+
+
+@pytest.fixture
+def spawned(monkeypatch):
+    """Record the subprocesses _run_compose starts."""
+    processes = []
+    original = asyncio.create_subprocess_exec
+
+    async def create_subprocess_exec(*args, **kwargs):
+        process = await original(*args, **kwargs)
+        processes.append(process)
+        return process
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", create_subprocess_exec)
+    return processes
+
+
+class TestServiceCatalog:
+    """Tests for the catalog's secondary lookups."""
+
+    def test_lookups(self):
+        catalog = ServiceCatalog({
+            "openmemory": {
+                "docker_service_name": "mem0",
+                "metadata": {"compose_service_id": "openmemory-compose:mem0"},
+            },
+            "mongo": {"metadata": None},
+        })
+
+        assert catalog.get_by_docker_name("mem0") == "openmemory"
+        assert catalog.get_by_docker_name("mongo") == "mongo"
+        assert catalog.get_by_docker_name("openmemory") is None
+        assert catalog.get_by_compose_id("openmemory-compose:mem0") == "openmemory"
+        assert catalog.get_by_compose_id("mongo") is None
+
+    def test_read_only(self):
+        catalog = ServiceCatalog({"mongo": {"required": True}})
+
+        assert dict(catalog) == {"mongo": {"required": True}}
+        with pytest.raises(TypeError):
+            catalog["mongo"]["required"] = False
+
+
+class FakeAPI:
+    """Low-level client recording container listings."""
+
+    def __init__(self, containers=None, error=None):
+        self.listings = 0
+        self._containers = containers or []
+        self._error = error
+
+    def containers(self, all=False):
+        self.listings += 1
+        if self._error:
+            raise self._error
+        return self._containers
+
+
+def container_entry(name, state="running"):
+    """An item of the `GET /containers/json` response."""
+    return {
+        "Id": f"{name}-0123456789abcdef",
+        "Names": [f"/{name}"],
+        "Image": f"{name}:latest",
+        "State": state,
+        "Status": "Up 5 minutes",
+        "Created": 1700000000,
+        "Ports": [],
+        "Labels": {},
+    }
+
+
+@pytest.fixture
+def bulk_manager(monkeypatch):
+    """DockerManager with three catalog services and a fake, always-available client."""
+    catalog = ServiceCatalog({
+        name: {"service_type": ServiceType.APPLICATION} for name in ("web", "api", "worker")
+    })
+    monkeypatch.setattr(DockerManager, "MANAGEABLE_SERVICES", property(lambda self: catalog))
+    manager = DockerManager()
+    manager._initialized = True
+    manager._docker_available = True
+
+    def per_service_call(*args, **kwargs):
+        pytest.fail("per-service Docker call")
+
+    manager._client = SimpleNamespace(
+        api=FakeAPI([container_entry("web"), container_entry("api", state="exited")]),
+        containers=SimpleNamespace(get=per_service_call, list=per_service_call),
+    )
+    return manager
+
+
+class TestGetServiceInfos:
+    """Tests for resolving many services from one container snapshot."""
+
+    def test_one_listing_without_cache(self, bulk_manager):
+        """Test that all services are resolved from a single container listing."""
+        infos = bulk_manager.get_service_infos(["web", "api", "worker", "missing"])
+
+        assert bulk_manager._client.api.listings == 1
+        assert infos["web"].status == ServiceStatus.RUNNING
+        assert infos["api"].status == ServiceStatus.EXITED
+        assert infos["worker"].status == ServiceStatus.NOT_FOUND
+        assert infos["missing"].error == "Service not found"
+
+    def test_no_listing_with_live_cache(self, bulk_manager):
+        """Test that a live container cache answers without any Docker call."""
+        bulk_manager._container_cache = SimpleNamespace(
+            snapshot=lambda: ContainerSnapshot.from_list([container_entry("worker")])
+        )
+
+        infos = bulk_manager.get_service_infos(["web", "worker"])
+
+        assert bulk_manager._client.api.listings == 0
+        assert infos["web"].status == ServiceStatus.NOT_FOUND
+        assert infos["worker"].status == ServiceStatus.RUNNING
+
+    def test_failed_listing_reports_unknown(self, bulk_manager):
+        """Test that a failed listing is not retried once per service."""
+        bulk_manager._client.api = FakeAPI(error=RuntimeError("daemon busy"))
+
+        infos = bulk_manager.get_service_infos(["web", "api", "worker"])
+
+        assert bulk_manager._client.api.listings == 1
+        assert {info.status for info in infos.values()} == {ServiceStatus.UNKNOWN}
+        assert infos["web"].error == "Unable to retrieve service information"
+
+    def test_docker_unavailable(self, bulk_manager):
+        bulk_manager._docker_available = False
+
+        infos = bulk_manager.get_service_infos(["web"])
+
+        assert bulk_manager._client.api.listings == 0
+        assert infos["web"].status == ServiceStatus.UNKNOWN
+        assert infos["web"].error == "Docker not available"
+
+
+class TestStartService:
+    """Tests for starting a service without blocking the loop."""
+
+    @pytest.fixture
+    def manager(self, monkeypatch):
+        """DockerManager with one stopped container and one compose-only service."""
+        catalog = ServiceCatalog({
+            "web": {"service_type": ServiceType.APPLICATION},
+            "chronicle": {"service_type": ServiceType.APPLICATION, "compose_file": "compose/chronicle-compose.yaml"},
+        })
+        monkeypatch.setattr(DockerManager, "MANAGEABLE_SERVICES", property(lambda self: catalog))
+        manager = DockerManager()
+        manager.docker_threads = set()
+        manager.started = []
+
+        def is_available():
+            manager.docker_threads.add(threading.get_ident())
+            return True
+
+        def get(name):
+            manager.docker_threads.add(threading.get_ident())
+            if name != "web":
+                raise NotFound("No such container")
+            return SimpleNamespace(status="exited", start=lambda: manager.started.append(name))
+
+        monkeypatch.setattr(manager, "is_available", is_available)
+        manager._client = SimpleNamespace(containers=SimpleNamespace(get=get))
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_existing_container_started_off_loop(self, manager):
+        """Test that the availability check and container lookup run on the executor."""
+        success, message = await manager.aio.start_service("web")
+
+        assert success is True
+        assert message == "Service 'web' started successfully"
+        assert manager.started == ["web"]
+        assert manager.docker_threads and threading.get_ident() not in manager.docker_threads
+
+    @pytest.mark.asyncio
+    async def test_missing_container_started_via_compose(self, manager, monkeypatch):
+        """Test that a service without a container falls through to compose on the loop."""
+        calls = []
+
+        async def start_via_compose(service_name, compose_file, progress=None, start_infra=True):
+            calls.append((service_name, compose_file, start_infra))
+            return True, "composed"
+
+        monkeypatch.setattr(manager, "_start_service_via_compose", start_via_compose)
+
+        assert await manager.start_service("chronicle", start_infra=False) == (True, "composed")
+        assert calls == [("chronicle", "compose/chronicle-compose.yaml", False)]
+        assert threading.get_ident() not in manager.docker_threads
+
+    @pytest.mark.asyncio
+    async def test_unknown_service(self, manager):
+        assert await manager.aio.start_service("missing") == (False, "Service not found")
+        assert manager.docker_threads == set()
+
+
+class TestRunCompose:
+    """Tests for running compose commands without blocking the loop."""
+
+    @pytest.mark.asyncio
+    async def test_forwards_output_lines(self):
+        """Test that stdout and stderr lines reach progress as they are read."""
+        lines = []
+        returncode, stdout, stderr = await DockerManager()._run_compose(
+            python_cmd(
+                "import sys\n"
+                "print('pulling'); sys.stdout.flush()\n"
+                "print('warning', file=sys.stderr); sys.stderr.flush()\n"
+                "print(''); print('started')\n"
+                "sys.exit(3)"
+            ),
+            env=dict(os.environ),
+            cwd=".",
+            timeout=10,
+            progress=lines.append,
+        )
+
+        assert returncode == 3
+        assert stdout == "pulling\nstarted"
+        assert stderr == "warning"
+        # Blank lines are dropped; relative order within a stream is kept
+        assert sorted(lines) == ["pulling", "started", "warning"]
+        assert lines.index("pulling") < lines.index("started")
+
+    @pytest.mark.asyncio
+    async def test_progress_errors_are_ignored(self):
+        """Test that a failing progress callback doesn't abort the command."""
+        def progress(line):
+            raise RuntimeError("client went away")
+
+        returncode, stdout, _ = await DockerManager()._run_compose(
+            python_cmd("print('a'); print('b')"), env=dict(os.environ), cwd=".", timeout=10,
+            progress=progress,
+        )
+
+        assert returncode == 0
+        assert stdout == "a\nb"
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_process(self, spawned):
+        """Test that a command over its timeout is killed and reaped."""
+        with pytest.raises(asyncio.TimeoutError):
+            await DockerManager()._run_compose(
+                python_cmd("import time; time.sleep(30)"), env=dict(os.environ), cwd=".", timeout=0.5,
+            )
+
+        assert spawned[0].returncode is not None
+
+    @pytest.mark.asyncio
+    async def test_cancellation_kills_process(self, spawned):
+        """Test that cancelling the caller doesn't leave the command running."""
+        started = asyncio.Event()
+        task = asyncio.create_task(DockerManager()._run_compose(
+            python_cmd("import sys, time; print('up'); sys.stdout.flush(); time.sleep(30)"),
+            env=dict(os.environ),
+            cwd=".",
+            timeout=30,
+            progress=lambda line: started.set(),
+        ))
+        await asyncio.wait_for(started.wait(), timeout=10)
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert spawned[0].returncode is not None
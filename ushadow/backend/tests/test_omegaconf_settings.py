@@ -186,6 +186,113 @@ database:
         await settings_manager.update({"api_keys.openai": "new-key"})
         assert settings_manager.secrets_path.exists()
 
+    @pytest.mark.asyncio
+    async def test_concurrent_updates_coalesce(self, temp_config_dir, settings_manager):
+        """Test that concurrent updates are all persisted with one write per file."""
+        writes = []
+        original = settings_manager._save_to_file
+
+        def counting_save(file_path, *updates):
+            writes.append((file_path.name, len(updates)))
+            original(file_path, *updates)
+
+        settings_manager._save_to_file = counting_save
+        generation = settings_manager.generation
+
+        await asyncio.gather(*[
+            settings_manager.update({f"prefs.option{i}": i}) for i in range(5)
+        ], settings_manager.update({"api_keys.openai_api_key": "sk-x"}))
+
+        assert sorted(writes) == [("config.overrides.yaml", 5), ("secrets.yaml", 1)]
+        assert settings_manager.generation == generation + 1
+        config = await settings_manager.load_config()
+        assert [OmegaConf.select(config, f"prefs.option{i}") for i in range(5)] == list(range(5))
+        assert OmegaConf.select(config, "api_keys.openai_api_key") == "sk-x"
+        # Own writes don't count as an external change
+        assert settings_manager.generation == generation + 1
+
+    @pytest.mark.asyncio
+    async def test_failed_file_does_not_drop_others(self, temp_config_dir, settings_manager):
+        """Test that one file's write error reaches only its callers and spares other files."""
+        original = settings_manager._save_to_file
+
+        def failing_save(file_path, *updates):
+            if file_path == settings_manager.secrets_path:
+                raise OSError("disk full")
+            original(file_path, *updates)
+
+        settings_manager._save_to_file = failing_save
+
+        # Secrets are queued first, so they are written first in the flush
+        secret, pref, other_pref = await asyncio.gather(
+            settings_manager.update({"api_keys.openai_api_key": "sk-x"}),
+            settings_manager.update({"prefs.a": 1}),
+            settings_manager.save_to_overrides({"prefs.b": 2}),
+            return_exceptions=True,
+        )
+
+        assert isinstance(secret, OSError)
+        assert pref is None and other_pref is None
+        saved = OmegaConf.load(temp_config_dir / "config.overrides.yaml")
+        assert saved.prefs.a == 1 and saved.prefs.b == 2
+        assert not settings_manager.secrets_path.exists()
+
+        # A caller that wrote to both files sees the failure, but its overrides land
+        with pytest.raises(OSError):
+            await settings_manager.update({"api_keys.openai_api_key": "sk-y", "prefs.c": 3})
+        assert OmegaConf.load(temp_config_dir / "config.overrides.yaml").prefs.c == 3
+
+    @pytest.mark.asyncio
+    async def test_batch_defers_writes(self, temp_config_dir, settings_manager):
+        """Test that writes inside batch() are flushed together on exit."""
+        overrides = temp_config_dir / "config.overrides.yaml"
+
+        async with settings_manager.batch():
+            await settings_manager.update({"a": 1})
+            await settings_manager.update({"b": 2})
+            assert not overrides.exists()
+
+        saved = OmegaConf.load(overrides)
+        assert saved.a == 1 and saved.b == 2
+        assert not list(temp_config_dir.glob(".*.tmp"))
+
+    @pytest.mark.asyncio
+    async def test_batch_only_defers_own_task(self, temp_config_dir, settings_manager):
+        """Test that another task's update is on disk while a batch is open."""
+        overrides = temp_config_dir / "config.overrides.yaml"
+        in_batch = asyncio.Event()
+        release = asyncio.Event()
+
+        async def batching():
+            async with settings_manager.batch():
+                await settings_manager.update({"batched": 1})
+                in_batch.set()
+                await release.wait()
+
+        task = asyncio.create_task(batching())
+        await in_batch.wait()
+
+        await asyncio.wait_for(settings_manager.update({"direct": 2}), timeout=2)
+        saved = OmegaConf.load(overrides)
+        assert saved.direct == 2
+        assert "batched" not in saved
+
+        release.set()
+        await task
+        saved = OmegaConf.load(overrides)
+        assert saved.batched == 1 and saved.direct == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_flushes_when_body_raises(self, temp_config_dir, settings_manager):
+        """Test that writes queued before an exception in batch() are persisted."""
+        with pytest.raises(RuntimeError):
+            async with settings_manager.batch():
+                await settings_manager.update({"x": 1})
+                raise RuntimeError("boom")
+
+        assert OmegaConf.load(temp_config_dir / "config.overrides.yaml").x == 1
+        assert settings_manager._pending_writes == {}
+
     @pytest.mark.asyncio
     async def test_update_with_dot_notation(self, temp_config_dir, settings_manager):
         """Test updating with dot notation keys."""
@@ -230,25 +337,85 @@ database:
         assert OmegaConf.select(config, "key2") == "value2"
 
     @pytest.mark.asyncio
-    async def test_update_invalidates_cache(self, temp_config_dir, settings_manager):
-        """Test that update invalidates cache."""
-        # Load to populate cache
-        await settings_manager.load_config()
-        assert settings_manager._cache is not None
+    async def test_update_swaps_in_new_config(self, temp_config_dir, settings_manager):
+        """Test that update replaces the cached config instead of dropping it."""
+        config1 = await settings_manager.load_config()
 
-        # Update should invalidate cache
         await settings_manager.update({"key": "value"})
-        assert settings_manager._cache is None
+
+        # New tree built by the writer; readers of the old one are unaffected
+        config2 = settings_manager._state.config
+        assert config2 is not config1
+        assert OmegaConf.select(config2, "key") == "value"
+        assert OmegaConf.select(config1, "key") is None
+        assert OmegaConf.is_readonly(config2)
 
     @pytest.mark.asyncio
-    async def test_cache_ttl(self, temp_config_dir, settings_manager):
-        """Test that cache respects TTL."""
+    async def test_reload_is_single_flight(self, temp_config_dir, settings_manager):
+        """Test that concurrent readers of a stale config share one reload."""
+        import threading
         import time
 
+        defaults = temp_config_dir / "config.defaults.yaml"
+        defaults.write_text("key: value1")
+        await settings_manager.load_config()
+        settings_manager.stat_interval = 0
+
+        merges = []
+        original_merge = settings_manager._merge_sources
+
+        def slow_merge():
+            merges.append(1)
+            time.sleep(0.05)
+            return original_merge()
+
+        settings_manager._merge_sources = slow_merge
+        defaults.write_text("key: value2 changed")
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(settings_manager.get_sync("key")))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == ["value2 changed"] * 8
+        assert len(merges) == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_reused_until_file_changes(self, temp_config_dir, settings_manager):
+        """Test that the cache is reused while files are unchanged on disk."""
+        import os
+
+        defaults = temp_config_dir / "config.defaults.yaml"
+        defaults.write_text("key: value1")
+        # Age the file so it is outside the racy window
+        os.utime(defaults, (1_000_000, 1_000_000))
+
+        config1 = await settings_manager.load_config()
+        assert OmegaConf.select(config1, "key") == "value1"
+        generation = settings_manager.generation
+
+        # Unchanged files - same cached object, no reload
+        settings_manager.stat_interval = 0
+        assert await settings_manager.load_config() is config1
+        assert settings_manager.generation == generation
+
+        # Modify file - picked up on next read
+        defaults.write_text("key: value2")
+        config2 = await settings_manager.load_config()
+        assert OmegaConf.select(config2, "key") == "value2"
+        assert settings_manager.generation > generation
+
+    @pytest.mark.asyncio
+    async def test_cache_stat_interval(self, temp_config_dir, settings_manager):
+        """Test that file stats are only checked once per stat_interval."""
         defaults = temp_config_dir / "config.defaults.yaml"
         defaults.write_text("key: value1")
 
-        # First load
         config1 = await settings_manager.load_config()
         assert OmegaConf.select(config1, "key") == "value1"
 
@@ -256,7 +423,7 @@ database:
         defaults.write_text("key: value2")
 
         # Load again immediately - should use cache
-        settings_manager.cache_ttl = 5  # 5 seconds
+        settings_manager.stat_interval = 5  # 5 seconds
         config2 = await settings_manager.load_config()
         assert OmegaConf.select(config2, "key") == "value1"  # Still cached
 
@@ -264,6 +431,133 @@ database:
         config3 = await settings_manager.load_config(use_cache=False)
         assert OmegaConf.select(config3, "key") == "value2"  # Fresh load
 
+    @pytest.mark.asyncio
+    async def test_snapshot_is_resolved_and_read_only(self, temp_config_dir, settings_manager):
+        """Test that snapshots resolve interpolations and can't be modified."""
+        (temp_config_dir / "config.defaults.yaml").write_text("""
+api_keys:
+  openai: sk-test
+llm:
+  api_key: ${api_keys.openai}
+  models: [a, b]
+""")
+        snapshot = await settings_manager.snapshot()
+
+        assert snapshot.get("llm.api_key") == "sk-test"
+        assert snapshot.get("llm.models.1") == "b"
+        assert snapshot.get("llm.missing", "fallback") == "fallback"
+        with pytest.raises(TypeError):
+            snapshot.get("llm")["api_key"] = "changed"
+
+        # Reused until the generation changes
+        assert await settings_manager.snapshot() is snapshot
+        await settings_manager.update({"llm": {"model": "gpt"}})
+        assert (await settings_manager.snapshot()).get("llm.model") == "gpt"
+
+    @pytest.mark.asyncio
+    async def test_get_many(self, temp_config_dir, settings_manager):
+        """Test batched reads match individual get() calls."""
+        (temp_config_dir / "config.defaults.yaml").write_text("a: 1\nb:\n  c: two\n")
+
+        values = await settings_manager.get_many(["a", "b.c", "missing"], default="d")
+
+        assert values == {"a": 1, "b.c": "two", "missing": "d"}
+        for path, value in values.items():
+            assert await settings_manager.get(path, "d") == value
+
+    @pytest.mark.asyncio
+    async def test_subscribe_notifies_changed_paths(self, temp_config_dir, settings_manager):
+        """Test that subscribers get the changed paths under their prefix."""
+        defaults = temp_config_dir / "config.defaults.yaml"
+        defaults.write_text("security:\n  cors_origins: http://a\nother: 1\n")
+        await settings_manager.load_config()
+
+        changes = []
+        unsubscribe = settings_manager.subscribe("security", changes.append)
+
+        await settings_manager.update({"security": {"cors_origins": "http://b"}})
+        assert changes == [{"security.cors_origins"}]
+
+        # Unrelated write - not notified
+        await settings_manager.update({"other": 2})
+        assert len(changes) == 1
+
+        # External file edit - notified on the next read
+        settings_manager.stat_interval = 0
+        defaults.write_text("security:\n  cors_origins: http://a\n  debug: true\n")
+        await settings_manager.load_config()
+        assert changes[-1] == {"security.debug"}
+
+        unsubscribe()
+        await settings_manager.update({"security": {"cors_origins": "http://c"}})
+        assert len(changes) == 2
+
+    @pytest.mark.asyncio
+    async def test_subscribe_change_seen_off_loop(self, temp_config_dir, settings_manager):
+        """Test that a change noticed on a worker thread reaches an async subscriber."""
+        defaults = temp_config_dir / "config.defaults.yaml"
+        defaults.write_text("security:\n  cors_origins: http://a\n")
+        await settings_manager.load_config()
+
+        loop = asyncio.get_running_loop()
+        notified = asyncio.Event()
+        changes = []
+
+        async def on_change(paths):
+            assert asyncio.get_running_loop() is loop
+            changes.append(paths)
+            notified.set()
+
+        settings_manager.subscribe("security", on_change)
+
+        # Noticed by a sync read, as from a Docker executor worker
+        settings_manager.stat_interval = 0
+        defaults.write_text("security:\n  cors_origins: http://b\n")
+        await asyncio.to_thread(settings_manager.get_sync, "security.cors_origins")
+
+        await asyncio.wait_for(notified.wait(), timeout=5)
+        assert changes == [{"security.cors_origins"}]
+
+    @pytest.mark.asyncio
+    async def test_compiled_cache_reused_across_instances(self, temp_config_dir, monkeypatch):
+        """Test that a new store loads the compiled sources until one changes."""
+        defaults = temp_config_dir / "config.defaults.yaml"
+        defaults.write_text("key: value1")
+        await SettingsStore(config_dir=temp_config_dir).load_config()
+
+        cache_file = temp_config_dir / ".cache" / "settings.json"
+        assert cache_file.exists()
+        assert cache_file.stat().st_mode & 0o077 == 0
+        assert cache_file.parent.stat().st_mode & 0o077 == 0
+
+        # Unchanged sources - no YAML parsing on the next start
+        store = SettingsStore(config_dir=temp_config_dir)
+        with monkeypatch.context() as m:
+            m.setattr(store, "_parse_source", lambda *args: pytest.fail("re-parsed YAML"))
+            config = await store.load_config()
+        assert OmegaConf.select(config, "key") == "value1"
+
+        # Changed content - parsed again
+        defaults.write_text("key: value2")
+        config = await SettingsStore(config_dir=temp_config_dir).load_config()
+        assert OmegaConf.select(config, "key") == "value2"
+
+    @pytest.mark.asyncio
+    async def test_compiled_cache_excludes_secrets(self, temp_config_dir):
+        """Test that secrets are merged from source but never written to the cache."""
+        (temp_config_dir / "config.defaults.yaml").write_text("api_keys:\n  openai_api_key: ''\n")
+        secrets = temp_config_dir / "secrets.yaml"
+        secrets.write_text("api_keys:\n  openai_api_key: sk-cached-nowhere\n")
+
+        config = await SettingsStore(config_dir=temp_config_dir).load_config()
+        assert OmegaConf.select(config, "api_keys.openai_api_key") == "sk-cached-nowhere"
+        assert "sk-cached-nowhere" not in (temp_config_dir / ".cache" / "settings.json").read_text()
+
+        # A cache hit still picks up the current secrets
+        secrets.write_text("api_keys:\n  openai_api_key: sk-rotated\n")
+        config = await SettingsStore(config_dir=temp_config_dir).load_config()
+        assert OmegaConf.select(config, "api_keys.openai_api_key") == "sk-rotated"
+
     @pytest.mark.asyncio
     async def test_load_handles_invalid_yaml(self, temp_config_dir, settings_manager):
         """Test that invalid YAML files are handled gracefully."""
@@ -665,6 +959,23 @@ api_keys:
         paths = [s.path for s in suggestions]
         assert "api_keys.openai_api_key" in paths
 
+    @pytest.mark.asyncio
+    async def test_suggestions_memoized_per_generation(self, temp_config_dir):
+        """Test that suggestion candidates are reused until settings change."""
+        manager = SettingsStore(config_dir=temp_config_dir)
+        await manager.update({"api_keys": {"openai_api_key": "sk-test123"}})
+
+        first = await manager.get_suggestions_for_env_var("OPENAI_API_KEY")
+        engine = manager._suggestion_engine
+        second = await manager.get_suggestions_for_env_var("ANTHROPIC_API_KEY")
+        assert manager._suggestion_engine is engine
+        assert [s.path for s in first] == [s.path for s in second]
+
+        await manager.update({"api_keys": {"anthropic_api_key": "sk-ant"}})
+        third = await manager.get_suggestions_for_env_var("ANTHROPIC_API_KEY")
+        assert manager._suggestion_engine is not engine
+        assert "api_keys.anthropic_api_key" in [s.path for s in third]
+
     @pytest.mark.asyncio
     async def test_save_env_var_values(self, temp_config_dir):
         """Test saving env var values to config."""
@@ -703,6 +1014,72 @@ api_keys:
         assert OmegaConf.select(config, "api_keys.openai_api_key") == "sk-real-key"
         assert OmegaConf.select(config, "api_keys.anthropic_key") is None
 
+    @pytest.mark.asyncio
+    async def test_resolve_env_values_batched(self, temp_config_dir):
+        """Test batched env resolution matches per-var resolution."""
+        (temp_config_dir / "config.defaults.yaml").write_text(
+            "api_keys:\n  openai_api_key: sk-test\n"
+        )
+        manager = SettingsStore(config_dir=temp_config_dir)
+
+        specs = [
+            {"name": "OPENAI_KEY", "source": "setting", "setting_path": "api_keys.openai_api_key"},
+            {"name": "MODE", "source": "literal", "literal_value": "fast"},
+        ]
+        values = await manager.resolve_env_values(specs)
+
+        assert values == {"OPENAI_KEY": "sk-test", "MODE": "fast"}
+        assert values["OPENAI_KEY"] == await manager.resolve_env_value(
+            "setting", "api_keys.openai_api_key", None, None
+        )
+
+    @pytest.mark.asyncio
+    async def test_env_var_index_matches_resolver(self, temp_config_dir):
+        """Test that indexed env var lookups agree with the config tree search."""
+        from config.omegaconf_settings import _env_resolver
+
+        (temp_config_dir / "config.defaults.yaml").write_text("""
+transcription:
+  provider: deepgram
+infrastructure:
+  memory_server_url: http://mem0:8765
+  empty: null
+api_keys:
+  provider: ignored
+""")
+        manager = SettingsStore(config_dir=temp_config_dir)
+        config = await manager.load_config()
+
+        for name in ["TRANSCRIPTION_PROVIDER", "MEMORY_SERVER_URL", "PROVIDER", "EMPTY", "MISSING_VAR"]:
+            assert await manager.get_by_env_var(name) == _env_resolver(name, config)
+
+    @pytest.mark.asyncio
+    async def test_env_var_index_rebuilt_per_generation(self, temp_config_dir):
+        """Test that the env var index is reused until settings change."""
+        manager = SettingsStore(config_dir=temp_config_dir)
+        await manager.update({"infrastructure": {"memory_server_url": "http://a"}})
+
+        assert await manager.get_by_env_var("MEMORY_SERVER_URL") == "http://a"
+        index = manager._env_index
+        assert await manager.get_by_env_var("MEMORY_SERVER_URL") == "http://a"
+        assert manager._env_index is index
+
+        await manager.update({"infrastructure": {"memory_server_url": "http://b"}})
+        assert await manager.get_by_env_var("MEMORY_SERVER_URL") == "http://b"
+        assert manager._env_index is not index
+
+    @pytest.mark.asyncio
+    async def test_update_bumps_generation(self, temp_config_dir):
+        """Test that writes bump the settings generation."""
+        manager = SettingsStore(config_dir=temp_config_dir)
+        await manager.load_config()
+        generation = manager.generation
+
+        await manager.update({"key": "value"})
+        await manager.load_config()
+
+        assert manager.generation > generation
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
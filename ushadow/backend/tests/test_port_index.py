@@ -0,0 +1,152 @@
+"""
+Tests for the port occupancy index and allocator.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import services.port_index as port_index
+from services.container_cache import ContainerState
+from services.port_index import PortAllocator, PortIndex, read_listening_ports
+
+
+def container(name, ports, status="running"):
+    """Container publishing the given host ports."""
+    return ContainerState(
+        id=name * 4,
+        name=name,
+        status=status,
+        health=None,
+        image=None,
+        created=None,
+        ports={f"{8000 + i}/tcp": str(port) for i, port in enumerate(ports)},
+    )
+
+
+class FakeClock:
+    """Stand-in for the time module with a manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(port_index, "time", clock)
+    return clock
+
+
+class TestReadListeningPorts:
+    """Tests for parsing /proc/net/tcp."""
+
+    def test_only_listening_sockets(self, tmp_path):
+        """Test that only LISTEN (0A) entries are returned."""
+        tcp = tmp_path / "tcp"
+        tcp.write_text(
+            "  sl  local_address rem_address   st\n"
+            "   0: 00000000:1F90 00000000:0000 0A\n"      # 8080 LISTEN
+            "   1: 0100007F:0CEA 0100007F:9C40 01\n"      # 3306 ESTABLISHED
+        )
+        tcp6 = tmp_path / "tcp6"
+        tcp6.write_text(
+            "  sl  local_address rem_address   st\n"
+            "   0: 00000000000000000000000000000000:1A0B 00000000000000000000000000000000:0000 0A\n"
+        )
+
+        assert read_listening_ports([tcp, tcp6]) == {8080, 6667}
+
+    def test_none_without_proc(self, tmp_path):
+        """Test that a missing /proc means "unknown", not "no ports"."""
+        assert read_listening_ports([tmp_path / "missing"]) is None
+
+
+class TestPortIndex:
+    """Tests for port ownership and the bisect free-port search."""
+
+    def test_owner(self):
+        """Test container, host-process and free ports."""
+        index = PortIndex.build(
+            [container("ushadow-backend", [8000]), container("stopped", [9000], status="exited")],
+            host_ports={8000, 5432},
+        )
+
+        assert index.owner(8000) == "Docker: ushadow-backend"
+        assert index.owner(8000, exclude_container="backend") is None
+        assert index.owner(5432) == "host process"
+        assert index.owner(9000) is None
+        assert not index.is_taken(9000)
+
+    def test_next_free_skips_taken_run(self):
+        """Test that the search skips a run of taken ports above start."""
+        index = PortIndex.build([container("a", [8080, 8081])], host_ports={8082, 8084})
+
+        assert index.next_free(8080) == 8083
+        assert index.next_free(8083) == 8083
+        assert index.next_free(8079) == 8079
+        assert index.next_free(8080, skip={8083}) == 8085
+
+    def test_next_free_window_exhausted(self):
+        """Test that None is returned when every port in the window is taken."""
+        index = PortIndex.build([], host_ports={8080, 8081, 8082})
+
+        assert index.next_free(8080, limit=3) is None
+        assert index.next_free(8080, limit=4) == 8083
+        assert index.next_free(65535, skip={65535}) is None
+
+
+class TestPortAllocator:
+    """Tests for index reuse and reservation expiry."""
+
+    def test_reservations_not_suggested_twice(self, clock, monkeypatch):
+        """Test that concurrent suggestions get different ports."""
+        monkeypatch.setattr(port_index, "read_listening_ports", lambda: {8080})
+        allocator = PortAllocator(lambda: [])
+
+        assert allocator.reserve_next_free(8080) == 8081
+        assert allocator.reserve_next_free(8080) == 8082
+
+        allocator.release(8081)
+        assert allocator.reserve_next_free(8080) == 8081
+
+    def test_reservations_expire(self, clock, monkeypatch):
+        """Test that a reservation stops blocking the port after its TTL."""
+        monkeypatch.setattr(port_index, "read_listening_ports", lambda: set())
+        allocator = PortAllocator(lambda: [], reservation_ttl=60.0)
+
+        allocator.reserve(8080)
+        assert allocator.reserve_next_free(8080) == 8081
+
+        clock.now += 61.0
+        assert allocator.reserve_next_free(8080) == 8080
+
+    def test_index_reused_until_refresh_interval(self, clock, monkeypatch):
+        """Test that the index is rebuilt only after refresh_interval or invalidate()."""
+        monkeypatch.setattr(port_index, "read_listening_ports", lambda: set())
+        builds = []
+
+        def containers():
+            builds.append(clock.now)
+            return [container("a", [8080])]
+
+        allocator = PortAllocator(containers, refresh_interval=2.0)
+        assert allocator.check(8080) == "Docker: a"
+        clock.now += 1.0
+        assert allocator.check(8080) == "Docker: a"
+        assert len(builds) == 1
+
+        clock.now += 1.5
+        allocator.check(8080)
+        assert len(builds) == 2
+
+        allocator.invalidate()
+        allocator.check(8080)
+        assert len(builds) == 3
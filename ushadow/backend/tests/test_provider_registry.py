@@ -0,0 +1,184 @@
+"""
+Tests for the provider registry.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import services.provider_registry as provider_registry
+from services.provider_registry import ProviderRegistry
+
+
+@pytest.fixture
+def config_dir(tmp_path, monkeypatch):
+    """Temporary config directory with capabilities and two provider files."""
+    (tmp_path / "capabilities.yaml").write_text("""
+capabilities:
+  llm:
+    provides:
+      api_key:
+        type: secret
+      base_url:
+        type: url
+  memory:
+    provides:
+      server_url:
+        type: url
+""")
+    providers_dir = tmp_path / "providers"
+    providers_dir.mkdir()
+    (providers_dir / "llm.yaml").write_text("""
+capability: llm
+providers:
+  - id: openai
+    mode: cloud
+    credentials:
+      api_key:
+        env_var: OPENAI_API_KEY
+        settings_path: api_keys.openai_api_key
+      base_url:
+        env_var: OPENAI_BASE_URL
+        value: https://api.openai.com/v1
+  - id: azure-openai
+    mode: cloud
+    credentials:
+      api_key:
+        env_var: OPENAI_API_KEY
+        settings_path: api_keys.azure_api_key
+  - id: ollama
+    mode: local
+    credentials:
+      base_url:
+        env_var: OLLAMA_BASE_URL
+        settings_path: llm.ollama_url
+""")
+    (providers_dir / "memory.yaml").write_text("""
+capability: memory
+providers:
+  - id: openmemory
+    mode: local
+    credentials:
+      server_url:
+        env_var: MEMORY_SERVER_URL
+        settings_path: llm.ollama_url
+""")
+    monkeypatch.setattr(provider_registry, "CONFIG_DIR", tmp_path)
+    monkeypatch.setattr(provider_registry, "PROVIDERS_DIR", providers_dir)
+    monkeypatch.setattr(provider_registry, "CAPABILITIES_FILE", tmp_path / "capabilities.yaml")
+    return tmp_path
+
+
+@pytest.fixture
+def registry(config_dir, tmp_path):
+    """Registry whose compiled cache lives outside the config directory."""
+    return ProviderRegistry(cache_dir=tmp_path / "cache")
+
+
+class TestCompiledCache:
+    """Tests for caching the parsed providers."""
+
+    def test_cache_written_to_cache_dir(self, registry, config_dir, tmp_path):
+        """Test that the cache file goes to cache_dir, not CONFIG_DIR/.cache."""
+        assert registry.get_provider("openai") is not None
+
+        assert list((tmp_path / "cache").iterdir())
+        assert not (config_dir / ".cache").exists()
+
+    def test_fresh_registry_reuses_cache(self, registry, tmp_path, monkeypatch):
+        """Test that a new registry with the same cache_dir skips parsing."""
+        registry.get_providers()
+
+        fresh = ProviderRegistry(cache_dir=tmp_path / "cache")
+        parsed = []
+        monkeypatch.setattr(fresh, "_load_provider_file", parsed.append)
+
+        assert sorted(p.id for p in fresh.get_providers()) == [
+            "azure-openai", "ollama", "openai", "openmemory",
+        ]
+        assert parsed == []
+        assert fresh.get_providers() == registry.get_providers()
+        assert fresh.get_providers_for_capability("llm") == registry.get_providers_for_capability("llm")
+
+    def test_cache_is_plain_json(self, registry, tmp_path):
+        """Test that the cache holds data only, never pickled objects."""
+        registry.get_providers()
+
+        stored = json.loads((tmp_path / "cache" / "providers.json").read_text())
+        assert sorted(p["id"] for p in stored["payload"]["providers"]) == [
+            "azure-openai", "ollama", "openai", "openmemory",
+        ]
+
+
+class TestCatalogIndexes:
+    """Tests for lookups served from the per-load indexes."""
+
+    def test_settings_paths_for_env_var(self, registry):
+        """Test that every provider's path for an env var is kept, in load order."""
+        assert registry.get_settings_paths_for_env_var("OPENAI_API_KEY") == (
+            "api_keys.openai_api_key", "api_keys.azure_api_key",
+        )
+        assert registry.get_settings_paths_for_env_var("OLLAMA_BASE_URL") == ("llm.ollama_url",)
+        # Literal values have no settings path
+        assert registry.get_settings_paths_for_env_var("OPENAI_BASE_URL") == ()
+        assert registry.get_settings_paths_for_env_var("MISSING") == ()
+
+    def test_providers_for_setting(self, registry):
+        """Test reverse lookup from a settings path, across capabilities."""
+        assert [p.id for p in registry.get_providers_for_setting("llm.ollama_url")] == [
+            "ollama", "openmemory",
+        ]
+        assert [p.id for p in registry.get_providers_for_setting("api_keys.azure_api_key")] == [
+            "azure-openai",
+        ]
+        assert registry.get_providers_for_setting("missing.path") == ()
+
+    def test_find_providers(self, registry):
+        """Test filtering by capability, mode and both."""
+        assert [p.id for p in registry.find_providers(capability="llm", mode="cloud")] == [
+            "openai", "azure-openai",
+        ]
+        assert [p.id for p in registry.find_providers(capability="llm", mode="local")] == ["ollama"]
+        assert registry.find_providers(capability="memory", mode="cloud") == []
+        assert [p.id for p in registry.find_providers(capability="llm")] == [
+            "openai", "azure-openai", "ollama",
+        ]
+        assert sorted(p.id for p in registry.find_providers(mode="local")) == ["ollama", "openmemory"]
+        assert registry.get_providers_by_mode("llm", "local") == registry.find_providers("llm", "local")
+
+    def test_env_to_settings_mapping_is_read_only(self, registry):
+        """Test that the shared mapping can't be mutated by callers."""
+        mapping = registry.get_env_to_settings_mapping()
+
+        # Last provider loaded wins
+        assert mapping["OPENAI_API_KEY"] == "api_keys.azure_api_key"
+        assert mapping["MEMORY_SERVER_URL"] == "llm.ollama_url"
+        assert "OPENAI_BASE_URL" not in mapping
+        with pytest.raises(TypeError):
+            mapping["OPENAI_API_KEY"] = "hijacked"
+        assert registry.get_env_to_settings_mapping() is mapping
+
+    def test_indexes_rebuilt_on_refresh(self, registry, config_dir):
+        """Test that lookups follow a reload of the provider files."""
+        assert registry.get_settings_paths_for_env_var("OLLAMA_BASE_URL") == ("llm.ollama_url",)
+
+        (config_dir / "providers" / "llm.yaml").write_text("""
+capability: llm
+providers:
+  - id: ollama
+    mode: local
+    credentials:
+      base_url:
+        env_var: OLLAMA_BASE_URL
+        settings_path: llm.local_url
+""")
+        registry.refresh()
+
+        assert registry.get_settings_paths_for_env_var("OLLAMA_BASE_URL") == ("llm.local_url",)
+        assert registry.get_settings_paths_for_env_var("OPENAI_API_KEY") == ()
+        assert [p.id for p in registry.get_providers_for_setting("llm.ollama_url")] == ["openmemory"]
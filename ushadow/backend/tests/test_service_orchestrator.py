@@ -0,0 +1,193 @@
+"""
+Tests for the service orchestrator's lifecycle operations.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import services.service_orchestrator as service_orchestrator
+from services.service_orchestrator import ServiceOrchestrator
+
+
+class FakeDocker:
+    """Stands in for DockerManager.aio, recording lifecycle calls."""
+
+    def __init__(self):
+        self.calls = []
+        self.infra_result = (True, "infra started")
+        self.active = 0
+        self.max_active = 0
+
+    async def _act(self, action, name):
+        self.calls.append((action, name))
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return True, f"{name} {action}ed"
+
+    async def start_service(self, name, progress=None, start_infra=True):
+        assert not start_infra, "bulk start must not start infra per service"
+        return await self._act("start", name)
+
+    async def stop_service(self, name):
+        return await self._act("stop", name)
+
+    async def restart_service(self, name):
+        return await self._act("restart", name)
+
+    async def start_infra_services(self, services):
+        self.calls.append(("infra", tuple(services)))
+        return self.infra_result
+
+
+@pytest.fixture
+def docker():
+    return FakeDocker()
+
+
+@pytest.fixture
+def orchestrator(docker, monkeypatch):
+    """Orchestrator wired to the fake Docker layer, counting route regenerations."""
+    orchestrator = ServiceOrchestrator()
+    orchestrator._docker_manager = SimpleNamespace(aio=docker)
+    infra = {"chronicle": ["mongo", "redis"], "openmemory": ["qdrant", "mongo"]}
+    orchestrator._compose_registry = SimpleNamespace(
+        get_service_by_name=lambda name: SimpleNamespace(infra_services=infra.get(name, []))
+    )
+    monkeypatch.setattr(service_orchestrator, "get_docker_executor", lambda: SimpleNamespace(max_workers=2))
+    orchestrator.route_regenerations = 0
+
+    async def regenerate_routes():
+        orchestrator.route_regenerations += 1
+
+    monkeypatch.setattr(orchestrator, "_regenerate_tailscale_routes", regenerate_routes)
+    return orchestrator
+
+
+async def collect(events):
+    return [event async for event in events]
+
+
+class TestStartServiceStream:
+    """Tests for streaming start progress as SSE events."""
+
+    @pytest.mark.asyncio
+    async def test_progress_then_result(self, orchestrator, docker):
+        """Test that lines are yielded as they arrive, followed by one result."""
+        async def start_service(name, progress=None, start_infra=True):
+            progress("Pulling image")
+            await asyncio.sleep(0.01)
+            progress("Creating container")
+            await asyncio.sleep(0.01)
+            return True, "started"
+
+        docker.start_service = start_service
+
+        events = await collect(orchestrator.start_service_stream("chronicle"))
+
+        assert events == [
+            {"event": "progress", "data": "Pulling image"},
+            {"event": "progress", "data": "Creating container"},
+            {"event": "result", "data": {"success": True, "message": "started"}},
+        ]
+        assert orchestrator.route_regenerations == 1
+
+    @pytest.mark.asyncio
+    async def test_drains_lines_queued_at_completion(self, orchestrator, docker):
+        """Test that lines emitted right before the start finishes are not lost."""
+        async def start_service(name, progress=None, start_infra=True):
+            await asyncio.sleep(0.01)
+            # No await between these and completion
+            for i in range(5):
+                progress(f"line {i}")
+            return False, "exited"
+
+        docker.start_service = start_service
+
+        events = await collect(orchestrator.start_service_stream("chronicle"))
+
+        assert [e["data"] for e in events[:-1]] == [f"line {i}" for i in range(5)]
+        assert events[-1] == {"event": "result", "data": {"success": False, "message": "exited"}}
+        assert [e["event"] for e in events].count("result") == 1
+
+    @pytest.mark.asyncio
+    async def test_error_becomes_failed_result(self, orchestrator, docker):
+        """Test that an exception from the start is reported as the final result."""
+        async def start_service(name, progress=None, start_infra=True):
+            progress("Pulling image")
+            raise RuntimeError("daemon gone")
+
+        docker.start_service = start_service
+
+        events = await collect(orchestrator.start_service_stream("chronicle"))
+
+        assert events == [
+            {"event": "progress", "data": "Pulling image"},
+            {"event": "result", "data": {"success": False, "message": "Failed to start service"}},
+        ]
+
+
+class TestBulkAction:
+    """Tests for bulk start/stop/restart."""
+
+    @pytest.mark.asyncio
+    async def test_start_runs_infra_union_once(self, orchestrator, docker):
+        """Test that shared infra is started once, before any service."""
+        result = await orchestrator.bulk_action(["chronicle", "openmemory", "web"], "start")
+
+        assert result["success"] is True
+        assert docker.calls[0] == ("infra", ("mongo", "redis", "qdrant"))
+        assert [c for c in docker.calls if c[0] == "infra"] == [docker.calls[0]]
+        assert sorted(c[1] for c in docker.calls[1:]) == ["chronicle", "openmemory", "web"]
+
+    @pytest.mark.asyncio
+    async def test_duplicates_removed(self, orchestrator, docker):
+        """Test that a service listed twice is acted on once."""
+        result = await orchestrator.bulk_action(["web", "api", "web"], "stop")
+
+        assert list(result["results"]) == ["web", "api"]
+        assert sorted(docker.calls) == [("stop", "api"), ("stop", "web")]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_capped_at_executor_workers(self, orchestrator, docker):
+        """Test that no more services run at once than the executor has workers."""
+        await orchestrator.bulk_action([f"svc{i}" for i in range(8)], "restart", concurrency=10)
+
+        assert docker.max_active == 2
+        assert len(docker.calls) == 8
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("action, regenerations", [("start", 1), ("stop", 1), ("restart", 0)])
+    async def test_routes_regenerated_once_per_batch(self, orchestrator, action, regenerations):
+        """Test that routes are regenerated once for the batch, not per service."""
+        await orchestrator.bulk_action(["web", "api", "worker"], action)
+
+        assert orchestrator.route_regenerations == regenerations
+
+    @pytest.mark.asyncio
+    async def test_infra_failure_fails_every_service(self, orchestrator, docker):
+        """Test that a failed infra start is reported for each service and nothing starts."""
+        docker.infra_result = (False, "mongo failed to start")
+
+        result = await orchestrator.bulk_action(["chronicle", "web"], "start")
+
+        assert result["success"] is False
+        assert result["results"] == {
+            "chronicle": {"success": False, "message": "mongo failed to start"},
+            "web": {"success": False, "message": "mongo failed to start"},
+        }
+        assert [c[0] for c in docker.calls] == ["infra"]
+        assert orchestrator.route_regenerations == 0
+
+    @pytest.mark.asyncio
+    async def test_unknown_action(self, orchestrator):
+        with pytest.raises(ValueError, match="Unknown action 'pause'"):
+            await orchestrator.bulk_action(["web"], "pause")
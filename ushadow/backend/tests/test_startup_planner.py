@@ -0,0 +1,150 @@
+"""
+Tests for the dependency-aware startup planner.
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from services.docker_manager import ServiceCatalog
+from services.startup_planner import NODE_INFRA, StartupNode, StartupPlanner
+
+
+def nodes(**depends_on):
+    """Service nodes keyed by name, e.g. nodes(a=[], b=["a"])."""
+    return {
+        key: StartupNode(key=key, name=key, kind="service", depends_on=set(deps))
+        for key, deps in depends_on.items()
+    }
+
+
+class TestTopologicalLevels:
+    """Tests for grouping the DAG into concurrently startable levels."""
+
+    def test_levels(self):
+        """Test that each level only depends on earlier levels."""
+        levels = StartupPlanner._topological_levels(nodes(
+            app=["api", "worker"],
+            api=["db", "cache"],
+            worker=["db"],
+            db=[],
+            cache=[],
+        ))
+
+        assert levels == [["cache", "db"], ["api", "worker"], ["app"]]
+
+    def test_independent_nodes_share_a_level(self):
+        """Test that unrelated nodes all start in the first level."""
+        assert StartupPlanner._topological_levels(nodes(b=[], a=[], c=[])) == [["a", "b", "c"]]
+        assert StartupPlanner._topological_levels({}) == []
+
+    def test_cycle(self):
+        """Test that a cycle is reported with the nodes that can't be ordered."""
+        with pytest.raises(ValueError, match="cycle between: a, b, c"):
+            StartupPlanner._topological_levels(nodes(root=[], a=["root", "c"], b=["a"], c=["b"]))
+
+    def test_self_dependency_is_a_cycle(self):
+        with pytest.raises(ValueError, match="cycle between: a"):
+            StartupPlanner._topological_levels(nodes(a=["a"]))
+
+    def test_missing_dependency(self):
+        """Test that a dependency outside the plan is reported, not mistaken for a cycle."""
+        with pytest.raises(ValueError, match="api depends on unknown nodes: db"):
+            StartupPlanner._topological_levels(nodes(api=["db"], app=["api"]))
+
+
+class FakeRegistry:
+    def __init__(self, services):
+        self._services = services
+
+    def get_service_by_name(self, name):
+        return self._services.get(name)
+
+    def get_services_providing(self, capability):
+        return [s for s in self._services.values() if s.provides == capability]
+
+
+class FakeResolver:
+    def __init__(self, providers=None):
+        self._providers = providers or {}
+
+    async def get_selected_provider(self, capability):
+        return self._providers.get(capability)
+
+
+def discovered(name, infra=(), depends_on=(), requires=(), provides=None):
+    return SimpleNamespace(
+        service_name=name,
+        infra_services=list(infra),
+        depends_on=list(depends_on),
+        requires=list(requires),
+        provides=provides,
+    )
+
+
+class TestBuildPlan:
+    """Tests for building the DAG from compose metadata."""
+
+    @pytest.mark.asyncio
+    async def test_plan_from_infra_depends_on_and_providers(self):
+        """Test infra, depends_on and in-set capability providers become edges."""
+        services = {
+            "chronicle": discovered("chronicle", infra=["mongo"], depends_on=["worker"], requires=["memory"]),
+            "worker": discovered("worker", infra=["mongo", "redis"]),
+            "mem0": discovered("mem0", infra=["qdrant"], provides="memory"),
+        }
+        planner = StartupPlanner(
+            compose_registry=FakeRegistry(services),
+            docker_manager=SimpleNamespace(MANAGEABLE_SERVICES=ServiceCatalog({name: {} for name in services})),
+            capability_resolver=FakeResolver(),
+        )
+
+        plan = await planner.build_plan(["chronicle", "mem0"])
+
+        assert plan.levels == [
+            ["infra:mongo", "infra:qdrant", "infra:redis"],
+            ["mem0", "worker"],
+            ["chronicle"],
+        ]
+        assert plan.nodes["infra:mongo"].kind == NODE_INFRA
+        assert plan.nodes["worker"].reason == "depends_on"
+        assert plan.nodes["chronicle"].depends_on == {"infra:mongo", "worker", "mem0"}
+
+    @pytest.mark.asyncio
+    async def test_selected_local_provider_by_docker_name(self):
+        """Test that a local provider's docker service maps to its catalog key."""
+        services = {
+            "chronicle": discovered("chronicle", requires=["memory", "llm"]),
+            "openmemory": discovered("mem0"),
+        }
+        catalog = ServiceCatalog({
+            "chronicle": {},
+            "openmemory": {"docker_service_name": "mem0"},
+        })
+        local = SimpleNamespace(mode="local", docker=SimpleNamespace(service_name="mem0"))
+        cloud = SimpleNamespace(mode="cloud", docker=None)
+        planner = StartupPlanner(
+            compose_registry=FakeRegistry(services),
+            docker_manager=SimpleNamespace(MANAGEABLE_SERVICES=catalog),
+            capability_resolver=FakeResolver({"memory": local, "llm": cloud}),
+        )
+
+        plan = await planner.build_plan(["chronicle"])
+
+        assert plan.levels == [["openmemory"], ["chronicle"]]
+        assert plan.nodes["openmemory"].reason == "provider"
+
+    @pytest.mark.asyncio
+    async def test_unknown_service(self):
+        planner = StartupPlanner(
+            compose_registry=FakeRegistry({}),
+            docker_manager=SimpleNamespace(MANAGEABLE_SERVICES=ServiceCatalog({})),
+            capability_resolver=FakeResolver(),
+        )
+        with pytest.raises(ValueError, match="Unknown services: nope"):
+            await planner.build_plan(["nope"])